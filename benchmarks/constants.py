@@ -0,0 +1,73 @@
+"""Measure what value tables save on constant and enum pages.
+
+Usage:
+
+    python benchmarks/constants.py [NAMESPACE-VERSION]
+
+Renders the constants page and the enum pages of a library with every
+value as its own ``.. data::`` or ``.. attribute::`` directive, and with
+the undocumented values in one value table, and builds both with Sphinx.
+Defaults to Gdk-4.0.
+"""
+
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sphinx.application import Sphinx
+
+from pygobject_docs.category import Category
+from pygobject_docs.generate import generate_classes, generate_constants
+from pygobject_docs.model import ModelWriter, read_model
+from pygobject_docs.render import render_to_file
+
+DIRECTIVE = re.compile(r"^\s*\.\. [\w:-]+::", re.MULTILINE)
+
+
+def render(pages, source, compact):
+    source.mkdir(parents=True)
+    (source / "conf.py").write_text('extensions = ["pygobject_docs.directives"]\n')
+    names = "\n".join(f"   {Path(page.page).stem}" for page in pages)
+    (source / "index.rst").write_text(f"Index\n=====\n\n.. toctree::\n\n{names}\n")
+    for page in pages:
+        render_to_file(
+            page.template, source / page.page, compact=compact, **page.arguments
+        )
+    text = "".join(path.read_text() for path in source.glob("*.rst"))
+    return len(DIRECTIVE.findall(text)), len(text.encode())
+
+
+def build(source, out_path):
+    start = time.perf_counter()
+    app = Sphinx(source, source, out_path, out_path / ".doctrees", "html", status=None)
+    app.build()
+    return time.perf_counter() - start
+
+
+def main(library="Gdk-4.0"):
+    namespace, version = library.split("-")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        with ModelWriter(tmp_path / "model.jsonl.gz") as model:
+            generate_constants(namespace, version, tmp_path, model=model)
+            generate_classes(namespace, version, tmp_path, Category.Enums, model=model)
+        pages = [
+            page
+            for page in read_model(tmp_path / "model.jsonl.gz")
+            if page.template in ("constants.j2", "class-detail.j2")
+        ]
+
+        print(f"{library}: {len(pages)} pages")
+        print(f"{'':<12} {'directives':>10} {'bytes':>10} {'build':>10}")
+        for label, compact in (("directives", False), ("value table", True)):
+            source = tmp_path / label.replace(" ", "-")
+            directives, size = render(pages, source, compact)
+            seconds = build(source, tmp_path / f"{source.name}-html")
+            print(f"{label:<12} {directives:>10} {size:>10} {seconds:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
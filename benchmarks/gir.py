@@ -0,0 +1,62 @@
+"""Compare the gi-docgen GIR parser with the slim reader.
+
+Usage:
+
+    python benchmarks/gir.py [NAMESPACE-VERSION ...]
+
+For each library, parse the GIR file and all files it includes, and report
+the time taken and the peak memory allocated while parsing. The slim
+reader is measured twice: parsing, and loading its cached index. Defaults
+to Gtk-4.0 and WebKit-6.0.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+from pygobject_docs import gir
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def report(label, seconds, peak):
+    print(f"{label:<30} {seconds:8.2f} s {peak / 2**20:10.1f} MiB")
+
+
+def main(*libraries):
+    # Start without cached slim indexes
+    os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp()
+
+    for lib in libraries or ("Gtk-4.0", "WebKit-6.0"):
+        gir_file = gir.find_gir_file(*lib.rsplit("-", 1))
+        if not gir_file:
+            print(f"{lib}: no GIR file found")
+            continue
+
+        gir._parse.cache_clear()
+
+        _, seconds, peak = measure(partial(gir.Gir, gir_file))
+        report(f"{lib}, gi-docgen", seconds, peak)
+
+        gir.read_slim.cache_clear()
+        _, seconds, peak = measure(partial(gir.SlimGir, gir_file))
+        report(f"{lib}, slim", seconds, peak)
+
+        gir.read_slim.cache_clear()
+        _, seconds, peak = measure(partial(gir.SlimGir, gir_file))
+        report(f"{lib}, slim, cached index", seconds, peak)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
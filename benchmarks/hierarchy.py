@@ -0,0 +1,81 @@
+"""Report what compact hierarchy lists save on class pages.
+
+Usage:
+
+    python benchmarks/hierarchy.py [--limit N] [NAMESPACE-VERSION ...]
+
+For the classes and interfaces of the given libraries, compare the
+subclass and implementation lists rendered in full with the compact
+lists of ``--hierarchy-limit N``. Sphinx resolves each ``:class:``
+reference separately, so the number of references is what resolving
+takes time on; the time itself is not measured. The hierarchy pages that
+take the full lists are reported as well. Defaults to GObject-2.0, Gio-2.0
+and Gtk-4.0.
+"""
+
+import argparse
+
+from pygobject_docs.hierarchy import INLINE_LIMIT, Hierarchy
+
+
+def references(names):
+    text = ", ".join(f":class:`~{name}`" for name in names)
+    return len(names), len(text.encode())
+
+
+def main(*libraries, limit=INLINE_LIMIT):
+    libraries = libraries or ("GObject-2.0", "Gio-2.0", "Gtk-4.0")
+    hierarchy = Hierarchy.build(libraries)
+
+    rows = []
+    moved = 0
+    for lib in libraries:
+        if lib not in hierarchy.libs:
+            continue
+        graph = hierarchy.library(lib, limit)
+        lib_index = hierarchy.libs.index(lib)
+        names = sorted(
+            name
+            for type_lib, name in zip(hierarchy.type_lib, hierarchy.type_names)
+            if type_lib == lib_index
+        )
+        moved += sum(
+            len(graph.tree(name)) + len(graph.implementations(name))
+            for name in graph.crowded()
+        )
+        for name in names:
+            full = [*graph.descendants(name), *graph.implementations(name)]
+            if not full:
+                continue
+            short = [
+                *graph.compact(graph.descendants(name))[0],
+                *graph.compact(graph.implementations(name))[0],
+            ]
+            rows.append((lib, name, references(full), references(short)))
+
+    rows.sort(key=lambda row: row[2][1] - row[3][1], reverse=True)
+    print(f"{'page':<40} {'references':>16} {'bytes':>20}")
+    for lib, name, (full_refs, full_bytes), (refs, size) in rows[:15]:
+        print(
+            f"{lib + ' ' + name:<40} {full_refs:>7} -> {refs:<6} "
+            f"{full_bytes:>9} -> {size:<8}"
+        )
+
+    full_refs = sum(row[2][0] for row in rows)
+    refs = sum(row[3][0] for row in rows)
+    full_bytes = sum(row[2][1] for row in rows)
+    size = sum(row[3][1] for row in rows)
+    print(f"{'total':<40} {full_refs:>7} -> {refs:<6} {full_bytes:>9} -> {size:<8}")
+    print(
+        f"Class pages: {full_refs - refs} fewer references, "
+        f"{(full_bytes - size) / 1024:.0f} KiB less page source"
+    )
+    print(f"Hierarchy pages: {moved} references, in the full transitive trees")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=INLINE_LIMIT)
+    parser.add_argument("libraries", nargs="*")
+    args = parser.parse_args()
+    main(*args.libraries, limit=args.limit)
@@ -0,0 +1,89 @@
+"""Measure template start-up and render time.
+
+Usage:
+
+    python benchmarks/templates.py [PAGES]
+
+Compares a fresh environment per page (the old behaviour), a fresh
+environment backed by the bytecode cache, and the long-lived environment.
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from pygobject_docs.render import create_environment, jinja_env
+
+
+def class_arguments(n_members=40):
+    def member(i):
+        return (
+            f"method_{i}",
+            "(self, value: int, name: str | None = None) -> bool",
+            f"Documentation for method {i}.\n\nWith a second paragraph.",
+            [("value", "A value."), ("name", "A name.")],
+            "True on success.",
+            False,
+            False,
+            None,
+            "1.0",
+        )
+
+    return {
+        "class_name": "Widget",
+        "class_signature": "(**properties: ~typing.Any)",
+        "namespace": "Gtk",
+        "version": "4.0",
+        "entity_type": "Class",
+        "doc": "The base class for all widgets.",
+        "deprecated": None,
+        "since": None,
+        "ancestors": ["gi.repository.GObject.InitiallyUnowned"],
+        "descendants": [f"gi.repository.Gtk.Child{i}" for i in range(n_members)],
+        "implements": ["gi.repository.Gtk.Accessible"],
+        "implementations": [],
+        "constructors": [],
+        "fields": [],
+        "methods": [member(i) for i in range(n_members)],
+        "properties": [],
+        "signals": [],
+        "virtual_methods": [],
+    }
+
+
+def report(label, seconds, pages):
+    print(f"{label:<40} {seconds * 1000 / pages:8.3f} ms/page")
+
+
+def main(pages=200):
+    arguments = class_arguments()
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        start_up = timeit.timeit(
+            lambda: create_environment().get_template("class-detail.j2"), number=pages
+        )
+        report("start-up, no cache", start_up, pages)
+
+        create_environment(Path(cache_path)).get_template("class-detail.j2")
+        start_up = timeit.timeit(
+            lambda: create_environment(Path(cache_path)).get_template(
+                "class-detail.j2"
+            ),
+            number=pages,
+        )
+        report("start-up, bytecode cache", start_up, pages)
+
+    jinja_env().get_template("class-detail.j2")
+    start_up = timeit.timeit(
+        lambda: jinja_env().get_template("class-detail.j2"), number=pages
+    )
+    report("start-up, long-lived environment", start_up, pages)
+
+    template = jinja_env().get_template("class-detail.j2")
+    render = timeit.timeit(lambda: template.render(**arguments), number=pages)
+    report("render class page", render, pages)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,12 @@
+"""Location of data kept between runs."""
+
+import os
+from pathlib import Path
+
+
+def cache_dir(*names: str) -> Path:
+    """A directory for cached data, under ``$XDG_CACHE_HOME/pygobject-docs``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    path = Path(base, "pygobject-docs", *names)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
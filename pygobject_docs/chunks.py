@@ -0,0 +1,75 @@
+"""Split long functions and constants pages into chunks.
+
+Some namespaces have thousands of constants (Gdk's ``KEY_*``) or hundreds
+of functions (GLib). On a single page they make for one huge document,
+that Sphinx reads and writes on its own and that browsers load slowly.
+Chunked, the page becomes an index of smaller pages.
+
+Names are chunked either by prefix (the part before the first underscore),
+packing small prefix groups together and splitting large ones, or in runs
+of a fixed size.
+"""
+
+import dataclasses
+from collections.abc import Iterable
+
+MODES = ("none", "prefix", "size")
+
+
+def _parts(names: list[str], size: int) -> list[list[str]]:
+    return [names[i : i + size] for i in range(0, len(names), size)]
+
+
+def prefix(name: str) -> str:
+    return name.split("_", 1)[0] or name
+
+
+@dataclasses.dataclass(frozen=True)
+class Chunking:
+    mode: str = "none"
+    # The most names on a page; pages with fewer names are not chunked
+    size: int = 500
+
+    def __post_init__(self):
+        if self.size < 1:
+            raise ValueError(f"Chunk size must be at least 1, not {self.size}")
+
+    def split(self, names: Iterable[str]) -> list[tuple[str, list[str]]]:
+        """Split names into chunks, as ``(title, names)``.
+
+        Returns a single chunk, without title, if no chunking is needed.
+        """
+        names = list(names)
+        if self.mode == "none" or len(names) <= self.size:
+            return [("", names)]
+
+        if self.mode == "size":
+            return [
+                (f"{part[0]} to {part[-1]}" if len(part) > 1 else part[0], part)
+                for part in _parts(names, self.size)
+            ]
+
+        if self.mode != "prefix":
+            raise ValueError(f"Unknown chunking mode {self.mode}")
+
+        groups: dict[str, list[str]] = {}
+        for name in names:
+            groups.setdefault(prefix(name), []).append(name)
+
+        chunks: list[tuple[str, list[str]]] = []
+        # Prefixes of the chunk being filled with small groups
+        packed: list[str] = []
+        for group_prefix, group in groups.items():
+            if len(group) > self.size:
+                packed = []
+                chunks.extend(
+                    (f"{group_prefix} ({i})", part)
+                    for i, part in enumerate(_parts(group, self.size), 1)
+                )
+            elif packed and len(chunks[-1][1]) + len(group) <= self.size:
+                packed.append(group_prefix)
+                chunks[-1] = (f"{packed[0]} to {group_prefix}", chunks[-1][1] + group)
+            else:
+                packed = [group_prefix]
+                chunks.append((group_prefix, group))
+        return chunks
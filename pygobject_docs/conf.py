@@ -16,6 +16,7 @@ copyright = "2023"
 
 extensions = [
     "sphinx.ext.intersphinx",
+    "pygobject_docs.directives",
 ]
 
 # include_patterns = ["build/source/**"]
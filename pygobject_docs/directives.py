@@ -0,0 +1,122 @@
+"""Sphinx directives and roles for the generated pages."""
+
+from docutils import nodes
+from docutils.parsers.rst import directives
+from sphinx.addnodes import pending_xref
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import make_id, split_explicit_title
+
+OBJECT_TYPES = ("data", "attribute")
+
+
+class ValueTable(SphinxDirective):
+    """A table of undocumented constants or attributes.
+
+    Each line is a name, optionally followed by its value. Every name is
+    registered with the Python domain and gets an anchor, as with
+    ``.. data::`` or ``.. attribute::``, so references to it resolve. Sphinx
+    only processes one directive for the whole table, though.
+    """
+
+    has_content = True
+    option_spec = {
+        "objtype": lambda argument: directives.choice(argument, OBJECT_TYPES),
+    }
+
+    def run(self) -> list[nodes.Node]:
+        domain = self.env.get_domain("py")
+        objtype = self.options.get("objtype", "data")
+        prefix = ".".join(
+            filter(
+                None,
+                (
+                    self.env.ref_context.get("py:module"),
+                    self.env.ref_context.get("py:class"),
+                ),
+            )
+        )
+
+        rows = [line.split(None, 1) for line in self.content if line.strip()]
+        columns = 2 if any(len(row) > 1 for row in rows) else 1
+
+        # Column widths are in characters, with the quotes the text writer puts
+        # around literals. The HTML writer leaves them to the browser.
+        widths = [
+            max((len(row[i]) for row in rows if i < len(row)), default=0) + 2
+            for i in range(columns)
+        ]
+        table = nodes.table(classes=["value-table", "colwidths-auto"])
+        group = nodes.tgroup(cols=columns)
+        table += group
+        group.extend(nodes.colspec(colwidth=width) for width in widths)
+        body = nodes.tbody()
+        group += body
+
+        for name, *value in rows:
+            fullname = f"{prefix}.{name}" if prefix else name
+            node_id = make_id(self.env, self.state.document, "", fullname)
+            target = nodes.paragraph("", "", nodes.literal(name, name), ids=[node_id])
+            self.state.document.note_explicit_target(target)
+            domain.note_object(fullname, objtype, node_id, location=target)
+
+            row = nodes.row()
+            row += nodes.entry("", target)
+            if columns > 1:
+                text = value[0] if value else ""
+                row += nodes.entry(
+                    "", nodes.paragraph("", "", nodes.literal(text, text))
+                )
+            body += row
+
+        return [table]
+
+
+def link_role(name, rawtext, text, lineno, inliner, options=None, content=None):
+    """A reference to a Python object, resolved when the pages were generated.
+
+    ``:link:`~gi.repository.GObject.Object <class:GObject-2.0/class-Object>```
+    renders like ``:class:`~gi.repository.GObject.Object```, but links to
+    the object on the given page, without a lookup. See
+    :mod:`pygobject_docs.links`.
+    """
+    env = inliner.document.settings.env
+    _, title, target = split_explicit_title(text)
+    role, _, docname = target.partition(":")
+    fullname = title.removeprefix("~")
+
+    text = fullname.rsplit(".", 1)[-1] if title.startswith("~") else fullname
+    if role in ("func", "meth") and env.config.add_function_parentheses:
+        text += "()"
+    literal = nodes.literal(text, text, classes=["xref", "py", f"py-{role}"])
+
+    if env.app.builder.format != "html":
+        # Other builders lay out pages differently, let Sphinx resolve it
+        node = pending_xref(
+            rawtext,
+            literal,
+            refdomain="py",
+            reftype=role,
+            reftarget=fullname,
+            refexplicit=False,
+            refwarn=True,
+        )
+        node["py:module"] = env.ref_context.get("py:module")
+        node["py:class"] = env.ref_context.get("py:class")
+        return [node], []
+
+    uri = env.app.builder.get_relative_uri(env.docname, docname)
+    node = nodes.reference(
+        rawtext,
+        "",
+        literal,
+        internal=True,
+        refuri=f"{uri}#{fullname}" if docname != env.docname else f"#{fullname}",
+        reftitle=fullname,
+    )
+    return [node], []
+
+
+def setup(app):
+    app.add_directive("value-table", ValueTable)
+    app.add_role("link", link_role)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -10,8 +10,11 @@ import dataclasses
 import importlib
 import logging
 import sys
+import time
 import warnings
+from collections import Counter
 from collections.abc import Iterator
+from contextlib import nullcontext
 
 from functools import lru_cache
 from pathlib import Path
@@ -19,18 +22,28 @@ from pathlib import Path
 import gi
 import sphinx.cmd.make_mode
 from gi.repository import GLib
-from jinja2 import Environment, PackageLoader
-from sphinx.util.inspect import stringify_annotation
 from sphinx.util.docstrings import prepare_docstring
 
+from pygobject_docs import output, workers
 from pygobject_docs.category import (
     Category,
     determine_category,
     determine_member_category,
     MemberCategory,
 )
+from pygobject_docs.chunks import MODES, Chunking
 from pygobject_docs.doc import rstify
-from pygobject_docs.gir import load_gir_file
+from pygobject_docs.gir import (
+    READERS,
+    find_gir_file,
+    gir_database,
+    gir_includes,
+    load_gir_file,
+    use_reader,
+)
+from pygobject_docs.gironly import GirPages
+from pygobject_docs.hierarchy import INLINE_LIMIT, hierarchy_file, load_hierarchy
+from pygobject_docs.incremental import Journal, Tracker, namespace_fingerprint
 from pygobject_docs.inspect import (
     custom_docstring,
     is_classmethod,
@@ -39,7 +52,33 @@ from pygobject_docs.inspect import (
     patch_gi_overrides,
     is_ref_unref_copy_or_steal_function,
 )
-from pygobject_docs.members import own_dir, properties, signals, virtual_methods
+from pygobject_docs.links import load_targets, write_links
+from pygobject_docs.members import (
+    cache_stats,
+    clear_caches,
+    own_dir,
+    property_types,
+    signals,
+    virtual_methods,
+)
+from pygobject_docs.model import ModelWriter, model_path, render_models
+from pygobject_docs.overrides import load_overrides
+from pygobject_docs.render import (
+    generate_top_index,
+    link_references,
+    render_class_page,
+    render_chunks,
+    render_page,
+    section_pages,
+    use_value_tables,
+)
+from pygobject_docs.schedule import (
+    Costs,
+    dependency_order,
+    longest_first,
+    makespan,
+)
+from pygobject_docs.workers import Result
 
 C_API_DOCS = {
     "GLib": "https://docs.gtk.org/glib",
@@ -71,23 +110,22 @@ def import_module(namespace, version):
     return importlib.import_module(f"gi.repository.{namespace}")
 
 
-@lru_cache(maxsize=0)
-def jinja_env():
-    env = Environment(loader=PackageLoader("pygobject_docs"), lstrip_blocks=True)
-    env.filters["capfirst"] = lambda text: (
-        f"{text[0].upper()}{text[1:]}" if text else ""
-    )
-    return env
-
-
 def output_path(base_path, namespace, version):
     out_path = base_path / f"{namespace}-{version}"
     out_path.mkdir(exist_ok=True, parents=True)
     return out_path
 
 
-def generate_functions(namespace, version, out_path):
+def generate_functions(
+    namespace, version, out_path, tracker=None, model=None, chunking=None
+):
     mod = import_module(namespace, version)
+    page = out_path / "functions.rst"
+
+    if tracker and tracker.skip(
+        page, "functions", extra=[repr(chunking)] if chunking else ()
+    ):
+        return
 
     if not any(
         determine_category(mod, name) == Category.Functions for name in dir(mod)
@@ -95,11 +133,8 @@ def generate_functions(namespace, version, out_path):
         return
 
     gir = load_gir_file(namespace, version)
-    env = jinja_env()
     image_base_url = C_API_DOCS.get(namespace, "")
 
-    template = env.get_template("functions.j2")
-
     def func_doc(name):
         if custom_doc := custom_docstring(getattr(mod, name, None)):
             return custom_doc
@@ -133,30 +168,48 @@ def generate_functions(namespace, version, out_path):
                 return "PyGObject-3.16.0", rstify(message, gir=gir)
             return None
 
-        (out_path / "functions.rst").write_text(
-            template.render(
-                functions=[
-                    (
-                        name,
-                        sig := signature(getattr(mod, name)),
-                        func_doc(name),
-                        parameter_docs(name, sig),
-                        return_doc(name),
-                        deprecated(name),
-                        gir.since(name),
-                    )
-                    for name in dir(mod)
-                    if determine_category(mod, name) == Category.Functions
-                    and not is_ref_unref_copy_or_steal_function(name)
-                ],
-                namespace=namespace,
-                version=version,
+        def function(name):
+            return (
+                name,
+                sig := signature(getattr(mod, name)),
+                func_doc(name),
+                parameter_docs(name, sig),
+                return_doc(name),
+                deprecated(name),
+                gir.since(name),
             )
+
+        parts = render_chunks(
+            "functions.j2",
+            page,
+            model,
+            chunking,
+            [
+                name
+                for name in dir(mod)
+                if determine_category(mod, name) == Category.Functions
+                and not is_ref_unref_copy_or_steal_function(name)
+            ],
+            function,
+            "Functions",
+            namespace=namespace,
+            version=version,
         )
 
+    if tracker:
+        tracker.done(page, parts)
 
-def generate_constants(namespace, version, out_path):
+
+def generate_constants(
+    namespace, version, out_path, tracker=None, model=None, chunking=None
+):
     mod = import_module(namespace, version)
+    page = out_path / "constants.rst"
+
+    if tracker and tracker.skip(
+        page, "constants", extra=[repr(chunking)] if chunking else ()
+    ):
+        return
 
     if not any(
         determine_category(mod, name) == Category.Constants for name in dir(mod)
@@ -164,9 +217,6 @@ def generate_constants(namespace, version, out_path):
         return
 
     gir = load_gir_file(namespace, version)
-    env = jinja_env()
-
-    template = env.get_template("constants.j2")
 
     with warnings.catch_warnings(record=True) as caught_warnings:
 
@@ -180,28 +230,50 @@ def generate_constants(namespace, version, out_path):
                 return "PyGObject-3.16.0", rstify(message, gir=gir)
             return None
 
-        (out_path / "constants.rst").write_text(
-            template.render(
-                constants=[
-                    (
-                        name,
-                        getattr(mod, name),
-                        rstify(gir.doc(name), gir=gir),
-                        deprecated(name),
-                        gir.since(name),
-                    )
-                    for name in dir(mod)
-                    if determine_category(mod, name) == Category.Constants
-                ],
-                namespace=namespace,
-                version=version,
+        def constant(name):
+            return (
+                name,
+                getattr(mod, name),
+                rstify(gir.doc(name), gir=gir),
+                deprecated(name),
+                gir.since(name),
             )
-        )
 
+        parts = render_chunks(
+            "constants.j2",
+            page,
+            model,
+            chunking,
+            [
+                name
+                for name in dir(mod)
+                if determine_category(mod, name) == Category.Constants
+            ],
+            constant,
+            "Constants",
+            namespace=namespace,
+            version=version,
+        )
 
-def generate_classes(namespace, version, out_path, category, title=None):
+    if tracker:
+        tracker.done(page, parts)
+
+
+def generate_classes(
+    namespace,
+    version,
+    out_path,
+    category,
+    title=None,
+    tracker=None,
+    model=None,
+    hierarchy=None,
+    split_threshold=None,
+    hierarchy_limit=INLINE_LIMIT,
+):
     mod = import_module(namespace, version)
     gir = load_gir_file(namespace, version)
+    graph = hierarchy and hierarchy.library(f"{namespace}-{version}", hierarchy_limit)
 
     class_names = [
         name
@@ -214,6 +286,14 @@ def generate_classes(namespace, version, out_path, category, title=None):
         return
 
     for class_name in class_names:
+        page = out_path / f"{category.single}-{class_name}.rst"
+        extra = [
+            *(graph.fingerprint(class_name) if graph else ()),
+            *([repr(split_threshold)] if split_threshold else ()),
+        ]
+        if tracker and tracker.skip(page, "class", class_name, extra):
+            continue
+
         with warnings.catch_warnings(record=True) as caught_warnings:
             klass = getattr(mod, class_name)
 
@@ -229,25 +309,51 @@ def generate_classes(namespace, version, out_path, category, title=None):
             out_path=out_path,
             category=category,
             caught_warnings=caught_warnings,
+            model=model,
+            hierarchy=graph,
+            split_threshold=split_threshold,
         )
 
-    template = jinja_env().get_template("classes.j2")
-
-    (out_path / f"{category}.rst").write_text(
-        template.render(
-            namespace=namespace,
-            version=version,
-            entity_type=title or category.title(),
-            prefix=category.single,
-        )
+        if tracker:
+            tracker.done(page, section_pages(page))
+
+    render_page(
+        "classes.j2",
+        out_path / f"{category}.rst",
+        model,
+        namespace=namespace,
+        version=version,
+        entity_type=title or category.title(),
+        prefix=category.single,
     )
 
 
 def generate_class(
-    gir, namespace, version, class_name, klass, out_path, category, caught_warnings
+    gir,
+    namespace,
+    version,
+    class_name,
+    klass,
+    out_path,
+    category,
+    caught_warnings,
+    model=None,
+    hierarchy=None,
+    split_threshold=None,
 ):
+    """Render the page of a class.
+
+    Sections with more than ``split_threshold`` members are rendered on
+    pages of their own, which the class page links to.
+    """
     image_base_url = C_API_DOCS.get(namespace, "")
-    template = jinja_env().get_template("class-detail.j2")
+    # Subclasses and implementations from all generated libraries, if known
+    graph = hierarchy or gir
+    descendants, more_descendants = graph.descendants(class_name), 0
+    implementations, more_implementations = graph.implementations(class_name), 0
+    if hierarchy:
+        descendants, more_descendants = hierarchy.compact(descendants)
+        implementations, more_implementations = hierarchy.compact(implementations)
 
     def doc():
         if doc := custom_docstring(klass):
@@ -287,6 +393,8 @@ def generate_class(
                 out_path=out_path,
                 category=category,
                 caught_warnings=[],
+                model=model,
+                split_threshold=split_threshold,
             )
 
     def member_doc(member_type, member_name):
@@ -356,10 +464,12 @@ def generate_class(
         "doc": doc(),
         "deprecated": deprecated(class_name),
         "since": gir.since(class_name),
-        "ancestors": gir.ancestors(class_name),
-        "descendants": gir.descendants(class_name),
-        "implements": gir.implements(class_name),
-        "implementations": gir.implementations(class_name),
+        "ancestors": graph.ancestors(class_name),
+        "descendants": descendants,
+        "more_descendants": more_descendants,
+        "implements": graph.implements(class_name),
+        "implementations": implementations,
+        "more_implementations": more_implementations,
         "constructors": [
             (
                 name,
@@ -404,12 +514,12 @@ def generate_class(
         "properties": [
             (
                 name,
-                stringify_annotation(type, mode="smart"),
+                type,
                 member_doc("property", name),
                 member_deprecated("property", class_name, name),
                 gir.member_since("property", class_name, name),
             )
-            for name, type in properties(klass)
+            for name, type in property_types(klass)
         ],
         "signals": [
             (
@@ -438,18 +548,80 @@ def generate_class(
         ],
     }
 
-    (out_path / f"{category.single}-{class_name}.rst").write_text(
-        template.render(**arguments)
+    render_class_page(
+        out_path / f"{category.single}-{class_name}.rst",
+        model,
+        arguments,
+        split_threshold,
     )
 
     return arguments
 
 
-def generate_index(namespace, version, out_path):
+def generate_hierarchy(
+    namespace,
+    version,
+    out_path,
+    hierarchy,
+    tracker=None,
+    model=None,
+    limit=INLINE_LIMIT,
+):
+    """The full subclasses and implementations of crowded types.
+
+    Types are crowded with more than ``limit`` subclasses or implementations.
+    Returns whether there is a page.
+    """
+    graph = hierarchy.library(f"{namespace}-{version}", limit)
+    page = out_path / "hierarchy.rst"
+    if not (crowded := graph.crowded()):
+        # Left over from a run in which types were crowded
+        page.unlink(missing_ok=True)
+        if tracker:
+            tracker.removed(page)
+        return False
+
+    types = [
+        (class_name, graph.tree(class_name), graph.implementations(class_name))
+        for class_name in crowded
+    ]
+    if tracker and tracker.skip(
+        page,
+        "hierarchy",
+        extra=[
+            line
+            for class_name, tree, impls in types
+            for line in (class_name, *(f"{d} {p}" for d, p in tree), *impls)
+        ],
+    ):
+        return True
+
+    render_page(
+        "hierarchy.j2",
+        page,
+        model,
+        namespace=namespace,
+        version=version,
+        types=types,
+    )
+
+    if tracker:
+        tracker.done(page)
+    return True
+
+
+def generate_index(
+    namespace, version, out_path, tracker=None, model=None, hierarchy=False
+):
     mod = import_module(namespace, version)
+    page = out_path / "index.rst"
+
+    if tracker and tracker.skip(
+        page, "index", extra=["hierarchy"] if hierarchy else ()
+    ):
+        return
+
     gir = load_gir_file(namespace, version)
-    env = jinja_env()
-    template = env.get_template("index.j2")
 
     library_version = (
         ".".join(
@@ -469,80 +641,354 @@ def generate_index(namespace, version, out_path):
     def has(category):
         return any(determine_category(mod, name, gir) == category for name in dir(mod))
 
-    (out_path / "index.rst").write_text(
-        template.render(
-            namespace=namespace,
-            version=version,
-            library_version=library_version,
-            c_api_doc_link=C_API_DOCS.get(namespace, ""),
-            dependencies=gir.dependencies,
-            classes=has(Category.Classes),
-            interfaces=has(Category.Interfaces),
-            structures=has(Category.Structures),
-            unions=has(Category.Unions),
-            enums=has(Category.Enums),
-            functions=has(Category.Functions),
-            constants=has(Category.Constants),
-            init_function="init" in dir(mod),
-        )
+    render_page(
+        "index.j2",
+        page,
+        model,
+        namespace=namespace,
+        version=version,
+        library_version=library_version,
+        c_api_doc_link=C_API_DOCS.get(namespace, ""),
+        dependencies=gir.dependencies,
+        classes=has(Category.Classes),
+        interfaces=has(Category.Interfaces),
+        structures=has(Category.Structures),
+        unions=has(Category.Unions),
+        enums=has(Category.Enums),
+        functions=has(Category.Functions),
+        constants=has(Category.Constants),
+        hierarchy=hierarchy,
+        init_function="init" in dir(mod),
     )
 
-
-def order(libraries: list[str], top: list[str]):
-    def index(name):
-        try:
-            return top.index(name)
-        except ValueError:
-            return len(top)
-
-    return [
-        lib
-        for _, lib in sorted((index(lib.split("-", 1)[0]), lib) for lib in libraries)
-    ]
-
-
-def generate_top_index(
-    libraries: list[str], gnome_version: str, out_path: Path
-) -> None:
-    env = jinja_env()
-    template = env.get_template("top-index.j2")
-
-    (out_path / "index.rst").write_text(
-        template.render(
-            gnome_version=gnome_version,
-            libraries=order(
-                libraries, top=["GLib", "Gio", "GObject", "Gtk", "Gdk", "Adw"]
-            ),
+    if tracker:
+        tracker.done(page)
+
+
+def generate(
+    namespace,
+    version,
+    base_path,
+    incremental=True,
+    journal=None,
+    model_dir=None,
+    gir_only=False,
+    hierarchy=None,
+    chunking=None,
+    split_threshold=None,
+    hierarchy_limit=INLINE_LIMIT,
+    value_tables=True,
+):
+    out_path = output_path(base_path, namespace, version)
+    load_overrides(namespace)
+    if not gir_only:
+        import_module(namespace, version)
+    use_value_tables(value_tables)
+    # A model should contain all pages, so nothing is skipped when writing one
+    tracker = (
+        Tracker(
+            namespace,
+            version,
+            out_path,
+            journal,
+            incremental,
+            options=() if value_tables else ["no-value-tables"],
         )
+        if (incremental or journal) and not model_dir
+        else None
     )
 
-    # Copy templates
-    (out_path / "_templates").mkdir(exist_ok=True)
-    (out_path / "_templates" / "genindex.html").write_text(
-        (Path(__file__).parent / "sphinx" / "genindex.html").read_text()
+    with (
+        ModelWriter(model_path(model_dir, f"{namespace}-{version}"), out_path)
+        if model_dir
+        else nullcontext()
+    ) as model:
+        if gir_only:
+            generate_from_gir(
+                namespace,
+                version,
+                out_path,
+                tracker,
+                model,
+                hierarchy,
+                chunking,
+                split_threshold,
+                hierarchy_limit,
+            )
+        else:
+            generate_functions(namespace, version, out_path, tracker, model, chunking)
+            for category in (
+                Category.Classes,
+                Category.Interfaces,
+                Category.Structures,
+                Category.Unions,
+                Category.Enums,
+            ):
+                generate_classes(
+                    namespace,
+                    version,
+                    out_path,
+                    category,
+                    tracker=tracker,
+                    model=model,
+                    hierarchy=hierarchy,
+                    split_threshold=split_threshold,
+                    hierarchy_limit=hierarchy_limit,
+                )
+            generate_constants(namespace, version, out_path, tracker, model, chunking)
+            has_hierarchy = hierarchy is not None and generate_hierarchy(
+                namespace, version, out_path, hierarchy, tracker, model, hierarchy_limit
+            )
+            generate_index(namespace, version, out_path, tracker, model, has_hierarchy)
+
+    if tracker:
+        tracker.save()
+        log.info("Skipped %d up to date pages for %s", tracker.skipped, namespace)
+
+    log.debug("Member cache (hits, misses) for %s: %s", namespace, cache_stats())
+    clear_caches()
+
+
+def generate_from_gir(
+    namespace,
+    version,
+    out_path,
+    tracker=None,
+    model=None,
+    hierarchy=None,
+    chunking=None,
+    split_threshold=None,
+    hierarchy_limit=INLINE_LIMIT,
+):
+    """Generate pages from the GIR file, without importing the library."""
+    pages = GirPages(
+        namespace,
+        version,
+        out_path,
+        C_API_DOCS.get(namespace, ""),
+        split_threshold,
+        chunking,
+        hierarchy,
+        hierarchy_limit,
+    )
+    has_hierarchy = hierarchy is not None and generate_hierarchy(
+        namespace, version, out_path, hierarchy, tracker, model, hierarchy_limit
+    )
+    pages.generate(model, tracker, has_hierarchy)
+
+
+def _library_dependencies(lib: str) -> tuple[str, ...]:
+    gir_file = find_gir_file(*lib.split("-"))
+    return gir_includes(gir_file) if gir_file else ()
+
+
+def _generate_library(task) -> Counter[str]:
+    (
+        lib,
+        out_path,
+        incremental,
+        journal,
+        model_dir,
+        gir_only,
+        hierarchy_path,
+        chunking,
+        split_threshold,
+        resolve_links,
+        hierarchy_limit,
+        value_tables,
+        gir_reader,
+        database,
+    ) = task
+    namespace, version = lib.split("-")
+    before = output.counts.copy()
+    use_reader(gir_reader, database)
+    link_references(load_targets(out_path) if resolve_links else {})
+
+    log.info("Generating pages for %s", namespace)
+    # Worker processes share the journal file. Records of this run are always
+    # valid, so it is safe to load them.
+    generate(
+        namespace,
+        version,
+        out_path,
+        incremental,
+        journal or Journal(out_path, True),
+        model_dir,
+        gir_only,
+        load_hierarchy(hierarchy_path),
+        chunking,
+        split_threshold,
+        hierarchy_limit,
+        value_tables,
     )
 
+    return output.counts - before
+
+
+def _generate_in_process(tasks) -> Iterator[Result]:
+    for task in tasks:
+        start = time.perf_counter()
+        _generate_library(task)
+        yield Result(task[0], seconds=time.perf_counter() - start)
+
+
+def generate_all(
+    out_path: Path,
+    libraries: list[str],
+    gnome_version: str,
+    incremental=True,
+    resume=False,
+    jobs=1,
+    isolate=False,
+    max_rss=None,
+    timeout=None,
+    model_dir=None,
+    gir_only=(),
+    chunking=None,
+    split_threshold=None,
+    resolve_links=False,
+    hierarchy_limit=INLINE_LIMIT,
+    value_tables=True,
+    gir_reader="gidocgen",
+) -> list[str]:
+    """Generate pages for all libraries.
+
+    With ``jobs`` > 1 or ``isolate``, each library is generated in a separate
+    process, limited to ``max_rss`` MiB and ``timeout`` seconds. With
+    ``model_dir``, the model of each library is written to that directory.
+    Libraries in ``gir_only`` are generated from their GIR file alone.
+    ``chunking`` splits long functions and constants pages. Class sections
+    with more than ``split_threshold`` members get pages of their own. With
+    ``resolve_links``, references to documented objects become direct links.
+    Class pages list up to ``hierarchy_limit`` subclasses and implementations,
+    the hierarchy page of the namespace lists the rest; 0 lists all of them.
+    With ``value_tables``, undocumented constants and fields are listed in
+    tables instead of getting a directive each. GIR files are read with
+    ``gir_reader``, see :data:`gir.READERS`.
+
+    Returns the libraries that failed.
+    """
+    journal = Journal(out_path, resume)
+    # Compiled once, worker processes only open it for reading
+    database = gir_database() if gir_reader == "db" else None
+    costs = Costs(mode="incremental" if incremental else "full")
+
+    fingerprints = {}
+    for lib in libraries:
+        fingerprint = namespace_fingerprint(*lib.split("-"))
+        if journal.completed(lib, "", fingerprint):
+            log.info("Pages for %s have been generated by a previous run", lib)
+        else:
+            fingerprints[lib] = fingerprint
+
+    todo = dependency_order(list(fingerprints), _library_dependencies)
+    # Built once, from all libraries, and read by each worker
+    hierarchy_path = hierarchy_file(libraries)
+    if jobs > 1:
+        todo = longest_first(todo, costs, _library_dependencies)
+    predicted = makespan(todo, costs, jobs)
+
+    start = time.perf_counter()
+    if jobs > 1 or isolate:
+        results = workers.run(
+            _generate_library,
+            [
+                (
+                    lib,
+                    out_path,
+                    incremental,
+                    None,
+                    model_dir,
+                    lib in gir_only,
+                    hierarchy_path,
+                    chunking,
+                    split_threshold,
+                    resolve_links,
+                    hierarchy_limit,
+                    value_tables,
+                    gir_reader,
+                    database,
+                )
+                for lib in todo
+            ],
+            jobs,
+            max_rss=max_rss and max_rss * 1024,
+            timeout=timeout,
+            preload=["pygobject_docs.zygote"],
+        )
+    else:
+        results = _generate_in_process(
+            [
+                (
+                    lib,
+                    out_path,
+                    incremental,
+                    journal,
+                    model_dir,
+                    lib in gir_only,
+                    hierarchy_path,
+                    chunking,
+                    split_threshold,
+                    resolve_links,
+                    hierarchy_limit,
+                    value_tables,
+                    gir_reader,
+                    database,
+                )
+                for lib in todo
+            ]
+        )
 
-def generate(namespace, version, base_path):
-    out_path = output_path(base_path, namespace, version)
-
-    generate_functions(namespace, version, out_path)
-    generate_classes(namespace, version, out_path, Category.Classes)
-    generate_classes(namespace, version, out_path, Category.Interfaces)
-    generate_classes(namespace, version, out_path, Category.Structures)
-    generate_classes(namespace, version, out_path, Category.Unions)
-    generate_classes(namespace, version, out_path, Category.Enums)
-    generate_constants(namespace, version, out_path)
-    generate_index(namespace, version, out_path)
+    failures = []
+    for result in results:
+        if result.error:
+            log.error("Generating %s failed: %s", result.lib, result.error)
+            failures.append(result)
+            continue
 
+        output.counts.update(result.counts)
+        if not resume:
+            # Part of the library may have been generated by the previous run
+            costs.update(result.lib, result.seconds)
+        journal.record(result.lib, "", fingerprints[result.lib])
+        if result.peak_rss:
+            log.info(
+                "Generated %s in %.1fs, peak RSS %d MiB",
+                result.lib,
+                result.seconds,
+                result.peak_rss // 1024,
+            )
 
-def generate_all(out_path: Path, libraries: list[str], gnome_version: str):
-    for lib in libraries:
-        namespace, version = lib.split("-")
-        log.info("Generating pages for %s", namespace)
-        generate(namespace, version, out_path)
+    log.info(
+        "Generated %d libraries in %.1fs, predicted %.1fs",
+        len(todo),
+        time.perf_counter() - start,
+        predicted,
+    )
+    costs.save()
 
     generate_top_index(libraries, gnome_version, out_path)
+    write_links(out_path, resolve_links)
+
+    if failures:
+        for result in failures:
+            log.error(
+                "Failed: %s (%s, after %.1fs, peak RSS %d MiB)",
+                result.lib,
+                result.error,
+                result.seconds,
+                result.peak_rss // 1024,
+            )
+    else:
+        journal.finish()
+
+    log.info(
+        "Wrote %d files, %d files unchanged",
+        output.counts["written"],
+        output.counts["unchanged"],
+    )
+
+    return [result.lib for result in failures]
 
 
 def sphinx_build_docs(source_path: Path, base_path: Path):
@@ -555,10 +1001,33 @@ def sphinx_build_docs(source_path: Path, base_path: Path):
 class Args:
     log_level: str
     build: bool
+    incremental: bool
+    resume: bool
+    jobs: int
+    isolate: bool
+    max_rss: int | None
+    timeout: float | None
+    model: Path | None
+    from_model: Path | None
+    gir_only: list[str]
+    chunk: str
+    chunk_size: int
+    split_sections: int | None
+    hierarchy_limit: int
+    value_tables: bool
+    links: bool
+    gir_reader: str
     gnome: str
     libraries: list[str]
 
 
+def _chunk_size(value: str) -> int:
+    try:
+        return Chunking(size=int(value)).size
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
 def parse_args(args) -> Args:
     parser = argparse.ArgumentParser(
         description="GNOME Python API documentation generator"
@@ -578,6 +1047,113 @@ def parse_args(args) -> Args:
         action=argparse.BooleanOptionalAction,
         help="build generated docs with Sphinx (default: no)",
     )
+    parser.add_argument(
+        "--incremental",
+        default=True,
+        action=argparse.BooleanOptionalAction,
+        help="skip pages whose inputs did not change since the last run (default: yes)",
+    )
+    parser.add_argument(
+        "--resume",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="continue an interrupted run, skip work it completed (default: no)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        default=1,
+        type=int,
+        help="number of libraries to generate in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--isolate",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="generate each library in a separate process (default: no, "
+        "implied by --jobs)",
+    )
+    parser.add_argument(
+        "--max-rss",
+        type=int,
+        help="memory limit for a library process, in MiB",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="time limit for a library process, in seconds",
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        metavar="DIR",
+        help="also write the API model of each library to DIR",
+    )
+    parser.add_argument(
+        "--from-model",
+        type=Path,
+        metavar="DIR",
+        help="only render pages from the library models in DIR, as written by "
+        "--model; python -m pygobject_docs.model does the same without gi",
+    )
+    parser.add_argument(
+        "--gir-only",
+        action="append",
+        default=[],
+        metavar="LIBRARY",
+        help="generate LIBRARY (like WebKit-6.0) from its GIR file, "
+        "without importing it; can be repeated",
+    )
+    parser.add_argument(
+        "--chunk",
+        default="none",
+        choices=MODES,
+        help="split long functions and constants pages: by name prefix, "
+        "or in runs of a fixed size (default: none)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_chunk_size,
+        default=Chunking.size,
+        help=f"the most entries on a page when chunking (default: {Chunking.size})",
+    )
+    parser.add_argument(
+        "--split-sections",
+        type=int,
+        metavar="N",
+        help="put class sections with more than N members, like the methods "
+        "of Gtk.Widget, on pages of their own",
+    )
+    parser.add_argument(
+        "--hierarchy-limit",
+        type=int,
+        default=INLINE_LIMIT,
+        metavar="N",
+        help="list at most N subclasses and implementations on a class page, "
+        "and all of them on a hierarchy page; 0 lists all on the class page "
+        f"(default: {INLINE_LIMIT})",
+    )
+    parser.add_argument(
+        "--value-tables",
+        default=True,
+        action=argparse.BooleanOptionalAction,
+        help="list undocumented constants, enum members and fields in tables, "
+        "instead of giving each a directive (default: yes)",
+    )
+    parser.add_argument(
+        "--links",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="link references to documented objects directly, instead of "
+        "having Sphinx resolve them (default: no)",
+    )
+    parser.add_argument(
+        "--gir-reader",
+        default="gidocgen",
+        choices=READERS,
+        help="how to read GIR files: parse with gi-docgen, parse with the slim "
+        "reader, or query the GIR database (default: gidocgen)",
+    )
     parser.add_argument("--gnome", "-g", default="", help="GNOME version")
     parser.add_argument(
         "libraries", nargs="*", help="library namespaces to generate documentation for"
@@ -598,8 +1174,37 @@ if __name__ == "__main__":
         level=getattr(logging, args.log_level.upper()),
     )
 
-    patch_gi_overrides()
-    generate_all(source_path, args.libraries, args.gnome)
+    if args.from_model:
+        render_models(
+            args.from_model,
+            source_path,
+            args.libraries,
+            args.gnome,
+            args.links,
+            args.value_tables,
+        )
+    else:
+        patch_gi_overrides()
+        if failed := generate_all(
+            source_path,
+            args.libraries,
+            args.gnome,
+            args.incremental,
+            args.resume,
+            args.jobs,
+            args.isolate,
+            args.max_rss,
+            args.timeout,
+            args.model,
+            args.gir_only,
+            Chunking(args.chunk, args.chunk_size) if args.chunk != "none" else None,
+            args.split_sections,
+            args.links,
+            args.hierarchy_limit,
+            args.value_tables,
+            args.gir_reader,
+        ):
+            sys.exit(f"Failed to generate {', '.join(failed)}")
 
     if args.build:
         sphinx_build_docs(source_path, build_path)
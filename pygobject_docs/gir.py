@@ -1,38 +1,110 @@
 from __future__ import annotations
 
+import abc
+import hashlib
+import html
 import logging
-from collections.abc import Iterable
+import mmap
+import os
+import pickle
+import sqlite3
+import xml.etree.ElementTree as etree
+from array import array
+from collections.abc import Iterable, Sequence
 from functools import lru_cache
-from itertools import chain
 from pathlib import Path
+from xml.parsers import expat
 
 from gi.repository import GLib
 from gidocgen.gir import (
     GirParser,
+    BitField,
     Class,
-    Constant,
     Enumeration,
     Function,
-    FunctionMacro,
     Interface,
     Record,
     Repository,
     Type,
 )
+from gidocgen.gir.parser import FUNDAMENTAL_TYPES, GLIB_ALIASES
+
+from pygobject_docs.cache import cache_dir
 
 
 log = logging.getLogger(__name__)
 
 
-def load_gir_file(namespace, version) -> Gir | None:
+# How load_gir_file() reads GIR files: parse them with gi-docgen, with
+# read_slim(), or look them up in the GIR database
+READERS = ("gidocgen", "slim", "db")
+
+_reader = "gidocgen"
+_database: Path | None = None
+
+
+def use_reader(reader: str, database: Path | None = None) -> None:
+    """Read GIR files with ``reader`` from now on, see :data:`READERS`.
+
+    The "db" reader opens ``database``, compiled beforehand by
+    :func:`gir_database`, so worker processes do not compile it again.
+    """
+    global _reader, _database
+
+    if reader not in READERS:
+        raise ValueError(f"Unknown GIR reader {reader}")
+    if reader == "db" and not database:
+        raise ValueError("The db reader needs a compiled GIR database")
+    _reader, _database = reader, database
+
+
+def load_gir_file(namespace, version) -> GirReader | None:
+    if gir_file := find_gir_file(namespace, version):
+        if _reader == "slim":
+            return SlimGir(gir_file)
+        if _reader == "db":
+            assert _database
+            return DbGir(gir_file, _database)
+        return Gir(gir_file)
+    return None
+
+
+def find_gir_file(namespace, version) -> Path | None:
     for gir_dir in gir_dirs():
         if (gir_file := gir_dir / f"{namespace}-{version}.gir").exists():
-            return Gir(gir_file)
+            return gir_file
     return None
 
 
+@lru_cache(maxsize=None)
+def gir_includes(gir_file: Path) -> tuple[str, ...]:
+    """Libraries (``namespace-version``) included by a GIR file.
+
+    Only the header of the file is read.
+    """
+    includes = []
+    for _, element in etree.iterparse(gir_file, events=("start",)):
+        if element.tag == f"{{{NS['']}}}include":
+            includes.append(f"{element.get('name')}-{element.get('version')}")
+        elif element.tag == f"{{{NS['']}}}namespace":
+            break
+    return tuple(includes)
+
+
+# Repositories parsed ahead of time, shared by worker processes forked later.
+# Only used for these libraries themselves, not when they are included
+_preloaded: dict[Path, Repository] = {}
+
+
+def preload(namespace, version) -> None:
+    if gir_file := find_gir_file(namespace, version):
+        _preloaded[gir_file] = _parse(gir_file)
+
+
 @lru_cache(maxsize=0)
 def _parse(gir_file) -> Repository:
+    if repo := _preloaded.get(gir_file):
+        return repo
     parser = GirParser(gir_dirs())
     parser.parse(gir_file)
     repo = parser.get_repository()
@@ -54,78 +126,165 @@ NS = {
 }
 
 
-class Gir:
-    def __init__(self, gir_file: Path):
-        self.repo = _parse(gir_file)
-        self._constants: dict[str, Constant | Enumeration] = self._resolve_constants()
+class GirReader(abc.ABC):
+    """Lookups in a GIR file, shared by all readers.
+
+    A reader only stores the nodes of a GIR file: it finds types and
+    functions, and reads the fields of a node. Lookups are done here, on
+    top of that, so :class:`Gir`, :class:`SlimGir` and :class:`DbGir` give
+    the same answers.
+    """
 
     @property
-    def namespace(self):
-        ns = self.repo.namespace
-        return ns.name, ns.version
+    @abc.abstractmethod
+    def namespace(self) -> tuple[str, str]:
+        """Name and version of the namespace."""
 
     @property
-    def dependencies(self):
-        return (
-            f"{r.namespace.name}-{r.namespace.version}"
-            for r in self.repo.includes.values()
-        )
+    @abc.abstractmethod
+    def dependencies(self) -> Iterable[str]:
+        """Included libraries, as ``namespace-version``."""
 
-    def _node(self, name) -> Function | Type | None:
-        node = self.repo.namespace.find_real_type(
-            name
-        ) or self.repo.namespace.find_function(name)
+    @abc.abstractmethod
+    def _type(self, ns_name: str, name: str):
+        """A type of this namespace or of an included namespace."""
+
+    @abc.abstractmethod
+    def _function(self, name: str):
+        """A function of this namespace."""
+
+    @abc.abstractmethod
+    def _member(self, node, kind: str, name: str):
+        """A member of a type, ``kind`` being its GIR tag, e.g. "method"."""
+
+    @abc.abstractmethod
+    def _subclasses(self, node) -> Iterable[str]:
+        """Names of the classes of this namespace derived from a class."""
+
+    @abc.abstractmethod
+    def _implementors(self, node) -> Iterable[str]:
+        """Names of the classes of this namespace implementing an interface."""
+
+    @abc.abstractmethod
+    def _kind(self, node) -> str:
+        """The GIR tag of a node, e.g. "class" or "enumeration"."""
+
+    @abc.abstractmethod
+    def _parent(self, node) -> str | None:
+        """The parent class of a class, qualified when in another namespace."""
+
+    @abc.abstractmethod
+    def _implemented(self, node) -> Iterable[str]:
+        """Interfaces implemented by a class, qualified as :meth:`_parent`."""
+
+    @abc.abstractmethod
+    def _struct_for(self, node) -> str | None:
+        """The type a class struct is for."""
+
+    @abc.abstractmethod
+    def _doc(self, node) -> str:
+        """The documentation of a node."""
+
+    @abc.abstractmethod
+    def _parameter_doc(self, node, param_name) -> str:
+        """The documentation of a parameter of a function node."""
+
+    @abc.abstractmethod
+    def _return_doc(self, node) -> str:
+        """The documentation of the return value of a function node."""
+
+    @abc.abstractmethod
+    def _deprecated(self, node) -> tuple[str, str] | None:
+        """Version and message of a deprecated node."""
+
+    @abc.abstractmethod
+    def _since(self, node) -> str | None:
+        """The version a node is available since."""
+
+    @property
+    def lib(self):
+        return "-".join(self.namespace)
+
+    @property
+    def libs(self) -> tuple[str, ...]:
+        """This library and its dependencies, in the order symbols are found."""
+        return (self.lib, *self.dependencies)
+
+    def _node(self, name):
+        node = self._type(self.namespace[0], name) or self._function(name)
         if not node:
             log.debug("No GIR type found for %s", name)
         return node
 
+    def _find(self, ns_name: str, name: str, kind: str):
+        prefix, _, type_name = name.rpartition(".")
+        ns_name = prefix or ns_name
+        if (node := self._type(ns_name, type_name)) and self._kind(node) == kind:
+            return ns_name, type_name, node
+        return None
+
+    def _implements(self, node) -> list[tuple[str, str]]:
+        return [
+            (ns_name, iface)
+            for name in self._implemented(node)
+            if (found := self._find(self.namespace[0], name, "interface"))
+            for ns_name, iface, _ in [found]
+        ]
+
     def ancestors(self, name) -> Iterable[str]:
-        if not (node := self._node(name)) or not isinstance(node, Class):
+        if not (node := self._node(name)) or self._kind(node) != "class":
             return []
 
-        return [f"gi.repository.{anc.fqtn}" for anc in node.ancestors]
+        ancestors: list[str] = []
+        ns_name = self.namespace[0]
+        while (parent := self._parent(node)) and (
+            found := self._find(ns_name, parent, "class")
+        ):
+            ns_name, type_name, node = found
+            if (ancestor := f"gi.repository.{ns_name}.{type_name}") in ancestors:
+                log.warning("Found a loop in the ancestors for %s", name)
+                break
+            ancestors.append(ancestor)
+        return ancestors
 
     def descendants(self, name) -> Iterable[str]:
-        if not (node := self._node(name)) or not isinstance(node, Class):
+        if not (node := self._node(name)) or self._kind(node) != "class":
             return []
 
-        return [f"gi.repository.{anc.fqtn}" for anc in node.descendants]
+        return [
+            f"gi.repository.{self.namespace[0]}.{cls}" for cls in self._subclasses(node)
+        ]
 
     def implements(self, name) -> list[str]:
-        if not (node := self._node(name)) or not isinstance(node, Class):
+        if not (node := self._node(name)) or self._kind(node) != "class":
             return []
 
-        return [f"gi.repository.{impl.fqtn}" for impl in node.implements]
+        return [f"gi.repository.{ns}.{iface}" for ns, iface in self._implements(node)]
 
     def implementations(self, name) -> list[str]:
-        if not (node := self._node(name)) or not isinstance(node, Interface):
+        if not (node := self._node(name)) or self._kind(node) != "interface":
             return []
 
-        return [f"gi.repository.{impl.fqtn}" for impl in node.implementations]
+        return [
+            f"gi.repository.{self.namespace[0]}.{cls}"
+            for cls in self._implementors(node)
+        ]
 
     def doc(self, name) -> str:
-        if not (obj := self._node(name)) or not obj.doc:
+        if not (obj := self._node(name)):
             return ""
 
-        return obj.doc.content or ""
+        return self._doc(obj)
 
     def parameter_doc(self, func_name, param_name):
-        if not (obj := self.repo.namespace.find_function(func_name)):
+        if not (obj := self._function(func_name)):
             return ""
 
-        param = next((p for p in obj.parameters if p.name == param_name), None)
-        if not param or not param.doc:
-            return ""
-
-        return param.doc.content or ""
+        return self._parameter_doc(obj, param_name)
 
     def return_doc(self, name) -> str:
-        if (
-            (obj := self.repo.namespace.find_function(name))
-            and obj.return_value
-            and obj.return_value.doc
-        ):
-            return obj.return_value.doc.content or ""
+        if obj := self._function(name):
+            return self._return_doc(obj)
 
         return ""
 
@@ -133,19 +292,19 @@ class Gir:
         if not (obj := self._node(name)):
             return None
 
-        return obj.deprecated_since
+        return self._deprecated(obj)
 
     def since(self, name) -> str | None:
         if not (obj := self._node(name)):
             return None
 
-        return obj.available_since
+        return self._since(obj)
 
     def struct_for(self, name) -> str | None:
         if not (obj := self._node(name)):
             return None
 
-        return obj.struct_for if isinstance(obj, Record) else None
+        return self._struct_for(obj) if self._kind(obj) == "record" else None
 
     def member(self, member_type, class_name, name):
         if "(" in name:
@@ -154,39 +313,29 @@ class Gir:
         if not (node := self._node(class_name)):
             return None
 
-        if member_type == "constructor":
-            return next((m for m in node.constructors if m.name == name), None)
         if member_type == "method":
-            return (
-                hasattr(node, "methods")
-                and next((m for m in node.methods if m.name == name), None)
-            ) or (
-                hasattr(node, "functions")
-                and next(
-                    (
-                        m
-                        for m in node.functions
-                        if m.name in (name, f"interface_{name}")
-                    ),
-                    None,
-                )
+            return self._member(node, "method", name) or (
+                self._member(node, "function", name)
+                or self._member(node, "function", f"interface_{name}")
             )
-        if member_type == "virtual-method":
-            return next((m for m in node.virtual_methods if m.name == name), None)
-        if member_type == "property":
-            return node.properties.get(name, None)
-        if member_type == "signal":
-            return node.signals.get(name, None)
         if member_type == "field":
-            if isinstance(node, Enumeration):
-                return next((m for m in node.members if m.name == name), "")
-            return next((m for m in node.fields if m.name == name), "")
+            kind = (
+                "member" if self._kind(node) in ("enumeration", "bitfield") else "field"
+            )
+            return self._member(node, kind, name) or ""
+        if member_type in (
+            "constructor",
+            "virtual-method",
+            "property",
+            "signal",
+        ):
+            return self._member(node, member_type, name)
 
         raise ValueError("Unhandled member type %s", member_type)
 
     def member_doc(self, member_type, class_name, name):
-        if (member := self.member(member_type, class_name, name)) and member.doc:
-            return member.doc.content or ""
+        if member := self.member(member_type, class_name, name):
+            return self._doc(member)
 
         return ""
 
@@ -194,13 +343,13 @@ class Gir:
         self, member_type, class_name, name
     ) -> tuple[str, str] | None:
         if member := self.member(member_type, class_name, name):
-            return member.deprecated_since
+            return self._deprecated(member)
 
         return None
 
     def member_since(self, member_type, class_name, name) -> tuple[str, str] | None:
         if member := self.member(member_type, class_name, name):
-            return member.available_since
+            return self._since(member)
 
         return None
 
@@ -208,99 +357,1093 @@ class Gir:
         if not (member := self.member(member_type, klass_name, member_name)):
             return
 
-        param = next((p for p in member.parameters if p.name == param_name), None)
-        if param and param.doc:
-            return param.doc.content or ""
-
-        return ""
+        return self._parameter_doc(member, param_name)
 
     def member_return_doc(self, member_type, klass_name, name):
-        if not (member := self.member(member_type, klass_name, name)):
+        if not self.member(member_type, klass_name, name):
             return ""
 
-        if (
-            (member := self.repo.namespace.find_function(name))
-            and member.return_value
-            and member.return_value.doc
-        ):
-            return member.return_value.doc.content or ""
+        # The function is looked up by name, as gi-docgen did
+        if member := self._function(name):
+            return self._return_doc(member)
 
         return ""
 
     def c_type(self, name: str) -> str | None:
-        def find(name: str):
-            for ts in self.repo.types.values():
-                for t in ts:
-                    ctype = getattr(t, "ctype", "")
-                    if ctype.startswith("const "):
-                        ctype = ctype[6:]
-                    while ctype.endswith("*"):
-                        ctype = ctype[:-1]
-                    if name == ctype:
-                        return t.fqtn
+        return symbol_table().c_type(name, self.libs)
+
+    def c_symbol(self, name: str) -> str | None:
+        return symbol_table().c_symbol(name, self.libs)
+
+    def c_const(self, name: str) -> str | None:
+        return symbol_table().c_const(name, self.libs)
+
+
+# Kinds of gi-docgen nodes, as GIR tags. Error domains are enumerations
+GIR_KINDS = (
+    (Class, "class"),
+    (Interface, "interface"),
+    (Record, "record"),
+    (BitField, "bitfield"),
+    (Enumeration, "enumeration"),
+)
+
+# Attributes of gi-docgen nodes with the members of a kind, in lists or by name
+GIR_MEMBERS = {
+    "constructor": "constructors",
+    "method": "methods",
+    "function": "functions",
+    "virtual-method": "virtual_methods",
+    "field": "fields",
+    "member": "members",
+    "property": "properties",
+    "signal": "signals",
+}
+
+
+class Gir(GirReader):
+    """A :class:`GirReader` backed by the repository parsed by gi-docgen."""
+
+    def __init__(self, gir_file: Path):
+        self.repo = _parse(gir_file)
+
+    @property
+    def namespace(self):
+        ns = self.repo.namespace
+        return ns.name, ns.version
+
+    @property
+    def dependencies(self):
+        return (
+            f"{r.namespace.name}-{r.namespace.version}"
+            for r in self.repo.includes.values()
+        )
+
+    def _type(self, ns_name: str, name: str) -> Type | None:
+        if ns_name == self.repo.namespace.name:
+            repo = self.repo
+        elif not (repo := self.repo.includes.get(ns_name)):
+            return None
+        return repo.namespace.find_real_type(name)
+
+    def _function(self, name: str) -> Function | None:
+        return self.repo.namespace.find_function(name)
+
+    def _member(self, node, kind: str, name: str):
+        members = getattr(node, GIR_MEMBERS[kind], None) or ()
+        if isinstance(members, dict):
+            return members.get(name)
+        return next((m for m in members if m.name == name), None)
+
+    def _subclasses(self, node) -> Iterable[str]:
+        return [cls.name.rpartition(".")[2] for cls in node.descendants]
+
+    def _implementors(self, node) -> Iterable[str]:
+        return [cls.name.rpartition(".")[2] for cls in node.implementations]
+
+    def _kind(self, node) -> str:
+        return next(
+            (kind for cls, kind in GIR_KINDS if isinstance(node, cls)),
+            type(node).__name__.lower(),
+        )
+
+    def _parent(self, node) -> str | None:
+        return node.parent.name if getattr(node, "parent", None) else None
+
+    def _implemented(self, node) -> Iterable[str]:
+        return [iface.name for iface in getattr(node, "implements", None) or ()]
+
+    def _struct_for(self, node) -> str | None:
+        return getattr(node, "struct_for", None)
+
+    def _doc(self, node) -> str:
+        return (node.doc and node.doc.content) or ""
+
+    def _parameter_doc(self, node, param_name) -> str:
+        params = getattr(node, "parameters", None) or ()
+        param = next((p for p in params if p.name == param_name), None)
+        return self._doc(param) if param else ""
+
+    def _return_doc(self, node) -> str:
+        if return_value := getattr(node, "return_value", None):
+            return self._doc(return_value)
+        return ""
+
+    def _deprecated(self, node) -> tuple[str, str] | None:
+        return node.deprecated_since
+
+    def _since(self, node) -> str | None:
+        return node.available_since
+
+
+CORE = f"{{{NS['']}}}"
+GLIB = f"{{{NS['glib']}}}"
+C = "{http://www.gtk.org/introspection/c/1.0}"
+
+SLIM_TYPE_KINDS = {
+    f"{CORE}{kind}": kind
+    for kind in (
+        "alias",
+        "bitfield",
+        "callback",
+        "constant",
+        "enumeration",
+        "class",
+        "interface",
+        "record",
+        "union",
+    )
+}
+
+SLIM_FUNCTION_KINDS = {
+    f"{CORE}function": "function",
+    f"{CORE}function-macro": "function-macro",
+}
+
+SLIM_MEMBER_KINDS = {
+    **{
+        f"{CORE}{kind}": kind
+        for kind in (
+            "constructor",
+            "method",
+            "function",
+            "virtual-method",
+            "property",
+            "field",
+            "member",
+        )
+    },
+    f"{GLIB}signal": "signal",
+}
+
+# Member kinds that C symbols can refer to
+SYMBOL_KINDS = ("constructor", "method", "function")
+
+DEFAULT_DEPRECATION = "Please do not use it in newly written code"
+
+DOC_TAGS = (f"{CORE}doc", f"{CORE}doc-deprecated")
+
+
+# Byte offsets of the text of a doc element in the GIR file
+Span = tuple[int, int]
+
+# Bump when the layout of the slim classes changes, to drop cached files
+SLIM_FORMAT = 1
+
+
+class SlimParameter:
+    __slots__ = ("name", "doc")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.doc: Span | None = None
+
+
+class SlimNode:
+    """A type, function or member, with only the fields the pages need.
+
+    Docs are kept as spans in the GIR file, see :meth:`SlimNamespace.text`.
+    """
+
+    __slots__ = (
+        "kind",
+        "name",
+        "identifier",
+        "ctype",
+        "parent",
+        "struct_for",
+        "moved_to",
+        "doc",
+        "deprecated_since",
+        "available_since",
+        "parameters",
+        "return_doc",
+        "implements",
+        "members",
+    )
+
+    def __init__(self, kind: str, attrib: dict[str, str]):
+        self.kind = kind
+        self.name: str = attrib.get("name") or attrib.get(f"{GLIB}name", "")
+        self.identifier = attrib.get(f"{C}identifier")
+        self.ctype = attrib.get(f"{C}type")
+        self.parent = attrib.get("parent")
+        self.struct_for = attrib.get(f"{GLIB}is-gtype-struct-for")
+        self.moved_to = attrib.get("moved-to")
+        self.doc: Span | None = None
+        # Version and the span of the deprecation message
+        self.deprecated_since: tuple[str, Span | None] | None = (
+            (attrib.get("deprecated-version") or "Unknown", None)
+            if "deprecated" in attrib
+            else None
+        )
+        self.available_since = attrib.get("version")
+        self.parameters: list[SlimParameter] = []
+        self.return_doc: Span | None = None
+        self.implements: list[str] = []
+        self.members: dict[str, dict[str, SlimNode]] = {}
+
+    def member(self, kind: str, name: str) -> SlimNode | None:
+        return self.members.get(kind, {}).get(name)
+
+
+class SlimNamespace:
+    """The documentation relevant parts of a GIR file."""
+
+    __slots__ = (
+        "path",
+        "name",
+        "version",
+        "includes",
+        "types",
+        "functions",
+        "ctypes",
+        "symbols",
+    )
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.name = ""
+        self.version = ""
+        self.includes: list[str] = []
+        self.types: dict[str, SlimNode] = {}
+        self.functions: dict[str, SlimNode] = {}
+        # C type (without pointers) to the qualified type name
+        self.ctypes: dict[str, str] = {}
+        # C symbol to (type name or None, function name)
+        self.symbols: dict[str, tuple[str | None, str]] = {}
+
+    def find_real_type(self, name: str) -> SlimNode | None:
+        return self.types.get(name)
+
+    def find_function(self, name: str) -> SlimNode | None:
+        return self.functions.get(name)
+
+    def qualify(self, name: str) -> tuple[str, str]:
+        ns, _, type_name = name.rpartition(".")
+        return ns or self.name, type_name
+
+    def text(self, span: Span | None) -> str:
+        """The text of a doc element, read from the memory mapped GIR file."""
+        if not span:
+            return ""
+        start, end = span
+        raw = _mapped(self.path)[start:end].decode("utf-8")
+        return html.unescape(raw.replace("\r\n", "\n"))
+
+
+@lru_cache(maxsize=None)
+def _mapped(gir_file: Path) -> mmap.mmap:
+    with gir_file.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _slim_cache_file(gir_file: Path) -> Path:
+    stat = gir_file.stat()
+    key = hashlib.sha256(
+        f"{SLIM_FORMAT}:{gir_file.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+    ).hexdigest()[:16]
+    return cache_dir("gir") / f"{gir_file.stem}-{key}.pickle"
+
+
+@lru_cache(maxsize=None)
+def read_slim(gir_file: Path) -> SlimNamespace:
+    """Read a GIR file into a :class:`SlimNamespace`.
+
+    The result is stored in the cache directory, and read from there as
+    long as the GIR file does not change.
+    """
+    cache_file = _slim_cache_file(gir_file)
+    try:
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        log.warning("Ignoring cached GIR index %s: %s", cache_file, e)
+
+    ns = _read_slim(gir_file)
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    with tmp_file.open("wb") as f:
+        pickle.dump(ns, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return ns
+
+
+def _read_slim(gir_file: Path) -> SlimNamespace:
+    """Stream a GIR file, keeping only the structure and the spans of docs."""
+    ns = SlimNamespace(gir_file)
+    # Objects per open element: the node, parameter or return value that
+    # docs inside the element belong to
+    owners: list = []
+    # Start of the text of the doc element being read
+    doc_start: int | None = None
+
+    parser = expat.ParserCreate(namespace_separator="}")
+
+    def doc_text(data):
+        nonlocal doc_start
+        if doc_start is None:
+            doc_start = parser.CurrentByteIndex
+
+    def start(name, attributes):
+        nonlocal doc_start
+        tag = f"{{{name}" if "}" in name else name
+        attrib = {
+            (f"{{{key}" if "}" in key else key): value
+            for key, value in attributes.items()
+        }
+        depth = len(owners)
+        parent = owners[-1] if owners else None
+        owner = None
+
+        if depth == 1 and tag == f"{CORE}namespace":
+            ns.name = attrib.get("name", "")
+            ns.version = attrib.get("version", "")
+        elif depth == 1 and tag == f"{CORE}include":
+            ns.includes.append(f"{attrib.get('name')}-{attrib.get('version')}")
+        elif depth == 2 and (kind := SLIM_TYPE_KINDS.get(tag)):
+            owner = SlimNode(kind, attrib)
+            ns.types.setdefault(owner.name, owner)
+            if owner.ctype:
+                ns.ctypes.setdefault(owner.ctype, f"{ns.name}.{owner.name}")
+        elif depth == 2 and (kind := SLIM_FUNCTION_KINDS.get(tag)):
+            owner = SlimNode(kind, attrib)
+            if kind == "function" or owner.name not in ns.functions:
+                ns.functions[owner.name] = owner
+            if owner.identifier:
+                ns.symbols[owner.identifier] = (None, owner.name)
+        elif (
+            depth == 3
+            and isinstance(parent, SlimNode)
+            and (kind := SLIM_MEMBER_KINDS.get(tag))
+        ):
+            owner = SlimNode(kind, attrib)
+            parent.members.setdefault(kind, {}).setdefault(owner.name, owner)
+            if kind in SYMBOL_KINDS and owner.identifier:
+                ns.symbols[owner.identifier] = (parent.name, owner.name)
+        elif tag == f"{CORE}implements" and isinstance(parent, SlimNode):
+            parent.implements.append(attrib.get("name", ""))
+        elif tag == f"{CORE}parameters" and isinstance(parent, SlimNode):
+            owner = ("parameters", parent)
+        elif tag == f"{CORE}parameter" and isinstance(parent, tuple):
+            owner = SlimParameter(attrib.get("name", ""))
+            parent[1].parameters.append(owner)
+        elif tag == f"{CORE}return-value" and isinstance(parent, SlimNode):
+            owner = ("return-value", parent)
+        elif tag == f"{CORE}type" and (ctype := attrib.get(f"{C}type")):
+            name = attrib.get("name", "")
+            if name in FUNDAMENTAL_TYPES:
+                name = GLIB_ALIASES.get(name, name)
+            elif name == "GType":
+                name = "GObject.Type"
+            elif "." not in name:
+                name = f"{ns.name}.{name}"
+            ns.ctypes.setdefault(ctype.replace("const ", "").rstrip("*"), name)
+        elif tag in DOC_TAGS:
+            # Only look at text while inside a doc element
+            doc_start = None
+            parser.CharacterDataHandler = doc_text
+
+        owners.append(owner)
+
+    def end(name):
+        tag = f"{{{name}" if "}" in name else name
+        owners.pop()
+        if tag not in DOC_TAGS:
+            return
+
+        parser.CharacterDataHandler = None
+        span = (doc_start, parser.CurrentByteIndex) if doc_start is not None else None
+        owner = owners[-1] if owners else None
+        if tag == f"{CORE}doc":
+            if isinstance(owner, (SlimNode, SlimParameter)):
+                owner.doc = span
+            elif isinstance(owner, tuple) and owner[0] == "return-value":
+                owner[1].return_doc = span
+        elif isinstance(owner, SlimNode) and owner.deprecated_since:
+            version, _ = owner.deprecated_since
+            owner.deprecated_since = (version, span)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    with gir_file.open("rb") as f:
+        parser.ParseFile(f)
+
+    # Functions that moved to a type are documented with the type
+    for name, func in list(ns.functions.items()):
+        if func.moved_to and func.moved_to.split(".")[0] in ns.types:
+            del ns.functions[name]
+
+    return ns
+
 
+SYMBOL_TABLES = ("ctypes", "symbols", "constants")
+
+SYMBOL_INDEX_MAGIC = b"PGDSYM01"
+
+# Keys looked up in symbol tables since record_lookups(), as (table, key)
+_lookups: set[tuple[str, str]] | None = None
+
+
+def record_lookups() -> None:
+    """Start recording the keys looked up in symbol tables."""
+    global _lookups
+    _lookups = set()
+
+
+def recorded_lookups() -> list[tuple[str, str]]:
+    """Stop recording, and return the keys looked up since, sorted."""
+    global _lookups
+    lookups, _lookups = _lookups or set(), None
+    return sorted(lookups)
+
+
+class SymbolLookups(abc.ABC):
+    """Lookups shared by :class:`SymbolTable` and :class:`SymbolIndex`.
+
+    Each name maps to the Python names it has in the libraries that define
+    it, as ``(library, python name)`` pairs. Lookups prefer the libraries
+    passed in, in order, then take the first library.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def entries(self, table: str, key: str) -> Sequence[tuple[str, str]]:
+        """The ``(library, python name)`` pairs of ``key`` in ``table``."""
+
+    def _find(self, table: str, key: str, libs: Iterable[str]) -> str | None:
+        if _lookups is not None:
+            _lookups.add((table, key))
+        if not (found := self.entries(table, key)):
+            return None
+        names = dict(found)
+        for lib in libs:
+            if name := names.get(lib):
+                return name
+        return found[0][1]
+
+    def c_type(self, name: str, libs: Iterable[str]) -> str | None:
+        libs = tuple(libs)
         if name == "NULL":
             return "None"
-        if maybe_type := find(name):
+        if maybe_type := self._find("ctypes", name, libs):
             return maybe_type
 
         # Deal with plurals:
-        if name.endswith("s") and (maybe_type := find(name[:-1])):
+        if name.endswith("s") and (maybe_type := self._find("ctypes", name[:-1], libs)):
             return maybe_type
 
         log.info("C type %s not found", name)
         return None
 
-    def c_symbol(self, name: str) -> str | None:
-        if not (symbol := self.repo.find_symbol(name)):
+    def c_symbol(self, name: str, libs: Iterable[str]) -> str | None:
+        if not (symbol := self._find("symbols", name, libs)):
             log.info("C symbol %s not found", name)
-            return None
+        return symbol
+
+    def c_const(self, name: str, libs: Iterable[str]) -> str | None:
+        if not (symbol := self._find("constants", name, libs)):
+            log.info("C constant %s not found", name)
+        return symbol
+
+
+class SymbolTable(SymbolLookups):
+    """C types, C symbols and C constants of GIR files, in dictionaries.
+
+    Used to build a :class:`SymbolIndex`.
+    """
+
+    __slots__ = SYMBOL_TABLES
+
+    def __init__(self):
+        self.ctypes: dict[str, tuple[tuple[str, str], ...]] = {}
+        self.symbols: dict[str, tuple[tuple[str, str], ...]] = {}
+        self.constants: dict[str, tuple[tuple[str, str], ...]] = {}
+
+    def entries(self, table: str, key: str) -> Sequence[tuple[str, str]]:
+        return getattr(self, table).get(key, ())
+
+    def add(self, lib: str, ns: SlimNamespace) -> None:
+        def add(table, key, name):
+            table[key] = (*table.get(key, ()), (lib, name))
+
+        for ctype, name in ns.ctypes.items():
+            add(self.ctypes, ctype, name)
+
+        for identifier, (type_name, func_name) in ns.symbols.items():
+            add(
+                self.symbols,
+                identifier,
+                f"{ns.name}.{type_name}.{func_name}"
+                if type_name
+                else f"{ns.name}.{func_name}",
+            )
 
-        ns, s = symbol
-        if isinstance(s, Type):
-            if method := next(
-                (
-                    m
-                    for m in chain(
-                        s.methods,
-                        s.functions,
-                        s.constructors if hasattr(s, "constructors") else [],
-                    )
-                    if m.identifier == name
-                ),
-                None,
-            ):
-                return f"{ns.name}.{s.name}.{method.name}"
+        # Later definitions win within a library
+        constants = {}
+        for node in ns.types.values():
+            if node.kind == "constant" and node.ctype:
+                constants[node.ctype] = f"{ns.name}.{node.name.upper()}"
+            elif node.kind in ("enumeration", "bitfield"):
+                for member in node.members.get("member", {}).values():
+                    if member.identifier:
+                        constants[member.identifier] = (
+                            f"{ns.name}.{node.name}.{member.name.upper()}"
+                        )
+        for identifier, name in constants.items():
+            add(self.constants, identifier, name)
+
+    def write(self, path: Path) -> None:
+        """Write the table in the format read by :class:`SymbolIndex`.
+
+        The file starts with a magic string and, per table, the position and
+        length of its array of record offsets. Records are ``key\\0library\\0
+        name\\0``, sorted by key. Offset arrays are native 64 bit integers.
+        """
+        header_size = len(SYMBOL_INDEX_MAGIC) + 16 * len(SYMBOL_TABLES)
+        with path.open("wb") as f:
+            f.write(bytes(header_size))
+            arrays = []
+            for table in SYMBOL_TABLES:
+                offsets = array("Q")
+                entries = getattr(self, table)
+                for key in sorted(entries):
+                    for lib, name in entries[key]:
+                        offsets.append(f.tell())
+                        f.write(f"{key}\0{lib}\0{name}\0".encode())
+                arrays.append(offsets)
+
+            header = array("Q")
+            for offsets in arrays:
+                f.write(bytes(-f.tell() % offsets.itemsize))
+                header.extend((f.tell(), len(offsets)))
+                offsets.tofile(f)
+
+            f.seek(0)
+            f.write(SYMBOL_INDEX_MAGIC)
+            header.tofile(f)
+
+
+class SymbolIndex(SymbolLookups):
+    """A symbol table file, memory mapped.
+
+    Lookups are binary searches in the mapped file. Processes that map the
+    same file share one copy of it in the page cache.
+    """
+
+    __slots__ = ("_map", "_offsets")
+
+    def __init__(self, path: Path):
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start = len(SYMBOL_INDEX_MAGIC)
+        if self._map[:start] != SYMBOL_INDEX_MAGIC:
+            raise ValueError(f"{path} is not a symbol index")
+
+        view = memoryview(self._map)
+        header = view[start : start + 16 * len(SYMBOL_TABLES)].cast("Q")
+        self._offsets = {
+            table: view[position : position + 8 * length].cast("Q")
+            for table, position, length in zip(
+                SYMBOL_TABLES, header[::2], header[1::2], strict=True
+            )
+        }
+
+    def _field(self, offset: int) -> tuple[bytes, int]:
+        end = self._map.find(b"\0", offset)
+        return self._map[offset:end], end + 1
+
+    def entries(self, table: str, key: str) -> Sequence[tuple[str, str]]:
+        offsets = self._offsets[table]
+        target = key.encode()
+
+        low, high = 0, len(offsets)
+        while low < high:
+            middle = (low + high) // 2
+            if self._field(offsets[middle])[0] < target:
+                low = middle + 1
             else:
-                raise RuntimeError("Field not found %s %s", s, name)
-        elif isinstance(s, (Function, FunctionMacro)):
-            return f"{ns.name}.{s.name}"
+                high = middle
+
+        entries = []
+        for offset in offsets[low:]:
+            found, offset = self._field(offset)
+            if found != target:
+                break
+            lib, offset = self._field(offset)
+            name, _ = self._field(offset)
+            entries.append((lib.decode(), name.decode()))
+        return entries
+
+
+def all_gir_files() -> dict[str, Path]:
+    """All installed GIR files, by library; the first directory wins."""
+    gir_files: dict[str, Path] = {}
+    for gir_dir in gir_dirs():
+        for gir_file in sorted(gir_dir.glob("*.gir")):
+            gir_files.setdefault(gir_file.stem, gir_file)
+    return gir_files
 
-        raise RuntimeError("Unexpected type for %s", s)
 
-    def c_const(self, name: str) -> str | None:
-        if not (symbol := self._constants.get(name)):
-            log.info("C constant %s not found", name)
+def gir_files_key(gir_files: dict[str, Path], *extra: str) -> str:
+    """A short key for data derived from GIR files.
+
+    It changes when a file is added, removed or changed.
+    """
+    key = hashlib.sha256(f"{SLIM_FORMAT}:{':'.join(extra)}".encode())
+    for lib, gir_file in gir_files.items():
+        stat = gir_file.stat()
+        key.update(f"{lib}:{gir_file}:{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+    return key.hexdigest()[:16]
+
+
+def symbol_table_key() -> str:
+    """The key of the symbol index, it changes along with any GIR file."""
+    return gir_files_key(all_gir_files(), SYMBOL_INDEX_MAGIC.decode())
+
+
+@lru_cache(maxsize=None)
+def symbol_table() -> SymbolIndex:
+    """The symbol index of all installed GIR files.
+
+    It is built once, and kept in the cache directory until a GIR file is
+    added, removed or changed.
+    """
+    index_file = cache_dir("gir") / f"symbols-{symbol_table_key()}.idx"
+
+    if not index_file.exists():
+        table = SymbolTable()
+        for lib, gir_file in all_gir_files().items():
+            table.add(lib, read_slim(gir_file))
+        tmp_file = index_file.with_name(f".{index_file.name}.{os.getpid()}.tmp")
+        table.write(tmp_file)
+        os.replace(tmp_file, index_file)
+
+    return SymbolIndex(index_file)
+
+
+class SlimGir(GirReader):
+    """A :class:`GirReader` backed by :func:`read_slim`.
+
+    Slim namespaces are small, so they are cached, as are the namespaces
+    they include.
+    """
+
+    def __init__(self, gir_file: Path):
+        self.ns = read_slim(gir_file)
+        self.includes: dict[str, SlimNamespace] = {}
+        self._read_includes(self.ns)
+
+    def _read_includes(self, ns: SlimNamespace) -> None:
+        for lib in ns.includes:
+            name, version = lib.rsplit("-", 1)
+            if name in self.includes or not (gir_file := find_gir_file(name, version)):
+                continue
+            included = read_slim(gir_file)
+            self._read_includes(included)
+            self.includes[name] = included
+
+    @property
+    def namespace(self):
+        return self.ns.name, self.ns.version
+
+    @property
+    def dependencies(self):
+        return (f"{ns.name}-{ns.version}" for ns in self.includes.values())
+
+    def _type(self, ns_name: str, name: str) -> SlimNode | None:
+        ns = self.ns if ns_name == self.ns.name else self.includes.get(ns_name)
+        return ns.find_real_type(name) if ns else None
+
+    def _function(self, name: str) -> SlimNode | None:
+        return self.ns.find_function(name)
+
+    def _member(self, node: SlimNode, kind: str, name: str) -> SlimNode | None:
+        return node.member(kind, name)
+
+    def _subclasses(self, node: SlimNode) -> Iterable[str]:
+        return [
+            cls.name
+            for cls in self.ns.types.values()
+            if cls.kind == "class" and cls.parent == node.name
+        ]
+
+    def _implementors(self, node: SlimNode) -> Iterable[str]:
+        return [
+            cls.name
+            for cls in self.ns.types.values()
+            if cls.kind == "class"
+            and (self.ns.name, node.name) in self._implements(cls)
+        ]
+
+    def _kind(self, node: SlimNode) -> str:
+        return node.kind
+
+    def _parent(self, node: SlimNode) -> str | None:
+        return node.parent
+
+    def _implemented(self, node: SlimNode) -> Iterable[str]:
+        return node.implements
+
+    def _struct_for(self, node: SlimNode) -> str | None:
+        return node.struct_for
+
+    def _doc(self, node: SlimNode) -> str:
+        return self.ns.text(node.doc)
+
+    def _parameter_doc(self, node: SlimNode, param_name) -> str:
+        param = next((p for p in node.parameters if p.name == param_name), None)
+        return self.ns.text(param and param.doc)
+
+    def _return_doc(self, node: SlimNode) -> str:
+        return self.ns.text(node.return_doc)
+
+    def _deprecated(self, node: SlimNode) -> tuple[str, str] | None:
+        if not node.deprecated_since:
             return None
 
-        ns, t, m = symbol
-        return (
-            f"{ns.name}.{t.name}.{m.name.upper()}"
-            if t
-            else f"{ns.name}.{m.name.upper()}"
+        version, span = node.deprecated_since
+        return version, self.ns.text(span) or DEFAULT_DEPRECATION
+
+    def _since(self, node: SlimNode) -> str | None:
+        return node.available_since
+
+
+# Bump when the schema changes, to rebuild the database
+DB_SCHEMA_VERSION = 1
+
+DB_SCHEMA = """
+CREATE TABLE files (
+    lib TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE includes (
+    lib TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    include TEXT NOT NULL,
+    PRIMARY KEY (lib, position)
+);
+CREATE TABLE nodes (
+    id INTEGER PRIMARY KEY,
+    lib TEXT NOT NULL,
+    owner INTEGER,
+    scope TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    identifier TEXT,
+    ctype TEXT,
+    parent TEXT,
+    struct_for TEXT,
+    doc TEXT NOT NULL,
+    deprecated_version TEXT,
+    deprecated_message TEXT,
+    available_since TEXT,
+    return_doc TEXT NOT NULL
+);
+CREATE INDEX nodes_by_name ON nodes (lib, scope, name);
+CREATE INDEX nodes_by_parent ON nodes (lib, kind, parent);
+CREATE INDEX members ON nodes (owner, kind, name);
+CREATE INDEX nodes_by_identifier ON nodes (identifier);
+CREATE TABLE parameters (
+    node INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    doc TEXT NOT NULL,
+    PRIMARY KEY (node, position)
+);
+CREATE TABLE implements (
+    node INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (node, position)
+);
+CREATE TABLE ctypes (
+    lib TEXT NOT NULL,
+    ctype TEXT NOT NULL,
+    type_name TEXT NOT NULL,
+    PRIMARY KEY (lib, ctype)
+);
+CREATE TABLE symbols (
+    lib TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    type_name TEXT,
+    function_name TEXT NOT NULL,
+    PRIMARY KEY (lib, identifier)
+);
+"""
+
+INSERT_NODE = """
+INSERT INTO nodes (
+    lib, owner, scope, kind, name, identifier, ctype, parent, struct_for,
+    doc, deprecated_version, deprecated_message, available_since, return_doc
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _insert_node(db, lib: str, ns: SlimNamespace, node: SlimNode, scope, owner=None):
+    version, message = node.deprecated_since or (None, None)
+    node_id = db.execute(
+        INSERT_NODE,
+        (
+            lib,
+            owner,
+            scope,
+            node.kind,
+            node.name,
+            node.identifier,
+            node.ctype,
+            node.parent,
+            node.struct_for,
+            ns.text(node.doc),
+            version,
+            ns.text(message) if version else None,
+            node.available_since,
+            ns.text(node.return_doc),
+        ),
+    ).lastrowid
+    db.executemany(
+        "INSERT INTO parameters VALUES (?, ?, ?, ?)",
+        ((node_id, i, p.name, ns.text(p.doc)) for i, p in enumerate(node.parameters)),
+    )
+    db.executemany(
+        "INSERT INTO implements VALUES (?, ?, ?)",
+        ((node_id, i, name) for i, name in enumerate(node.implements)),
+    )
+    for members in node.members.values():
+        for member in members.values():
+            _insert_node(db, lib, ns, member, "member", node_id)
+
+
+def _delete_lib(db, lib: str) -> None:
+    for table in ("parameters", "implements"):
+        db.execute(
+            f"DELETE FROM {table} WHERE node IN (SELECT id FROM nodes WHERE lib = ?)",
+            (lib,),
+        )
+    for table in ("nodes", "includes", "ctypes", "symbols", "files"):
+        db.execute(f"DELETE FROM {table} WHERE lib = ?", (lib,))
+
+
+def _insert_lib(db, lib: str, gir_file: Path, stat, digest: str) -> None:
+    ns = _read_slim(gir_file)
+    db.execute(
+        "INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+        (lib, str(gir_file), stat.st_size, stat.st_mtime_ns, digest),
+    )
+    db.executemany(
+        "INSERT INTO includes VALUES (?, ?, ?)",
+        ((lib, i, include) for i, include in enumerate(ns.includes)),
+    )
+    for node in ns.types.values():
+        _insert_node(db, lib, ns, node, "type")
+    for node in ns.functions.values():
+        _insert_node(db, lib, ns, node, "function")
+    db.executemany(
+        "INSERT INTO ctypes VALUES (?, ?, ?)",
+        ((lib, ctype, name) for ctype, name in ns.ctypes.items()),
+    )
+    db.executemany(
+        "INSERT INTO symbols VALUES (?, ?, ?, ?)",
+        ((lib, ident, t, f) for ident, (t, f) in ns.symbols.items()),
+    )
+
+
+def compile_database(path: Path) -> Path:
+    """Compile all GIR files in :func:`gir_dirs` into a SQLite database.
+
+    Only libraries whose GIR file changed, by content hash, are compiled
+    again. Libraries that are no longer installed are removed.
+    """
+    gir_files = all_gir_files()
+
+    db = sqlite3.connect(path, isolation_level=None)
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        if db.execute("PRAGMA user_version").fetchone()[0] != DB_SCHEMA_VERSION:
+            for (table,) in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            ).fetchall():
+                db.execute(f"DROP TABLE {table}")
+            for statement in DB_SCHEMA.split(";"):
+                db.execute(statement)
+            db.execute(f"PRAGMA user_version = {DB_SCHEMA_VERSION}")
+
+        known = {
+            lib: (gir_path, size, mtime, digest)
+            for lib, gir_path, size, mtime, digest in db.execute("SELECT * FROM files")
+        }
+        for lib in known.keys() - gir_files.keys():
+            _delete_lib(db, lib)
+
+        for lib, gir_file in gir_files.items():
+            stat = gir_file.stat()
+            old = known.get(lib)
+            if old and old[:3] == (str(gir_file), stat.st_size, stat.st_mtime_ns):
+                continue
+            digest = _file_hash(gir_file)
+            if old and old[0] == str(gir_file) and old[3] == digest:
+                db.execute(
+                    "UPDATE files SET size = ?, mtime = ? WHERE lib = ?",
+                    (stat.st_size, stat.st_mtime_ns, lib),
+                )
+                continue
+            log.info("Compiling %s into the GIR database", lib)
+            _delete_lib(db, lib)
+            _insert_lib(db, lib, gir_file, stat, digest)
+        db.execute("COMMIT")
+    except BaseException:
+        if db.in_transaction:
+            db.execute("ROLLBACK")
+        raise
+    finally:
+        db.close()
+        # Docs have been copied, no need to keep the files mapped
+        _mapped.cache_clear()
+
+    return path
+
+
+@lru_cache(maxsize=None)
+def gir_database() -> Path:
+    """The GIR database in the cache directory, compiled when out of date."""
+    return compile_database(cache_dir() / "gir.sqlite")
+
+
+@lru_cache(maxsize=None)
+def _db_connection(path: Path, pid: int) -> sqlite3.Connection:
+    # One read-only connection per process: connections can not be shared
+    # with forked processes
+    db = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    db.row_factory = sqlite3.Row
+    return db
+
+
+class DbGir(GirReader):
+    """A :class:`GirReader` backed by the GIR database.
+
+    Nothing is loaded up front; every lookup is a query. The database is
+    only read, it is compiled beforehand by :func:`compile_database`.
+    """
+
+    def __init__(self, gir_file: Path, database: Path):
+        self.db = _db_connection(database, os.getpid())
+        self.name, self.version = gir_file.stem.rsplit("-", 1)
+        self.includes: dict[str, str] = {}
+        self._read_includes(gir_file.stem)
+
+    def _read_includes(self, lib: str) -> None:
+        for (include,) in self.db.execute(
+            "SELECT include FROM includes WHERE lib = ? ORDER BY position", (lib,)
+        ):
+            name = include.rsplit("-", 1)[0]
+            if name in self.includes or not self._exists(include):
+                continue
+            self._read_includes(include)
+            self.includes[name] = include
+
+    def _exists(self, lib: str) -> bool:
+        return bool(
+            self.db.execute("SELECT 1 FROM files WHERE lib = ?", (lib,)).fetchone()
         )
 
-    def _resolve_constants(self):
-        constants = {}
-        ns = self.repo.namespace
+    @property
+    def namespace(self):
+        return self.name, self.version
 
-        for const in ns.get_constants():
-            constants[const.ctype] = (ns, None, const)
+    @property
+    def dependencies(self):
+        return (lib for lib in self.includes.values())
 
-        for type in chain(
-            ns.get_enumerations(), ns.get_bitfields(), ns.get_error_domains()
-        ):
-            for member in type.members:
-                constants[member.identifier] = (ns, type, member)
+    def _type(self, ns_name: str, name: str) -> sqlite3.Row | None:
+        lib = self.lib if ns_name == self.name else self.includes.get(ns_name)
+        if not lib:
+            return None
+        return self.db.execute(
+            "SELECT * FROM nodes WHERE lib = ? AND scope = 'type' AND name = ?",
+            (lib, name),
+        ).fetchone()
+
+    def _function(self, name: str) -> sqlite3.Row | None:
+        return self.db.execute(
+            "SELECT * FROM nodes WHERE lib = ? AND scope = 'function' AND name = ?",
+            (self.lib, name),
+        ).fetchone()
+
+    def _member(self, node: sqlite3.Row, kind: str, name: str) -> sqlite3.Row | None:
+        return self.db.execute(
+            "SELECT * FROM nodes WHERE owner = ? AND kind = ? AND name = ?",
+            (node["id"], kind, name),
+        ).fetchone()
+
+    def _subclasses(self, node: sqlite3.Row) -> Iterable[str]:
+        return [
+            cls_name
+            for (cls_name,) in self.db.execute(
+                "SELECT name FROM nodes WHERE lib = ? AND kind = 'class'"
+                " AND scope = 'type' AND parent = ? ORDER BY id",
+                (self.lib, node["name"]),
+            )
+        ]
+
+    def _implementors(self, node: sqlite3.Row) -> Iterable[str]:
+        # Implemented interfaces of the same namespace may be unqualified
+        return [
+            cls_name
+            for (cls_name,) in self.db.execute(
+                "SELECT nodes.name FROM nodes"
+                " JOIN implements ON implements.node = nodes.id"
+                " WHERE nodes.lib = ? AND nodes.scope = 'type'"
+                " AND nodes.kind = 'class' AND implements.name IN (?, ?)"
+                " GROUP BY nodes.id ORDER BY nodes.id",
+                (self.lib, node["name"], f"{self.name}.{node['name']}"),
+            )
+        ]
+
+    def _kind(self, node: sqlite3.Row) -> str:
+        return node["kind"]
+
+    def _parent(self, node: sqlite3.Row) -> str | None:
+        return node["parent"]
+
+    def _implemented(self, node: sqlite3.Row) -> Iterable[str]:
+        return [
+            name
+            for (name,) in self.db.execute(
+                "SELECT name FROM implements WHERE node = ? ORDER BY position",
+                (node["id"],),
+            )
+        ]
+
+    def _struct_for(self, node: sqlite3.Row) -> str | None:
+        return node["struct_for"]
+
+    def _doc(self, node: sqlite3.Row) -> str:
+        return node["doc"]
+
+    def _parameter_doc(self, node: sqlite3.Row, param_name) -> str:
+        row = self.db.execute(
+            "SELECT doc FROM parameters WHERE node = ? AND name = ? ORDER BY position",
+            (node["id"], param_name),
+        ).fetchone()
+        return row["doc"] if row else ""
+
+    def _return_doc(self, node: sqlite3.Row) -> str:
+        return node["return_doc"]
+
+    def _deprecated(self, node: sqlite3.Row) -> tuple[str, str] | None:
+        if not (version := node["deprecated_version"]):
+            return None
+
+        return version, node["deprecated_message"] or DEFAULT_DEPRECATION
 
-        return constants
+    def _since(self, node: sqlite3.Row) -> str | None:
+        return node["available_since"]
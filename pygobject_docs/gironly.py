@@ -0,0 +1,715 @@
+"""Generate pages from the GIR file alone, without importing the library.
+
+Importing libraries like WebKit or Gst loads large native libraries and
+runs their initialization. For such libraries, categories, members and
+Python signatures can be derived from the GIR file instead, following the
+rules PyGObject applies when it wraps a library. The result is close to,
+but not the same as, what introspection of the imported library gives.
+
+To see where both differ for a library::
+
+    python -m pygobject_docs.gironly WebKit-6.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from gidocgen.gir import (
+    ArrayType,
+    Callable,
+    Class,
+    Constant,
+    Enumeration,
+    ListType,
+    MapType,
+    Parameter,
+    Type,
+    VarArgs,
+)
+
+from pygobject_docs import overrides
+from pygobject_docs.category import Category
+from pygobject_docs.doc import rstify
+from pygobject_docs.gir import Gir, find_gir_file
+from pygobject_docs.hierarchy import INLINE_LIMIT
+from pygobject_docs.inspect import is_ref_unref_copy_or_steal_function
+from pygobject_docs.model import Page, model_path, read_model
+from pygobject_docs.render import (
+    render_chunks,
+    render_class_page,
+    render_page,
+    section_pages,
+)
+
+log = logging.getLogger(__name__)
+
+# Type names as gi-docgen registers them, it renames some GLib types
+INT_TYPES = {
+    "char",
+    "gchar",
+    "guchar",
+    "short",
+    "gshort",
+    "gushort",
+    "int",
+    "gint",
+    "guint",
+    "long",
+    "glong",
+    "gulong",
+    "gint8",
+    "guint8",
+    "gint16",
+    "guint16",
+    "gint32",
+    "guint32",
+    "gint64",
+    "guint64",
+    "gsize",
+    "gssize",
+    "goffset",
+    "gintptr",
+    "guintptr",
+}
+
+FUNDAMENTAL_TYPES = {
+    "none": "None",
+    "gboolean": "bool",
+    "float": "float",
+    "gfloat": "float",
+    "double": "float",
+    "gdouble": "float",
+    "utf8": "str",
+    "filename": "str",
+    "gchar*": "str",
+    "gunichar": "str",
+    "GType": "~gi.repository.GObject.GType",
+    "GObject.Type": "~gi.repository.GObject.GType",
+    **dict.fromkeys(INT_TYPES, "int"),
+}
+
+# Parameters that PyGObject handles for async functions
+ASYNC_PARAMETERS = ("cancellable", "callback", "user_data")
+
+# Arguments of pages that list members, and the position of the signature
+MEMBER_LISTS = {
+    "functions": 1,
+    "constants": None,
+    "constructors": 1,
+    "fields": None,
+    "methods": 1,
+    "properties": 1,
+    "signals": 1,
+    "virtual_methods": 1,
+}
+
+
+def python_type(target: Type | None, nullable: bool = False) -> str:
+    """The Python annotation for a GIR type."""
+    if target is None or isinstance(target, VarArgs):
+        annotation = "~typing.Any"
+    elif isinstance(target, ArrayType):
+        value_type = target.value_type
+        if value_type is not None and value_type.name in ("guint8", "gint8", "char"):
+            annotation = "bytes"
+        else:
+            annotation = f"list[{python_type(value_type)}]"
+    elif isinstance(target, ListType):
+        annotation = f"list[{python_type(target.value_type)}]"
+    elif isinstance(target, MapType):
+        annotation = (
+            f"dict[{python_type(target.key_type)}, {python_type(target.value_type)}]"
+        )
+    elif target.name in FUNDAMENTAL_TYPES:
+        annotation = FUNDAMENTAL_TYPES[target.name]
+    elif target.is_fundamental:
+        annotation = "~typing.Any"
+    elif fqtn := target.fqtn:
+        annotation = f"~gi.repository.{fqtn}"
+    else:
+        annotation = "~typing.Any"
+
+    return f"{annotation} | None" if nullable and annotation != "None" else annotation
+
+
+def _hidden_parameters(parameters: list[Parameter]) -> set[int]:
+    """Indices of parameters PyGObject fills in itself."""
+    hidden = set()
+    for i, param in enumerate(parameters):
+        if param.destroy >= 0:
+            hidden.add(param.destroy)
+        if param.closure >= 0 and param.closure != i:
+            hidden.add(param.closure)
+        if isinstance(param.target, ArrayType) and param.target.length >= 0:
+            hidden.add(param.target.length)
+    return hidden
+
+
+def python_parameters(
+    func: Callable,
+) -> tuple[list[Parameter], list[Parameter]]:
+    """In and out parameters, as they appear in Python."""
+    hidden = _hidden_parameters(func.parameters)
+    visible = [
+        p
+        for i, p in enumerate(func.parameters)
+        if i not in hidden and not isinstance(p.target, VarArgs)
+    ]
+    return (
+        [p for p in visible if p.direction in ("in", "inout")],
+        [p for p in visible if p.direction in ("out", "inout")],
+    )
+
+
+def _returns(func: Callable, outs: list[Parameter]) -> str:
+    returns = []
+    if (ret := func.return_value) and ret.target.name != "none":
+        returns.append(python_type(ret.target, ret.nullable))
+    returns.extend(python_type(p.target, p.nullable) for p in outs)
+
+    if not returns:
+        return "None"
+    if len(returns) == 1:
+        return returns[0]
+    return f"tuple[{', '.join(returns)}]"
+
+
+def python_signature(
+    func: Callable,
+    is_async: bool = False,
+    finish: Callable | None = None,
+) -> str:
+    """The signature of a callable, as Sphinx would render it."""
+    ins, outs = python_parameters(func)
+    if is_async:
+        ins = [p for p in ins if p.name not in ASYNC_PARAMETERS]
+
+    params = []
+    defaults = True
+    for param in reversed(ins):
+        optional = param.nullable or param.optional
+        defaults = defaults and optional
+        default = " = None" if defaults else ""
+        params.append(f"{param.name}: {python_type(param.target, optional)}{default}")
+
+    if is_async and finish:
+        _, finish_outs = python_parameters(finish)
+        returns = _returns(finish, finish_outs)
+    else:
+        returns = _returns(func, outs)
+
+    return f"({', '.join(reversed(params))}) -> {returns}"
+
+
+def categories(gir: Gir) -> dict[Category, list[str]]:
+    """Names per category, like :func:`category.determine_category` would give."""
+    ns = gir.repo.namespace
+
+    def names(types: Iterable[Type]) -> list[str]:
+        return sorted(t.name for t in types if t.introspectable)
+
+    return {
+        Category.Functions: sorted(
+            f.name
+            for f in ns.get_functions()
+            if f.introspectable
+            and not f.shadowed_by
+            and not is_ref_unref_copy_or_steal_function(f.name)
+        ),
+        Category.Classes: names(ns.get_classes()),
+        Category.Interfaces: names(ns.get_interfaces()),
+        Category.Structures: names(
+            r
+            for r in ns.get_records()
+            if not r.struct_for and not r.name.endswith("Private")
+        ),
+        Category.Unions: names(ns.get_unions()),
+        Category.Enums: names(
+            [*ns.get_enumerations(), *ns.get_bitfields(), *ns.get_error_domains()]
+        ),
+        Category.Constants: names(ns.get_constants()),
+    }
+
+
+def _custom_doc(namespace: str, class_name: str | None, name: str) -> str | None:
+    if override := overrides.find(namespace, class_name, name):
+        return override.docstring
+    return None
+
+
+def _custom_signature(namespace: str, class_name: str | None, name: str) -> str | None:
+    if (override := overrides.find(namespace, class_name, name)) and override.signature:
+        return str(override.signature)
+    return None
+
+
+def _deprecated(gir: Gir, node) -> tuple[str, str] | None:
+    if depr := node.deprecated_since:
+        version, message = depr
+        return version, rstify(message, gir=gir)
+    return None
+
+
+def _doc(gir: Gir, node, image_base_url="") -> str:
+    return rstify(
+        (node.doc and node.doc.content) or "", gir=gir, image_base_url=image_base_url
+    )
+
+
+def _callable_entry(gir, namespace, class_name, func, image_base_url, **kwargs):
+    doc = _custom_doc(namespace, class_name, func.name) or _doc(
+        gir, func, image_base_url
+    )
+    ins, _ = python_parameters(func)
+    parameters = (
+        []
+        if ":param " in doc
+        else [(p.name, _doc(gir, p, image_base_url)) for p in ins]
+    )
+    ret = func.return_value
+    return_doc = "" if ":return" in doc or not ret else _doc(gir, ret, image_base_url)
+    return (
+        func.name,
+        _custom_signature(namespace, class_name, func.name)
+        or python_signature(func, **kwargs),
+        doc,
+        parameters,
+        return_doc,
+    )
+
+
+def _is_visible(func: Callable) -> bool:
+    return (
+        func.introspectable
+        and not func.shadowed_by
+        and not is_ref_unref_copy_or_steal_function(func.name)
+    )
+
+
+def _constant_value(const: Constant) -> str:
+    if const.target.name == "gboolean":
+        return "True" if const.value == "true" else "False"
+    return const.value
+
+
+class GirPages:
+    """Write the pages of a library from its GIR file.
+
+    Pages are tracked like the import-based pages, when a tracker is given.
+    Their fingerprints differ from those, as the pages do.
+    """
+
+    def __init__(
+        self,
+        namespace,
+        version,
+        out_path: Path,
+        image_base_url="",
+        split_threshold=None,
+        chunking=None,
+        hierarchy=None,
+        hierarchy_limit=INLINE_LIMIT,
+    ):
+        self.namespace = namespace
+        self.version = version
+        self.out_path = out_path
+        self.image_base_url = image_base_url
+        self.split_threshold = split_threshold
+        self.chunking = chunking
+        # Subclasses and implementations from all generated libraries, if known
+        self.graph = hierarchy and hierarchy.library(
+            f"{namespace}-{version}", hierarchy_limit
+        )
+        if not (gir_file := find_gir_file(namespace, version)):
+            raise FileNotFoundError(f"No GIR file found for {namespace}-{version}")
+        # The types of parameters are needed, so always use gi-docgen
+        self.gir = gir = Gir(gir_file)
+        self.categories = categories(gir)
+
+    def generate(self, model=None, tracker=None, hierarchy=False) -> None:
+        """Write all pages. ``hierarchy`` tells if there is a hierarchy page."""
+        overrides.load_overrides(self.namespace)
+        self.out_path.mkdir(parents=True, exist_ok=True)
+
+        self.functions(model, tracker)
+        for category in (
+            Category.Classes,
+            Category.Interfaces,
+            Category.Structures,
+            Category.Unions,
+            Category.Enums,
+        ):
+            self.classes(category, model, tracker)
+        self.constants(model, tracker)
+        self.index(model, tracker, hierarchy)
+
+    def functions(self, model=None, tracker=None) -> None:
+        page = self.out_path / "functions.rst"
+        if tracker and tracker.skip(
+            page, "functions", extra=self._extra(*self._chunking_extra())
+        ):
+            return
+
+        if not (names := self.categories[Category.Functions]):
+            return
+
+        ns = self.gir.repo.namespace
+
+        def function(name):
+            func = ns.find_function(name)
+            return (
+                *_callable_entry(
+                    self.gir, self.namespace, None, func, self.image_base_url
+                ),
+                _deprecated(self.gir, func),
+                func.available_since,
+            )
+
+        parts = render_chunks(
+            "functions.j2",
+            page,
+            model,
+            self.chunking,
+            names,
+            function,
+            "Functions",
+            namespace=self.namespace,
+            version=self.version,
+        )
+
+        if tracker:
+            tracker.done(page, parts)
+
+    def constants(self, model=None, tracker=None) -> None:
+        page = self.out_path / "constants.rst"
+        if tracker and tracker.skip(
+            page, "constants", extra=self._extra(*self._chunking_extra())
+        ):
+            return
+
+        if not (names := self.categories[Category.Constants]):
+            return
+
+        constants = {c.name: c for c in self.gir.repo.namespace.get_constants()}
+
+        def constant(name):
+            const = constants[name]
+            return (
+                name,
+                _constant_value(const),
+                _doc(self.gir, const),
+                _deprecated(self.gir, const),
+                const.available_since,
+            )
+
+        parts = render_chunks(
+            "constants.j2",
+            page,
+            model,
+            self.chunking,
+            names,
+            constant,
+            "Constants",
+            namespace=self.namespace,
+            version=self.version,
+        )
+
+        if tracker:
+            tracker.done(page, parts)
+
+    def _extra(self, *inputs: str) -> list[str]:
+        """Extra fingerprint inputs of a page, see :meth:`Tracker.skip`."""
+        return ["gir-only", *inputs]
+
+    def _chunking_extra(self) -> list[str]:
+        return [repr(self.chunking)] if self.chunking else []
+
+    def classes(self, category: Category, model=None, tracker=None) -> None:
+        if not (names := self.categories[category]):
+            return
+
+        for name in names:
+            page = self.out_path / f"{category.single}-{name}.rst"
+            extra = self._extra(
+                *(self.graph.fingerprint(name) if self.graph else ()),
+                *([repr(self.split_threshold)] if self.split_threshold else ()),
+            )
+            if tracker and tracker.skip(page, "class", name, extra):
+                continue
+
+            self.class_page(category, name, model)
+
+            if tracker:
+                tracker.done(page, section_pages(page))
+
+        render_page(
+            "classes.j2",
+            self.out_path / f"{category}.rst",
+            model,
+            namespace=self.namespace,
+            version=self.version,
+            entity_type=category.title(),
+            prefix=category.single,
+        )
+
+    def class_page(self, category: Category, class_name: str, model=None) -> dict:
+        gir = self.gir
+        node = gir.repo.namespace.find_real_type(class_name)
+        namespace = self.namespace
+
+        def entry(func, **kwargs):
+            return _callable_entry(
+                gir, namespace, class_name, func, self.image_base_url, **kwargs
+            )
+
+        if category == Category.Enums:
+            class_signature = ""
+        elif isinstance(node, Class) and not node.fundamental:
+            class_signature = "(**properties: ~typing.Any)"
+        else:
+            class_signature = "(*args, **kwargs)"
+
+        methods = []
+        for method, is_static in sorted(
+            [
+                *((m, False) for m in getattr(node, "methods", [])),
+                *((f, True) for f in getattr(node, "functions", [])),
+            ],
+            key=lambda m: m[0].name,
+        ):
+            if not _is_visible(method):
+                continue
+            tail = (_deprecated(gir, method), method.available_since)
+            if method.finish_func:
+                finish = next(
+                    (m for m in node.methods if m.name == method.finish_func), None
+                )
+                name, sig, _, parameters, return_doc = entry(
+                    method, is_async=True, finish=finish
+                )
+                methods.append(
+                    (name, sig, "", parameters, return_doc, is_static, True, *tail)
+                )
+            methods.append((*entry(method), is_static, False, *tail))
+
+        graph = self.graph or gir
+        descendants, more_descendants = graph.descendants(class_name), 0
+        implementations, more_implementations = graph.implementations(class_name), 0
+        if self.graph:
+            descendants, more_descendants = self.graph.compact(descendants)
+            implementations, more_implementations = self.graph.compact(implementations)
+
+        if isinstance(node, Enumeration):
+            fields = [
+                (
+                    member.name.upper(),
+                    _doc(gir, member, self.image_base_url),
+                    _deprecated(gir, member),
+                    member.available_since,
+                )
+                for member in node.members
+            ]
+        else:
+            fields = [
+                (
+                    field.name,
+                    _doc(gir, field, self.image_base_url),
+                    _deprecated(gir, field),
+                    field.available_since,
+                )
+                for field in getattr(node, "fields", [])
+                if field.readable and not field.private
+            ]
+
+        arguments = {
+            "class_name": class_name,
+            "class_signature": class_signature,
+            "namespace": namespace,
+            "version": self.version,
+            "entity_type": category.single.title(),
+            "doc": _custom_doc(namespace, None, class_name)
+            or _doc(gir, node, self.image_base_url),
+            "deprecated": _deprecated(gir, node),
+            "since": node.available_since,
+            "ancestors": gir.ancestors(class_name),
+            "descendants": descendants,
+            "more_descendants": more_descendants,
+            "implements": gir.implements(class_name),
+            "implementations": implementations,
+            "more_implementations": more_implementations,
+            "constructors": [
+                (*entry(c), _deprecated(gir, c), c.available_since)
+                for c in sorted(getattr(node, "constructors", []), key=lambda c: c.name)
+                if _is_visible(c)
+            ],
+            "fields": sorted(fields),
+            "methods": methods,
+            "properties": [
+                (
+                    prop.name,
+                    python_type(prop.target),
+                    _doc(gir, prop, self.image_base_url),
+                    _deprecated(gir, prop),
+                    prop.available_since,
+                )
+                for prop in sorted(
+                    getattr(node, "properties", {}).values(), key=lambda p: p.name
+                )
+            ],
+            "signals": [
+                (*entry(signal), _deprecated(gir, signal), signal.available_since)
+                for signal in sorted(
+                    getattr(node, "signals", {}).values(), key=lambda s: s.name
+                )
+            ],
+            "virtual_methods": [
+                (
+                    f"do_{vfunc.name}",
+                    *entry(vfunc)[1:],
+                    _deprecated(gir, vfunc),
+                    vfunc.available_since,
+                )
+                for vfunc in sorted(
+                    getattr(node, "virtual_methods", []), key=lambda v: v.name
+                )
+                if vfunc.introspectable
+            ],
+        }
+
+        render_class_page(
+            self.out_path / f"{category.single}-{class_name}.rst",
+            model,
+            arguments,
+            self.split_threshold,
+        )
+        return arguments
+
+    def index(self, model=None, tracker=None, hierarchy=False) -> None:
+        page = self.out_path / "index.rst"
+        if tracker and tracker.skip(
+            page, "index", extra=self._extra(*(["hierarchy"] if hierarchy else ()))
+        ):
+            return
+
+        constants = {c.name: c.value for c in self.gir.repo.namespace.get_constants()}
+        library_version = (
+            ".".join(
+                constants.get(part, "0")
+                for part in ("MAJOR_VERSION", "MINOR_VERSION", "MICRO_VERSION")
+            )
+            if "MAJOR_VERSION" in constants
+            else "-"
+        )
+
+        render_page(
+            "index.j2",
+            page,
+            model,
+            namespace=self.namespace,
+            version=self.version,
+            library_version=library_version,
+            c_api_doc_link=self.image_base_url,
+            dependencies=self.gir.dependencies,
+            classes=bool(self.categories[Category.Classes]),
+            interfaces=bool(self.categories[Category.Interfaces]),
+            structures=bool(self.categories[Category.Structures]),
+            unions=bool(self.categories[Category.Unions]),
+            enums=bool(self.categories[Category.Enums]),
+            functions=bool(self.categories[Category.Functions]),
+            constants=bool(self.categories[Category.Constants]),
+            hierarchy=hierarchy,
+            init_function="init" in self.categories[Category.Functions],
+        )
+
+        if tracker:
+            tracker.done(page)
+
+
+def _members(page: Page) -> dict[str, dict[str, str | None]]:
+    """Member names per list, with their signature."""
+    members = {}
+    for key, position in MEMBER_LISTS.items():
+        if key in page.arguments:
+            members[key] = {
+                entry[0]: entry[position] if position else None
+                for entry in page.arguments[key]
+            }
+    return members
+
+
+def compare(reference: Iterable[Page], candidate: Iterable[Page]) -> list[str]:
+    """Where the pages from the GIR file differ from the import-based pages."""
+    expected = {page.page: page for page in reference}
+    actual = {page.page: page for page in candidate}
+    report = []
+
+    for name in sorted(expected.keys() - actual.keys()):
+        report.append(f"{name}: missing")
+    for name in sorted(actual.keys() - expected.keys()):
+        report.append(f"{name}: extra")
+
+    for name in sorted(expected.keys() & actual.keys()):
+        exp, act = _members(expected[name]), _members(actual[name])
+        for key in exp.keys() | act.keys():
+            exp_members, act_members = exp.get(key, {}), act.get(key, {})
+            for member in sorted(exp_members.keys() - act_members.keys()):
+                report.append(f"{name}: {key} {member}: missing")
+            for member in sorted(act_members.keys() - exp_members.keys()):
+                report.append(f"{name}: {key} {member}: extra")
+            for member in sorted(exp_members.keys() & act_members.keys()):
+                if exp_members[member] != act_members[member]:
+                    report.append(
+                        f"{name}: {key} {member}: "
+                        f"{exp_members[member]} != {act_members[member]}"
+                    )
+
+    return report
+
+
+def compare_library(namespace: str, version: str) -> list[str]:
+    """Generate a library both ways, and compare the results."""
+    from pygobject_docs.generate import generate
+    from pygobject_docs.model import ModelWriter
+
+    lib = f"{namespace}-{version}"
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        generate(namespace, version, tmp_path / "import", model_dir=tmp_path / "import")
+        gir_path = tmp_path / "gir" / lib
+        with ModelWriter(model_path(tmp_path / "gir", lib), gir_path) as model:
+            GirPages(namespace, version, gir_path).generate(model)
+
+        return compare(
+            read_model(model_path(tmp_path / "import", lib)),
+            read_model(model_path(tmp_path / "gir", lib)),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare pages generated from GIR files with the import-based pages"
+    )
+    parser.add_argument("libraries", nargs="+", help="libraries, like WebKit-6.0")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    from pygobject_docs.inspect import patch_gi_overrides
+
+    patch_gi_overrides()
+
+    differences = 0
+    for lib in args.libraries:
+        report = compare_library(*lib.split("-"))
+        print(f"{lib}: {len(report)} differences")
+        for line in report:
+            print(f"  {line}")
+        differences += len(report)
+
+    sys.exit(1 if differences else 0)
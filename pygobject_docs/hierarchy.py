@@ -0,0 +1,342 @@
+"""The class hierarchy of all generated libraries.
+
+A class page lists the subclasses and implementations of a type from every
+library that is generated, not only from its own namespace. The graph is
+computed once per set of libraries, from the slim GIR namespaces, and
+stored in the cache directory. Worker processes load it from there.
+
+Types are interned as integer ids. Edges are kept as adjacency arrays:
+per type, a range in a flat array of type ids.
+"""
+
+import logging
+import os
+import pickle
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from pygobject_docs.cache import cache_dir
+from pygobject_docs.gir import (
+    SlimNamespace,
+    all_gir_files,
+    find_gir_file,
+    gir_files_key,
+    read_slim,
+)
+
+log = logging.getLogger(__name__)
+
+CLASS = 1
+INTERFACE = 2
+
+# Longer lists of subclasses and implementations are cut short on class
+# pages, and given in full on the hierarchy page of the namespace. The
+# default of ``--hierarchy-limit``, 0 shows all of them on class pages.
+INLINE_LIMIT = 25
+
+KINDS = {"class": CLASS, "interface": INTERFACE}
+
+
+def _adjacency(lists: Sequence[list[int]]) -> tuple[array, array]:
+    starts = array("I", [0])
+    targets = array("I")
+    for targets_of in lists:
+        targets.extend(targets_of)
+        starts.append(len(targets))
+    return starts, targets
+
+
+class Hierarchy:
+    """Classes and interfaces of a set of libraries, and how they relate.
+
+    Ancestors and implemented interfaces are followed into included
+    libraries. Descendants and implementations only come from the
+    libraries the hierarchy was built for.
+    """
+
+    def __init__(self):
+        self.libs: list[str] = []
+        # Per library: the namespace name
+        self.namespaces: list[str] = []
+        # Per type: library index, name and kind
+        self.type_lib = array("H")
+        self.type_names: list[str] = []
+        self.kinds = array("b")
+        # Per type: the parent class, or -1
+        self.parents = array("i")
+        self.children = _adjacency([])
+        self.interfaces = _adjacency([])
+        self.implementers = _adjacency([])
+        self._ids: dict[tuple[str, str], int] = {}
+
+    @classmethod
+    def build(cls, libraries: Iterable[str]) -> "Hierarchy":
+        hierarchy = cls()
+        generated = set(libraries)
+
+        namespaces: dict[str, SlimNamespace] = {}
+        include_maps: dict[str, dict[str, str]] = {}
+
+        def load(lib: str) -> dict[str, str] | None:
+            """Read a library and what it includes, by namespace name."""
+            if lib in include_maps:
+                return include_maps[lib]
+            if not (gir_file := find_gir_file(*lib.rsplit("-", 1))):
+                return None
+            ns = namespaces[lib] = read_slim(gir_file)
+            include_maps[lib] = includes = {}
+            for include in ns.includes:
+                name = include.rsplit("-", 1)[0]
+                if name in includes:
+                    continue
+                if (nested := load(include)) is not None:
+                    for nested_name, nested_lib in nested.items():
+                        includes.setdefault(nested_name, nested_lib)
+                    includes[name] = include
+            includes[ns.name] = lib
+            return includes
+
+        for lib in libraries:
+            if load(lib) is None:
+                log.warning("No GIR file found for %s", lib)
+
+        for lib, ns in namespaces.items():
+            lib_index = len(hierarchy.libs)
+            hierarchy.libs.append(lib)
+            hierarchy.namespaces.append(ns.name)
+            for node in ns.types.values():
+                if kind := KINDS.get(node.kind):
+                    hierarchy._ids[lib, node.name] = len(hierarchy.type_names)
+                    hierarchy.type_lib.append(lib_index)
+                    hierarchy.type_names.append(node.name)
+                    hierarchy.kinds.append(kind)
+
+        def resolve(lib: str, name: str, kind: int) -> int:
+            ns_name, _, type_name = name.rpartition(".")
+            target = include_maps[lib].get(ns_name) if ns_name else lib
+            type_id = hierarchy._ids.get((target, type_name), -1) if target else -1
+            return type_id if type_id >= 0 and hierarchy.kinds[type_id] == kind else -1
+
+        count = len(hierarchy.type_names)
+        children: list[list[int]] = [[] for _ in range(count)]
+        interfaces: list[list[int]] = [[] for _ in range(count)]
+        implementers: list[list[int]] = [[] for _ in range(count)]
+        for (lib, name), type_id in hierarchy._ids.items():
+            node = namespaces[lib].types[name]
+            parent = (
+                resolve(lib, node.parent, CLASS)
+                if node.parent and node.kind == "class"
+                else -1
+            )
+            hierarchy.parents.append(parent)
+            if node.kind != "class":
+                continue
+            if parent >= 0 and lib in generated:
+                children[parent].append(type_id)
+            for iface_name in node.implements:
+                if (iface := resolve(lib, iface_name, INTERFACE)) >= 0:
+                    interfaces[type_id].append(iface)
+                    if lib in generated:
+                        implementers[iface].append(type_id)
+
+        hierarchy.children = _adjacency(children)
+        hierarchy.interfaces = _adjacency(interfaces)
+        hierarchy.implementers = _adjacency(implementers)
+        return hierarchy
+
+    def save(self, path: Path) -> None:
+        state = {
+            name: getattr(self, name)
+            for name in (
+                "libs",
+                "namespaces",
+                "type_lib",
+                "type_names",
+                "kinds",
+                "parents",
+                "children",
+                "interfaces",
+                "implementers",
+            )
+        }
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "Hierarchy":
+        hierarchy = cls()
+        with path.open("rb") as f:
+            for name, value in pickle.load(f).items():
+                setattr(hierarchy, name, value)
+        hierarchy._ids = {
+            (hierarchy.libs[lib_index], name): type_id
+            for type_id, (lib_index, name) in enumerate(
+                zip(hierarchy.type_lib, hierarchy.type_names, strict=True)
+            )
+        }
+        return hierarchy
+
+    def _python_name(self, type_id: int) -> str:
+        namespace = self.namespaces[self.type_lib[type_id]]
+        return f"gi.repository.{namespace}.{self.type_names[type_id]}"
+
+    def _type(self, lib: str, name: str, kind: int) -> int:
+        type_id = self._ids.get((lib, name), -1)
+        return type_id if type_id >= 0 and self.kinds[type_id] == kind else -1
+
+    def _edges(self, adjacency: tuple[array, array], type_id: int) -> list[int]:
+        starts, targets = adjacency
+        return targets[starts[type_id] : starts[type_id + 1]].tolist()
+
+    def _own_first(self, lib: str, type_ids: list[int]) -> list[str]:
+        lib_index = self.libs.index(lib)
+        return [
+            self._python_name(type_id)
+            for type_id in sorted(
+                type_ids, key=lambda type_id: self.type_lib[type_id] != lib_index
+            )
+        ]
+
+    def ancestors(self, lib: str, name: str) -> list[str]:
+        if (type_id := self._type(lib, name, CLASS)) < 0:
+            return []
+
+        ancestors: list[int] = []
+        while (type_id := self.parents[type_id]) >= 0:
+            if type_id in ancestors:
+                log.warning("Found a loop in the ancestors for %s", name)
+                break
+            ancestors.append(type_id)
+        return [self._python_name(type_id) for type_id in ancestors]
+
+    def descendants(self, lib: str, name: str) -> list[str]:
+        if (type_id := self._type(lib, name, CLASS)) < 0:
+            return []
+
+        return self._own_first(lib, self._edges(self.children, type_id))
+
+    def implements(self, lib: str, name: str) -> list[str]:
+        if (type_id := self._type(lib, name, CLASS)) < 0:
+            return []
+
+        return [
+            self._python_name(iface) for iface in self._edges(self.interfaces, type_id)
+        ]
+
+    def implementations(self, lib: str, name: str) -> list[str]:
+        if (type_id := self._type(lib, name, INTERFACE)) < 0:
+            return []
+
+        return self._own_first(lib, self._edges(self.implementers, type_id))
+
+    def tree(self, lib: str, name: str) -> list[tuple[int, str]]:
+        """All subclasses, depth first, as ``(depth, python name)``."""
+        if (type_id := self._type(lib, name, CLASS)) < 0:
+            return []
+
+        tree = []
+        seen = {type_id}
+        stack = [(0, child) for child in reversed(self._edges(self.children, type_id))]
+        while stack:
+            depth, child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            tree.append((depth, self._python_name(child)))
+            stack.extend(
+                (depth + 1, grandchild)
+                for grandchild in reversed(self._edges(self.children, child))
+            )
+        return tree
+
+    def crowded(self, lib: str, limit: int = INLINE_LIMIT) -> list[str]:
+        """Types of a library with more than ``limit`` relations of a kind."""
+        if not limit or lib not in self.libs:
+            return []
+
+        lib_index = self.libs.index(lib)
+        return [
+            self.type_names[type_id]
+            for type_id in range(len(self.type_names))
+            if self.type_lib[type_id] == lib_index
+            and max(
+                len(self._edges(self.children, type_id)),
+                len(self._edges(self.implementers, type_id)),
+            )
+            > limit
+        ]
+
+    def library(self, lib: str, limit: int = INLINE_LIMIT) -> "LibraryHierarchy":
+        return LibraryHierarchy(self, lib, limit)
+
+
+class LibraryHierarchy:
+    """The hierarchy as seen from one library, with the API of :class:`Gir`.
+
+    Class pages list up to ``limit`` subclasses and implementations.
+    """
+
+    def __init__(self, hierarchy: Hierarchy, lib: str, limit: int = INLINE_LIMIT):
+        self.hierarchy = hierarchy
+        self.lib = lib
+        self.limit = limit
+
+    def ancestors(self, name) -> list[str]:
+        return self.hierarchy.ancestors(self.lib, name)
+
+    def descendants(self, name) -> list[str]:
+        return self.hierarchy.descendants(self.lib, name)
+
+    def implements(self, name) -> list[str]:
+        return self.hierarchy.implements(self.lib, name)
+
+    def implementations(self, name) -> list[str]:
+        return self.hierarchy.implementations(self.lib, name)
+
+    def tree(self, name) -> list[tuple[int, str]]:
+        return self.hierarchy.tree(self.lib, name)
+
+    def crowded(self) -> list[str]:
+        return self.hierarchy.crowded(self.lib, self.limit)
+
+    def compact(self, names: list[str]) -> tuple[list[str], int]:
+        return compact(names, self.limit)
+
+    def fingerprint(self, name) -> list[str]:
+        """Everything a class page shows of the hierarchy, for the tracker."""
+        return [
+            str(self.limit),
+            *self.ancestors(name),
+            "",
+            *self.descendants(name),
+            "",
+            *self.implements(name),
+            "",
+            *self.implementations(name),
+        ]
+
+
+def compact(names: list[str], limit: int = INLINE_LIMIT) -> tuple[list[str], int]:
+    """The names to show inline, and how many are left out."""
+    if not limit or len(names) <= limit:
+        return names, 0
+    return names[:limit], len(names) - limit
+
+
+def hierarchy_file(libraries: Iterable[str]) -> Path:
+    """The stored hierarchy of ``libraries``, built if needed."""
+    libraries = sorted(set(libraries))
+    key = gir_files_key(all_gir_files(), *libraries)
+    path = cache_dir("gir") / f"hierarchy-{key}.pickle"
+    if not path.exists():
+        Hierarchy.build(libraries).save(path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def load_hierarchy(path: Path) -> Hierarchy:
+    return Hierarchy.load(path)
@@ -0,0 +1,455 @@
+"""Skip pages whose inputs have not changed since the previous run.
+
+Each page gets a fingerprint: a hash over everything the page is generated
+from. That is:
+
+- the GIR elements documented on the page,
+- the structure of the namespace (names, C identifiers, type hierarchy),
+  without documentation, since references in docs are resolved against it,
+- the GIR files included by the namespace,
+- the entries of the symbol table the page looked up when it was last
+  generated, since references in docs are resolved against any library,
+- the typelib and the PyGObject override module of the namespace,
+- documentation overrides registered for the namespace,
+- the template, and the generator itself.
+
+Fingerprints of generated pages are stored in a manifest in the output
+directory of the namespace. Pages split off a page, like chunks and class
+sections, are generated along with it: the manifest lists them as its parts.
+The manifest also lists the symbol table keys each page looked up.
+"""
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import logging
+import os
+import xml.etree.ElementTree as etree
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from gi.module import repository
+
+from pygobject_docs import output, overrides
+from pygobject_docs.gir import (
+    find_gir_file,
+    gir_includes,
+    record_lookups,
+    recorded_lookups,
+    symbol_table,
+)
+
+# Bump to regenerate all pages, regardless of their inputs
+GENERATOR_VERSION = 1
+
+TEMPLATES = {
+    "functions": "functions.j2",
+    "constants": "constants.j2",
+    "class": "class-detail.j2",
+    "index": "index.j2",
+    "hierarchy": "hierarchy.j2",
+}
+
+CORE = "{http://www.gtk.org/introspection/core/1.0}"
+C = "{http://www.gtk.org/introspection/c/1.0}"
+GLIB = "{http://www.gtk.org/introspection/glib/1.0}"
+
+# Attributes that make up the structure of a namespace
+STRUCTURE_ATTRIBUTES = (
+    "name",
+    f"{GLIB}name",
+    f"{C}identifier",
+    f"{C}type",
+    "parent",
+)
+
+log = logging.getLogger(__name__)
+
+
+def _digest(*parts: bytes | str) -> bytes:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.digest()
+
+
+def _file_digest(path: Path | str | None) -> bytes:
+    return _digest(Path(path).read_bytes()) if path else b""
+
+
+def _typelib_path(namespace: str, version: str) -> Path | None:
+    """The typelib of a namespace, without loading it."""
+    if (
+        namespace in repository.get_loaded_namespaces()
+        and repository.get_version(namespace) == version
+    ):
+        return Path(repository.get_typelib_path(namespace))
+
+    # Next to the typelibs of the core libraries, unless the path says otherwise
+    typelib_dirs = [
+        *filter(None, os.environ.get("GI_TYPELIB_PATH", "").split(os.pathsep)),
+        *(
+            Path(repository.get_typelib_path(core)).parent
+            for core in ("GLib",)
+            if core in repository.get_loaded_namespaces()
+        ),
+    ]
+    for typelib_dir in typelib_dirs:
+        if (path := Path(typelib_dir) / f"{namespace}-{version}.typelib").exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def generator_digest() -> bytes:
+    """The generator code, and the versions of the libraries it relies on."""
+
+    def version(dist):
+        try:
+            return importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            return ""
+
+    package = Path(__file__).parent
+    return _digest(
+        str(GENERATOR_VERSION),
+        *(
+            version(dist)
+            for dist in ("PyGObject", "gi-docgen", "sphinx", "jinja2", "markdown")
+        ),
+        *(
+            _file_digest(path)
+            for path in sorted(package.glob("*.py"))
+            if not path.name.startswith(("overrides", "conf"))
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def template_digest(template_name: str) -> bytes:
+    return _file_digest(Path(__file__).parent / "templates" / template_name)
+
+
+def _includes(gir_file: Path) -> list[Path]:
+    return [
+        path
+        for lib in gir_includes(gir_file)
+        if (path := find_gir_file(*lib.rsplit("-", 1)))
+    ]
+
+
+def _include_closure(gir_file: Path) -> list[Path]:
+    seen: dict[Path, None] = {}
+    todo = list(_includes(gir_file))
+    while todo:
+        if (path := todo.pop()) not in seen:
+            seen[path] = None
+            todo.extend(_includes(path))
+    return sorted(seen)
+
+
+class Fingerprints:
+    """Fingerprints for the pages of one namespace."""
+
+    def __init__(self, namespace: str, version: str):
+        self.namespace = namespace
+        self.version = version
+        self._nodes: dict[str, bytes] = {}
+        self._kinds: dict[str, list[bytes]] = {}
+        structure = hashlib.sha256()
+
+        if gir_file := find_gir_file(namespace, version):
+            self._read_gir(gir_file, structure)
+
+        self._structure = structure.digest()
+        self._common = common_digest(namespace, version)
+
+    def _read_gir(self, gir_file: Path, structure) -> None:
+        depth = 0
+        for event, element in etree.iterparse(gir_file, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+
+            depth -= 1
+            # repository > namespace > type or function
+            if depth != 2:
+                continue
+
+            name = element.get("name") or element.get(f"{GLIB}name") or ""
+            kind = element.tag.rsplit("}", 1)[-1]
+            self._nodes[name] = node = _digest(etree.tostring(element))
+            self._kinds.setdefault(kind, []).append(node)
+            for el in element.iter():
+                if el.tag.endswith("}doc") or el.tag.endswith("}doc-deprecated"):
+                    continue
+                structure.update(
+                    _digest(
+                        el.tag, *(el.get(attr) or "" for attr in STRUCTURE_ATTRIBUTES)
+                    )
+                )
+            element.clear()
+
+    def page(
+        self, kind: str, name: str | None = None, extra: Iterable[str] = ()
+    ) -> str:
+        match kind:
+            case "functions":
+                nodes = [
+                    *self._kinds.get("function", []),
+                    *self._kinds.get("function-macro", []),
+                ]
+            case "constants":
+                nodes = self._kinds.get("constant", [])
+            case "class":
+                nodes = [self._nodes.get(name or "", b"")]
+            case "index" | "hierarchy":
+                nodes = []
+            case _:
+                raise ValueError(f"Unknown page kind {kind}")
+
+        return _digest(
+            self._common,
+            self._structure,
+            template_digest(TEMPLATES[kind]),
+            *nodes,
+            *extra,
+        ).hex()
+
+
+class Manifest:
+    """Fingerprints of the pages generated for a namespace.
+
+    Parts of a page are stored by their path relative to the output directory,
+    symbol table lookups as ``[table, key]`` pairs.
+    """
+
+    FILENAME = ".manifest.json"
+
+    def __init__(self, out_path: Path):
+        self.out_path = out_path
+        self.path = out_path / self.FILENAME
+        self._pages: dict[str, str] = {}
+        self._parts: dict[str, list[str]] = {}
+        self._lookups: dict[str, list[list[str]]] = {}
+        try:
+            manifest = json.loads(self.path.read_text())
+            self._pages, self._parts, self._lookups = (
+                manifest["pages"],
+                manifest["parts"],
+                manifest["lookups"],
+            )
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            pass
+
+    def is_current(self, page: Path, fingerprint: str) -> bool:
+        return (
+            self._pages.get(page.name) == fingerprint
+            and page.exists()
+            and all(
+                (self.out_path / part).exists()
+                for part in self._parts.get(page.name, ())
+            )
+        )
+
+    def lookups(self, page: Path) -> list[tuple[str, str]]:
+        return [(table, key) for table, key in self._lookups.get(page.name, ())]
+
+    def update(
+        self,
+        page: Path,
+        fingerprint: str,
+        parts: Iterable[Path] = (),
+        lookups: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        self._pages[page.name] = fingerprint
+        if names := [part.relative_to(self.out_path).as_posix() for part in parts]:
+            self._parts[page.name] = names
+        else:
+            self._parts.pop(page.name, None)
+        if keys := [[table, key] for table, key in lookups]:
+            self._lookups[page.name] = keys
+        else:
+            self._lookups.pop(page.name, None)
+
+    def remove(self, page: Path) -> None:
+        self._pages.pop(page.name, None)
+        self._parts.pop(page.name, None)
+        self._lookups.pop(page.name, None)
+
+    def save(self) -> None:
+        manifest = {
+            "pages": self._pages,
+            "parts": self._parts,
+            "lookups": self._lookups,
+        }
+        output.write(self.path, [json.dumps(manifest, indent=1, sort_keys=True)])
+
+
+class Journal:
+    """Append-only record of completed units of work.
+
+    A unit is a page of a namespace, or a whole namespace (page ``""``).
+    Records are appended as soon as a unit is done, so they survive if the
+    run is killed. With ``resume``, units recorded by a previous, interrupted
+    run are considered done, as long as their fingerprint did not change.
+    """
+
+    FILENAME = ".journal"
+
+    def __init__(self, out_path: Path, resume: bool = False):
+        self.path = out_path / self.FILENAME
+        self._done: set[tuple[str, str, str]] = set()
+
+        if resume:
+            self._load()
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                unit, page, fingerprint = json.loads(line)
+            except ValueError:
+                # The last record may be cut off
+                continue
+            self._done.add((unit, page, fingerprint))
+
+        log.info("Resuming, %d units completed already", len(self._done))
+
+    def completed(self, unit: str, page: str, fingerprint: str) -> bool:
+        return (unit, page, fingerprint) in self._done
+
+    def record(self, unit: str, page: str, fingerprint: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps([unit, page, fingerprint]) + "\n"
+        # One write per record, so records of parallel workers do not mix
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def finish(self) -> None:
+        """The run is complete, there is nothing left to resume."""
+        self.path.unlink(missing_ok=True)
+
+
+def common_digest(namespace: str, version: str) -> bytes:
+    """The inputs of all pages of a namespace, other than its GIR file."""
+    gir_file = find_gir_file(namespace, version)
+    gi_override = importlib.util.find_spec(f"gi.overrides.{namespace}")
+    overrides.load_overrides(namespace)
+    return _digest(
+        generator_digest(),
+        _file_digest(_typelib_path(namespace, version)),
+        _file_digest(gi_override and gi_override.origin),
+        *(
+            _file_digest(path)
+            for path in (_include_closure(gir_file) if gir_file else [])
+        ),
+        *(
+            f"{key}{entry.signature}{entry.docstring}"
+            for key, entry in overrides.entries(namespace)
+        ),
+    )
+
+
+def namespace_fingerprint(namespace: str, version: str) -> str:
+    """Fingerprint of a namespace as a whole.
+
+    Cheaper than :class:`Fingerprints`: it does not import the namespace or
+    parse its GIR file, it hashes the same inputs though.
+    """
+    return _digest(
+        common_digest(namespace, version),
+        _file_digest(find_gir_file(namespace, version)),
+        *(template_digest(template) for template in TEMPLATES.values()),
+    ).hex()
+
+
+def _with_lookups(fingerprint: str, lookups: list[tuple[str, str]]) -> str:
+    """Add the current symbol table entries of ``lookups`` to a fingerprint."""
+    if not lookups:
+        return fingerprint
+    table = symbol_table()
+    return _digest(
+        fingerprint,
+        *(
+            json.dumps([name, key, [list(e) for e in table.entries(name, key)]])
+            for name, key in lookups
+        ),
+    ).hex()
+
+
+class Tracker:
+    """Decide which pages of a namespace need to be generated.
+
+    Call :meth:`skip` before a page is generated, and :meth:`done` once it
+    has been written.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        version: str,
+        out_path: Path,
+        journal: Journal | None = None,
+        incremental: bool = True,
+        options: Iterable[str] = (),
+    ):
+        self.unit = f"{namespace}-{version}"
+        self.fingerprints = Fingerprints(namespace, version)
+        self.manifest = Manifest(out_path)
+        self.journal = journal
+        self.incremental = incremental
+        # Options that change every page, like the rendering of constants
+        self.options = list(options)
+        self.skipped = 0
+        self._pending: dict[Path, str] = {}
+
+    def skip(
+        self, page: Path, kind: str, name: str | None = None, extra: Iterable[str] = ()
+    ) -> bool:
+        """Whether ``page`` is up to date.
+
+        ``extra`` are inputs of the page from outside its namespace. The
+        symbol table entries the page looked up last time are inputs too.
+        """
+        base = self.fingerprints.page(kind, name, [*extra, *self.options])
+        fingerprint = _with_lookups(base, self.manifest.lookups(page))
+        if (self.incremental and self.manifest.is_current(page, fingerprint)) or (
+            self.journal
+            and self.journal.completed(self.unit, page.name, fingerprint)
+            and page.exists()
+        ):
+            log.debug("Page %s is up to date", page)
+            self.skipped += 1
+            return True
+
+        self._pending[page] = base
+        record_lookups()
+        return False
+
+    def done(self, page: Path, parts: Iterable[Path] = ()) -> None:
+        """``page`` has been written, along with ``parts`` split off it."""
+        lookups = recorded_lookups()
+        fingerprint = _with_lookups(self._pending.pop(page), lookups)
+        self.manifest.update(page, fingerprint, parts, lookups)
+        if self.journal:
+            self.journal.record(self.unit, page.name, fingerprint)
+
+    def removed(self, page: Path) -> None:
+        """``page`` is no longer generated."""
+        self.manifest.remove(page)
+
+    def save(self) -> None:
+        self.manifest.save()
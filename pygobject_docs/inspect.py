@@ -83,14 +83,14 @@ def custom_docstring(subject: Callable | None) -> str | None:
     except AttributeError:
         return None
 
-    if key and (fun := getattr(overrides, key, None)) and (doc := getdoc(fun)):
-        return "\n".join(prepare_docstring(doc))
+    if override := overrides.lookup(key):
+        return override.docstring
     return None
 
 
 def signature(subject: Callable, bound=False, is_async=False) -> Signature:
-    if fun := getattr(overrides, _override_key(subject), None):
-        return sphinx_signature(fun)
+    if (override := overrides.lookup(_override_key(subject))) and override.signature:
+        return override.signature
 
     return (
         async_signature(subject, bound=False)
@@ -111,10 +111,10 @@ def vfunc_signature(subject: Callable) -> Signature:
     return sig.replace(parameters=list(sig.parameters.values())[2:])
 
 
-def _override_key(subject):
+def _override_key(subject) -> overrides.OverrideKey | None:
     if hasattr(subject, "__module__"):
-        return f"{subject.__module__}_{subject.__name__}".replace(".", "_")
+        return (subject.__module__, None, subject.__name__)
     elif ocls := getattr(subject, "__objclass__", None):
-        return f"{ocls.__module__}_{ocls.__name__}_{subject.__name__}".replace(".", "_")
+        return (ocls.__module__, ocls.__name__, subject.__name__)
 
     return None
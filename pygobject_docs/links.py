@@ -0,0 +1,223 @@
+"""Replace cross-references by links to the documented objects.
+
+Sphinx looks up every ``:obj:``, ``:class:``, ``:func:`` and ``:const:``
+reference in its resolve phase. The generated pages declare all objects
+they document, so the page and anchor of each object are known once all
+pages have been written. References to such objects are replaced by a
+``:link:`` role that carries the page, and the ``link`` role in
+:mod:`pygobject_docs.directives` turns it into a link while the page is
+read. Sphinx does not need to resolve those references any more.
+
+A reference is only replaced if its target is declared on one of the
+pages, others are left for Sphinx, which resolves them or warns. The
+original role is kept in the link, so replacing is undone just as easily::
+
+    :class:`~gi.repository.GObject.Object`
+    :link:`~gi.repository.GObject.Object <class:GObject-2.0/class-Object>`
+
+The targets are kept in the output directory. The next run links pages
+while they are rendered, with the targets of this run, so a page that did
+not change is not written twice: once with references and again with links.
+"""
+
+import json
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from pygobject_docs import output
+
+# The link targets, in the output directory as long as pages contain links
+MARKER = ".links"
+
+# The pages of all libraries, including the split sections of classes
+PAGES = "*/**/*.rst"
+
+# Python domain directives that declare an object
+OBJECT_DIRECTIVES = (
+    "class",
+    "function",
+    "method",
+    "classmethod",
+    "staticmethod",
+    "attribute",
+    "data",
+    "exception",
+)
+
+DIRECTIVE = re.compile(r"( *)\.\. ([\w-]+):: *([^(\s]*)")
+OPTION = re.compile(r" *:([\w-]+):")
+
+# Names Sphinx uses as anchor as they are, see sphinx.util.nodes.make_id()
+REFERENCE = re.compile(
+    r":(obj|class|func|meth|attr|const|data|exc):`(~?)(gi\.repository\.[\w.]+)`",
+    re.ASCII,
+)
+LINK = re.compile(r":link:`(~?)([\w.]+) <(\w+):([^>`]+)>`", re.ASCII)
+
+log = logging.getLogger(__name__)
+
+
+def page_targets(lines: Iterable[str]) -> Iterator[str]:
+    """The names of the objects declared on a page."""
+    module = ""
+    classes: list[tuple[int, str]] = []
+    # An object is declared after its options, unless one is ``:no-index:``
+    pending = None
+    table_indent = None
+
+    for line in lines:
+        if not line.strip():
+            if pending:
+                yield pending
+            pending = None
+            continue
+
+        indent = len(line) - len(line.lstrip(" "))
+
+        if pending is not None or table_indent is not None:
+            if option := OPTION.match(line):
+                if option.group(1) in ("no-index", "noindex"):
+                    pending = ""
+                continue
+            if pending:
+                yield pending
+            pending = None
+
+        if table_indent is not None:
+            if indent > table_indent:
+                name = line.split(None, 1)[0]
+                yield ".".join(filter(None, (module, *_class(classes, indent), name)))
+                continue
+            table_indent = None
+
+        if not (directive := DIRECTIVE.match(line)):
+            continue
+
+        kind, name = directive.group(2), directive.group(3)
+        if kind == "currentmodule":
+            module, classes = name, []
+        elif kind == "value-table":
+            table_indent = indent
+            pending = ""
+        elif kind in OBJECT_DIRECTIVES:
+            fullname = ".".join(filter(None, (module, *_class(classes, indent), name)))
+            if kind in ("class", "exception"):
+                classes = [*_enclosing(classes, indent), (indent, name)]
+            pending = fullname
+
+    if pending:
+        yield pending
+
+
+def _enclosing(classes, indent):
+    return [(i, name) for i, name in classes if i < indent]
+
+
+def _class(classes, indent):
+    return [name for _, name in _enclosing(classes, indent)]
+
+
+def collect_targets(out_path: Path) -> dict[str, str]:
+    """Map the objects declared on the pages in ``out_path`` to their page."""
+    targets = {}
+    for page in sorted(out_path.glob(PAGES)):
+        docname = page.relative_to(out_path).with_suffix("").as_posix()
+        with page.open(encoding="utf-8") as f:
+            for name in page_targets(line.rstrip("\n") for line in f):
+                targets.setdefault(name, docname)
+    return targets
+
+
+def link(text: str, targets: dict[str, str], counts: Counter[str]) -> str:
+    """Replace references to ``targets`` in ``text`` by links.
+
+    Links of a previous run are updated, and turned back into references
+    if their target is gone.
+    """
+
+    def relink(m):
+        tilde, name, role, _ = m.groups()
+        return reference(m, role, tilde, name)
+
+    def reference(m, role, tilde, name):
+        if docname := targets.get(name):
+            counts["linked"] += 1
+            return f":link:`{tilde}{name} <{role}:{docname}>`"
+        counts["unresolved"] += 1
+        return f":{role}:`{tilde}{name}`"
+
+    text = LINK.sub(relink, text)
+    return REFERENCE.sub(lambda m: reference(m, *m.groups()), text)
+
+
+def link_lines(chunks: Iterable[str], targets: dict[str, str]) -> Iterator[str]:
+    """Replace references to ``targets`` in a stream of text by links.
+
+    References do not span lines, so the text is linked line by line.
+    """
+    counts: Counter[str] = Counter()
+    rest = ""
+    for chunk in chunks:
+        text = rest + chunk
+        end = text.rfind("\n") + 1
+        rest = text[end:]
+        if end:
+            yield link(text[:end], targets, counts)
+    if rest:
+        yield link(rest, targets, counts)
+
+
+def load_targets(out_path: Path) -> dict[str, str]:
+    """The targets of the previous run of :func:`link_pages`, if any."""
+    try:
+        return json.loads((out_path / MARKER).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def unlink(text: str) -> str:
+    """Turn links back into the original references."""
+    return LINK.sub(lambda m: f":{m.group(3)}:`{m.group(1)}{m.group(2)}`", text)
+
+
+def link_pages(out_path: Path, resolve: bool = True) -> Counter[str]:
+    """Replace references by links on all pages in ``out_path``.
+
+    With ``resolve`` off, links written by a previous run are turned back
+    into references. Pages rewritten here are counted in the result, not in
+    :data:`pygobject_docs.output.counts`, which counts generated pages.
+    """
+    counts: Counter[str] = Counter()
+    targets = collect_targets(out_path) if resolve else {}
+
+    for page in sorted(out_path.glob(PAGES)):
+        text = page.read_text(encoding="utf-8")
+        linked = link(text, targets, counts) if resolve else unlink(text)
+        if linked != text:
+            output.write(page, [linked], counts)
+
+    marker = out_path / MARKER
+    if resolve:
+        log.info(
+            "Linked %d references to %d objects on %d pages, "
+            "left %d references to Sphinx",
+            counts["linked"],
+            len(targets),
+            counts["written"],
+            counts["unresolved"],
+        )
+        output.write(marker, [json.dumps(targets, sort_keys=True)], Counter())
+    else:
+        log.info("Removed links from %d pages", counts["written"])
+        marker.unlink(missing_ok=True)
+
+    return counts
+
+
+def write_links(out_path: Path, resolve_links: bool) -> None:
+    """Link references on all pages, or undo the links of a previous run."""
+    if resolve_links or (out_path / MARKER).exists():
+        link_pages(out_path, resolve_links)
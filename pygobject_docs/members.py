@@ -1,9 +1,19 @@
+"""Members of a type.
+
+Results are cached per type, for the duration of a namespace run. Call
+:func:`clear_caches` once a namespace is done, and :func:`cache_stats`
+to see how often the caches were hit.
+"""
+
+from functools import lru_cache
 from itertools import chain
 
 from gi._gi import SignalInfo, VFuncInfo
 from gi._signature import get_pytype
+from sphinx.util.inspect import stringify_annotation
 
 
+@lru_cache(maxsize=None)
 def own_dir(obj_type: type) -> list[str]:
     # Find all elements of a type, that are part of the type
     # and not of a parent or interface.
@@ -25,6 +35,7 @@ def own_dir(obj_type: type) -> list[str]:
     return sorted(obj_type.__dict__.keys())
 
 
+@lru_cache(maxsize=None)
 def properties(obj_type: type) -> list[tuple[str, object | type]]:
     try:
         props = obj_type.__info__.get_properties()  # type: ignore[attr-defined]
@@ -34,6 +45,16 @@ def properties(obj_type: type) -> list[tuple[str, object | type]]:
     return sorted((p.get_name(), get_pytype(p.get_type_info())) for p in props)
 
 
+@lru_cache(maxsize=None)
+def property_types(obj_type: type) -> list[tuple[str, str]]:
+    """Properties of a type, with their type rendered as string."""
+    return [
+        (name, stringify_annotation(type, mode="smart"))
+        for name, type in properties(obj_type)
+    ]
+
+
+@lru_cache(maxsize=None)
 def virtual_methods(obj_type: type) -> list[VFuncInfo]:
     try:
         vfuncs = obj_type.__info__.get_vfuncs()  # type: ignore[attr-defined]
@@ -43,6 +64,7 @@ def virtual_methods(obj_type: type) -> list[VFuncInfo]:
     return sorted(vfuncs, key=lambda v: v.get_name())
 
 
+@lru_cache(maxsize=None)
 def signals(obj_type: type) -> list[SignalInfo]:
     try:
         sigs = obj_type.__info__.get_signals()  # type: ignore[attr-defined]
@@ -50,3 +72,16 @@ def signals(obj_type: type) -> list[SignalInfo]:
         return []
 
     return sorted(sigs, key=lambda s: s.get_name())
+
+
+_cached = (own_dir, properties, property_types, virtual_methods, signals)
+
+
+def cache_stats() -> dict[str, tuple[int, int]]:
+    """Hits and misses per cached function."""
+    return {f.__name__: f.cache_info()[:2] for f in _cached}
+
+
+def clear_caches() -> None:
+    for f in _cached:
+        f.cache_clear()
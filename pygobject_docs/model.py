@@ -0,0 +1,245 @@
+"""A plain data model of the pages of a library.
+
+Extracting what goes on a page (introspection, GIR lookups, doc conversion)
+takes far more time than rendering it. The model keeps the template
+arguments of every page as plain JSON values: signatures as strings and
+converted docs, hierarchy and deprecations as they are passed to the
+templates. Pages can be rendered again from the model, without gi::
+
+    python -m pygobject_docs.model build/model
+
+The model of a library is a gzipped JSON Lines file, one page per line::
+
+    {"page": "class-Button.rst", "template": "class-detail.j2", "arguments": {}}
+"""
+
+import argparse
+import gzip
+import io
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pygobject_docs import output
+from pygobject_docs.links import load_targets, write_links
+from pygobject_docs.render import (
+    generate_top_index,
+    link_references,
+    render_to_file,
+    use_value_tables,
+)
+
+SUFFIX = ".jsonl.gz"
+
+# Key of the JSON object that stands for an int rendered differently, like
+# an enum member: ``{"__int__": [value, str, repr]}``
+INT_KEY = "__int__"
+
+log = logging.getLogger(__name__)
+
+
+class Page(NamedTuple):
+    page: str
+    template: str
+    arguments: dict[str, Any]
+
+
+def model_path(model_dir: Path, lib: str) -> Path:
+    return model_dir / f"{lib}{SUFFIX}"
+
+
+class RenderedInt(int):
+    """An int read from a model, that renders like the value it was stored
+    from, such as an enum member."""
+
+    def __new__(cls, value: int, text: str, representation: str):
+        self = super().__new__(cls, value)
+        self.text = text
+        self.representation = representation
+        return self
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return self.representation
+
+
+def _restore(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and INT_KEY in obj:
+        return RenderedInt(*obj[INT_KEY])
+    return obj
+
+
+def plain(value: Any) -> Any:
+    """Convert template arguments to JSON values.
+
+    Sequences and generators become lists, ints that render differently,
+    like enum members, keep how they render, see :class:`RenderedInt`.
+    Anything else that is not a JSON value becomes the string the template
+    would render.
+    """
+    if value is None or isinstance(value, (bool, float, str)) or type(value) is int:
+        return value
+    if isinstance(value, int):
+        return {INT_KEY: [int(value), str(value), repr(value)]}
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)) or hasattr(value, "__next__"):
+        return [plain(v) for v in value]
+    return str(value)
+
+
+class ModelWriter:
+    """Write the model of a library, page by page.
+
+    Pages are named by their path relative to ``root``, the output directory
+    of the library, or else by their file name. The file is replaced once all
+    pages have been written.
+    """
+
+    def __init__(self, path: Path, root: Path | None = None):
+        self.path = path
+        self.root = root
+        self._tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # No timestamp in the header: the same model gives the same file
+        self._file = io.TextIOWrapper(
+            gzip.GzipFile(self._tmp_path, "wb", mtime=0), encoding="utf-8"
+        )
+
+    def page_name(self, page: Path) -> str:
+        return page.relative_to(self.root).as_posix() if self.root else page.name
+
+    def add(self, page: str, template: str, arguments: dict[str, Any]) -> Page:
+        """Add a page, and return it as it will be read from the model."""
+        line = json.dumps(
+            Page(page, template, plain(arguments))._asdict(), separators=(",", ":")
+        )
+        self._file.write(line)
+        self._file.write("\n")
+        return Page(**json.loads(line, object_hook=_restore))
+
+    def close(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+        else:
+            self.close()
+
+
+def read_model(path: Path) -> Iterator[Page]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield Page(**json.loads(line, object_hook=_restore))
+
+
+def render_model(path: Path, out_path: Path) -> int:
+    """Render all pages in a model to ``out_path``.
+
+    Pages in ``out_path`` that are not in the model, left over from an
+    earlier run, are removed. Returns the number of pages.
+    """
+    out_path.mkdir(parents=True, exist_ok=True)
+    pages = set()
+    for record in read_model(path):
+        page = out_path / record.page
+        page.parent.mkdir(exist_ok=True)
+        render_to_file(record.template, page, **record.arguments)
+        pages.add(record.page)
+
+    for stale in out_path.rglob("*.rst"):
+        if stale.relative_to(out_path).as_posix() not in pages:
+            stale.unlink()
+    return len(pages)
+
+
+def render_models(
+    model_dir: Path,
+    out_path: Path,
+    libraries: list[str],
+    gnome_version: str,
+    resolve_links=False,
+    value_tables=True,
+) -> None:
+    """Render pages from stored library models.
+
+    Nothing is imported from ``gi.repository`` and no GIR file is read.
+    Without ``libraries``, all models in ``model_dir`` are rendered.
+    """
+    libraries = libraries or sorted(
+        path.name.removesuffix(SUFFIX) for path in model_dir.glob(f"*{SUFFIX}")
+    )
+
+    link_references(load_targets(out_path) if resolve_links else {})
+    use_value_tables(value_tables)
+    for lib in libraries:
+        pages = render_model(model_path(model_dir, lib), out_path / lib)
+        log.info("Rendered %d pages for %s", pages, lib)
+
+    generate_top_index(libraries, gnome_version, out_path)
+    write_links(out_path, resolve_links)
+
+    log.info(
+        "Wrote %d files, %d files unchanged",
+        output.counts["written"],
+        output.counts["unchanged"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Render pages from library models, without importing gi"
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=Path("build") / "source",
+        metavar="DIR",
+        help="where to write the pages (default: build/source)",
+    )
+    parser.add_argument(
+        "--links",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="link references to documented objects directly, instead of "
+        "having Sphinx resolve them (default: no)",
+    )
+    parser.add_argument(
+        "--value-tables",
+        default=True,
+        action=argparse.BooleanOptionalAction,
+        help="list undocumented constants, enum members and fields in tables, "
+        "instead of giving each a directive (default: yes)",
+    )
+    parser.add_argument("--gnome", "-g", default="", help="GNOME version")
+    parser.add_argument("model", type=Path, help="the library models, see --model")
+    parser.add_argument(
+        "libraries", nargs="*", help="only render these libraries, like Gtk-4.0"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s:%(message)s",
+        datefmt="%H:%M:%S",
+        level=logging.INFO,
+    )
+
+    render_models(
+        args.model,
+        args.source,
+        args.libraries,
+        args.gnome,
+        args.links,
+        args.value_tables,
+    )
@@ -0,0 +1,64 @@
+"""Write generated files.
+
+Sphinx rereads every document that is newer than its last build. Files
+are therefore only replaced if their content has changed, so an unchanged
+page keeps its modification time. Files are written to a temporary file
+first and then renamed, so a page is never left half written.
+"""
+
+import hashlib
+import os
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+BUFFER_SIZE = 64 * 1024
+
+counts: Counter[str] = Counter()
+
+
+def write(path: Path, chunks: Iterable[str], tally: Counter[str] | None = None) -> bool:
+    """Write ``chunks`` to ``path``, if the content differs.
+
+    Returns ``True`` if the file has been written. The outcome is counted in
+    ``tally``, or else in :data:`counts`.
+    """
+    if tally is None:
+        tally = counts
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    digest = hashlib.sha256()
+    try:
+        with tmp_path.open("wb", buffering=BUFFER_SIZE) as f:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                f.write(data)
+            size = f.tell()
+
+        if _has_content(path, size, digest.digest()):
+            tmp_path.unlink()
+            tally["unchanged"] += 1
+            return False
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    tally["written"] += 1
+    return True
+
+
+def _has_content(path: Path, size: int, digest: bytes) -> bool:
+    try:
+        if path.stat().st_size != size:
+            return False
+        existing = hashlib.sha256()
+        with path.open("rb") as f:
+            while data := f.read(BUFFER_SIZE):
+                existing.update(data)
+    except FileNotFoundError:
+        return False
+
+    return existing.digest() == digest
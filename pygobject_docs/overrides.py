@@ -1,10 +1,101 @@
+"""Documentation for members that can not be introspected.
+
+Stubs are registered with :func:`override`, keyed by the module, class
+and member name of the object they document. Overrides that only apply to
+a single library live in ``overrides_<namespace>`` modules, those are
+loaded by :func:`load_overrides` once that namespace is generated.
+"""
+
+import dataclasses
+import importlib
+import importlib.util
+from functools import lru_cache
+from inspect import Signature
 from typing import Any, Callable, Sequence
 
 from gi.repository import GLib, GObject
+from sphinx.util.docstrings import prepare_docstring
+from sphinx.util.inspect import getdoc, signature as sphinx_signature
+
+OverrideKey = tuple[str | None, str | None, str]
+
+
+# Overrides in the core module document GLib and GObject
+CORE_NAMESPACES = ("GLib", "GObject")
+
+
+@dataclasses.dataclass(frozen=True)
+class Override:
+    namespace: str | None
+    signature: Signature | None
+    docstring: str | None
+
+
+_registry: dict[OverrideKey, Override] = {}
+_loading: str | None = None
+
+
+def override(module: str | None, class_name: str | None, member: str):
+    """Register a stub as documentation for ``module.class_name.member``.
+
+    The signature and docstring of the stub are computed once, at
+    registration time.
+    """
+
+    def register(stub):
+        doc = getdoc(stub)
+        _registry[(module, class_name, member)] = Override(
+            namespace=_loading,
+            signature=None if isinstance(stub, type) else sphinx_signature(stub),
+            docstring="\n".join(prepare_docstring(doc)) if doc else None,
+        )
+        return stub
+
+    return register
+
+
+def lookup(key: OverrideKey | None) -> Override | None:
+    return _registry.get(key) if key else None
+
+
+def entries(namespace: str) -> list[tuple[OverrideKey, Override]]:
+    """Overrides that can end up in the documentation of a namespace."""
+    return [
+        (key, entry)
+        for key, entry in _registry.items()
+        if entry.namespace == namespace
+        or (entry.namespace is None and namespace in CORE_NAMESPACES)
+    ]
+
+
+def find(namespace: str, class_name: str | None, member: str) -> Override | None:
+    """The override of a member of ``namespace``, whatever module it is in.
+
+    For pages generated without importing the namespace, where the module
+    that defines a member is not known.
+    """
+    for (_, cls, name), entry in entries(namespace):
+        if cls == class_name and name == member:
+            return entry
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_overrides(namespace: str) -> None:
+    global _loading
+
+    module = f"{__name__}_{namespace.lower()}"
+    if importlib.util.find_spec(module):
+        _loading = namespace
+        try:
+            importlib.import_module(module)
+        finally:
+            _loading = None
 
 
 # GLib
-def gi__gi_add_emission_hook(
+@override("gi._gi", None, "add_emission_hook")
+def add_emission_hook(
     type: GObject.Object,
     name: str,
     callback: Callable[[...], None],  # type: ignore[misc]
@@ -12,7 +103,8 @@ def gi__gi_add_emission_hook(
 ) -> None: ...
 
 
-def gi__gi_spawn_async(  # type: ignore[empty-body]
+@override("gi._gi", None, "spawn_async")
+def spawn_async(  # type: ignore[empty-body]
     argv: Sequence[str],
     envp: Sequence[str] | None = None,
     working_directory: str | None = None,
@@ -29,18 +121,22 @@ def gi__gi_spawn_async(  # type: ignore[empty-body]
     """
 
 
-def gi__gi_Pid_close() -> None: ...
+@override("gi._gi", "Pid", "close")
+def pid_close() -> None: ...
 
 
 # GObject
-def gi__gi_list_properties() -> list[GObject.ParamSpec]:  # type: ignore[empty-body]
+@override("gi._gi", None, "list_properties")
+def list_properties() -> list[GObject.ParamSpec]:  # type: ignore[empty-body]
     ...
 
 
-def gi__gi_new(gtype: GObject.GType) -> None: ...
+@override("gi._gi", None, "new")
+def new(gtype: GObject.GType) -> None: ...
 
 
-def gi__gi_signal_new(  # type: ignore[empty-body]
+@override("gi._gi", None, "signal_new")
+def signal_new(  # type: ignore[empty-body]
     signal_name: str,
     itype: type[GObject.Object],
     signal_flags: GObject.SignalFlags,
@@ -49,13 +145,16 @@ def gi__gi_signal_new(  # type: ignore[empty-body]
 ) -> int: ...
 
 
-def gi__gi_type_register(type) -> GObject.GType: ...
+@override("gi._gi", None, "type_register")
+def type_register(type) -> GObject.GType: ...
 
 
-def gi__gi_GObject___init__(**properties: Any): ...
+@override("gi._gi", "GObject", "__init__")
+def object_init(**properties: Any): ...
 
 
-def gi__gi_GObject_bind_property(
+@override("gi._gi", "GObject", "bind_property")
+def bind_property(
     source_property: str,
     target: GObject.Object,
     target_property: str,
@@ -93,7 +192,8 @@ def gi__gi_GObject_bind_property(
     """
 
 
-def gi__gi_GObject_chain(*params) -> object | None:
+@override("gi._gi", "GObject", "chain")
+def chain(*params) -> object | None:
     """
     Calls the original class closure of a signal.
 
@@ -104,7 +204,8 @@ def gi__gi_GObject_chain(*params) -> object | None:
     """
 
 
-def gi__gi_GObject_connect(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "connect")
+def connect(  # type: ignore[empty-body]
     detailed_signal: str,
     handler: Callable[[GObject.Object, ...], Any],  # type: ignore[misc]
     *args: Any,
@@ -144,7 +245,8 @@ def gi__gi_GObject_connect(  # type: ignore[empty-body]
     """
 
 
-def gi__gi_GObject_connect_after(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "connect_after")
+def connect_after(  # type: ignore[empty-body]
     detailed_signal: str,
     handler: Callable[[GObject.Object, ...], Any],  # type: ignore[misc]
     *args: Any,
@@ -158,7 +260,8 @@ def gi__gi_GObject_connect_after(  # type: ignore[empty-body]
     """
 
 
-def gi__gi_GObject_connect_object(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "connect_object")
+def connect_object(  # type: ignore[empty-body]
     detailed_signal: str,
     handler: Callable[[GObject.Object, ...], Any],  # type: ignore[misc]
     object: GObject.Object,
@@ -170,7 +273,8 @@ def gi__gi_GObject_connect_object(  # type: ignore[empty-body]
     """
 
 
-def gi__gi_GObject_connect_object_after(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "connect_object_after")
+def connect_object_after(  # type: ignore[empty-body]
     detailed_signal: str,
     handler: Callable[[GObject.Object, Any], Any],
     object: GObject.Object,
@@ -181,7 +285,8 @@ def gi__gi_GObject_connect_object_after(  # type: ignore[empty-body]
     """
 
 
-def gi__gi_GObject_disconnect_by_func(
+@override("gi._gi", "GObject", "disconnect_by_func")
+def disconnect_by_func(
     func: Callable[[GObject.Object, ...], Any],  # type: ignore[misc]
 ) -> None:
     """
@@ -189,128 +294,158 @@ def gi__gi_GObject_disconnect_by_func(
     """
 
 
-def gi__gi_GObject_emit(signal_name: str, *args) -> None: ...
+@override("gi._gi", "GObject", "emit")
+def emit(signal_name: str, *args) -> None: ...
 
 
-def gi__gi_GObject_get_properties(*prop_names: str) -> tuple[Any, ...]:  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "get_properties")
+def get_properties(*prop_names: str) -> tuple[Any, ...]:  # type: ignore[empty-body]
     ...
 
 
-def gi__gi_GObject_get_property(prop_name: str) -> Any: ...
+@override("gi._gi", "GObject", "get_property")
+def get_property(prop_name: str) -> Any: ...
 
 
-def gi__gi_GObject_handler_block_by_func(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "handler_block_by_func")
+def handler_block_by_func(  # type: ignore[empty-body]
     func: Callable[[GObject.Object, ...], ...],  # type: ignore[misc]
 ) -> int: ...
 
 
-def gi__gi_GObject_handler_unblock_by_func(  # type: ignore[empty-body]
+@override("gi._gi", "GObject", "handler_unblock_by_func")
+def handler_unblock_by_func(  # type: ignore[empty-body]
     func: Callable[[GObject.Object, ...], ...],  # type: ignore[misc]
 ) -> int: ...
 
 
-def gi__gi_GObject_set_properties(**props) -> None: ...
+@override("gi._gi", "GObject", "set_properties")
+def set_properties(**props) -> None: ...
 
 
-def gi__gi_GObject_set_property(prop_name: str, prop_value: Any) -> None: ...
+@override("gi._gi", "GObject", "set_property")
+def set_property(prop_name: str, prop_value: Any) -> None: ...
 
 
-def gi__gi_GObject_weak_ref(
-    callback: Callable[[Any], None] | None, *args: Any
-) -> GObject.Object: ...
+@override("gi._gi", "GObject", "weak_ref")
+def weak_ref(callback: Callable[[Any], None] | None, *args: Any) -> GObject.Object: ...
 
 
 # GLib.OptionContext
 
 
-def gi__gi_OptionContext_add_group(group: GLib.OptionGroup) -> None: ...
+@override("gi._gi", "OptionContext", "add_group")
+def add_group(group: GLib.OptionGroup) -> None: ...
 
 
-def gi__gi_OptionContext_get_help_enabled() -> bool:  # type: ignore[empty-body]
+@override("gi._gi", "OptionContext", "get_help_enabled")
+def get_help_enabled() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gi__gi_OptionContext_get_ignore_unknown_options() -> bool:  # type: ignore[empty-body]
+@override("gi._gi", "OptionContext", "get_ignore_unknown_options")
+def get_ignore_unknown_options() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gi__gi_OptionContext_get_main_group() -> GLib.OptionGroup: ...
+@override("gi._gi", "OptionContext", "get_main_group")
+def get_main_group() -> GLib.OptionGroup: ...
 
 
-def gi__gi_OptionContext_parse(argv: Sequence[str]) -> tuple[bool, list[str]]:  # type: ignore[empty-body]
+@override("gi._gi", "OptionContext", "parse")
+def parse(argv: Sequence[str]) -> tuple[bool, list[str]]:  # type: ignore[empty-body]
     ...
 
 
-def gi__gi_OptionContext_set_help_enabled(help_enabled: bool) -> None: ...
+@override("gi._gi", "OptionContext", "set_help_enabled")
+def set_help_enabled(help_enabled: bool) -> None: ...
 
 
-def gi__gi_OptionContext_set_ignore_unknown_options(ignore_unknown: bool) -> None: ...
+@override("gi._gi", "OptionContext", "set_ignore_unknown_options")
+def set_ignore_unknown_options(ignore_unknown: bool) -> None: ...
 
 
-def gi__gi_OptionContext_set_main_group(group: GLib.OptionGroup) -> None: ...
+@override("gi._gi", "OptionContext", "set_main_group")
+def set_main_group(group: GLib.OptionGroup) -> None: ...
 
 
-def gi__gi_OptionGroup_add_entries(entries: list[GLib.OptionEntry]) -> None: ...
+@override("gi._gi", "OptionGroup", "add_entries")
+def add_entries(entries: list[GLib.OptionEntry]) -> None: ...
 
 
-def gi__gi_OptionGroup_set_translation_domain(domain: str) -> None: ...
+@override("gi._gi", "OptionGroup", "set_translation_domain")
+def set_translation_domain(domain: str) -> None: ...
 
 
-def gi__gi_GObjectWeakRef_unref() -> None: ...
+@override("gi._gi", "GObjectWeakRef", "unref")
+def weak_ref_unref() -> None: ...
 
 
-def gobject_GBoxed_copy() -> GObject.GBoxed: ...
+@override("gobject", "GBoxed", "copy")
+def boxed_copy() -> GObject.GBoxed: ...
 
 
 # GObject.GType
 
 
-def None_from_name(name: str) -> GObject.GType: ...
+@override(None, None, "from_name")
+def type_from_name(name: str) -> GObject.GType: ...
 
 
-def gobject_GType_has_value_table() -> None: ...
+@override("gobject", "GType", "has_value_table")
+def has_value_table() -> None: ...
 
 
-def gobject_GType_is_a(type: GObject.GType) -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_a")
+def is_a(type: GObject.GType) -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_abstract() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_abstract")
+def is_abstract() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_classed() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_classed")
+def is_classed() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_deep_derivable() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_deep_derivable")
+def is_deep_derivable() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_derivable() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_derivable")
+def is_derivable() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_instantiatable() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_instantiatable")
+def is_instantiatable() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_interface() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_interface")
+def is_interface() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_value_abstract() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_value_abstract")
+def is_value_abstract() -> bool:  # type: ignore[empty-body]
     ...
 
 
-def gobject_GType_is_value_type() -> bool:  # type: ignore[empty-body]
+@override("gobject", "GType", "is_value_type")
+def is_value_type() -> bool:  # type: ignore[empty-body]
     ...
 
 
 # gi.repository.GLib
 
 
-class gi_repository_GLib_Error:
+@override("gi.repository.GLib", None, "Error")
+class Error:
     """The ``Error`` structure contains information about an error that has occurred.
 
     Attributes
@@ -0,0 +1,228 @@
+"""Render pages from the Jinja templates in ``pygobject_docs/templates``."""
+
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+from pygobject_docs import output
+from pygobject_docs.cache import cache_dir
+from pygobject_docs.chunks import Chunking
+from pygobject_docs.links import link_lines
+
+# Number of template chunks joined before they are written
+STREAM_BUFFER_SIZE = 64
+
+# References to these objects are linked while pages are rendered
+_link_targets: dict[str, str] = {}
+
+# Class page sections that can be put on pages of their own, with their titles
+CLASS_SECTIONS = {
+    "constructors": "Constructors",
+    "methods": "Methods",
+    "properties": "Properties",
+    "signals": "Signals",
+    "virtual_methods": "Virtual Methods",
+    "fields": "Fields",
+}
+
+
+def create_environment(bytecode_cache_path: Path | None = None) -> Environment:
+    env = Environment(
+        loader=PackageLoader("pygobject_docs"),
+        lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_cache_path))
+        if bytecode_cache_path
+        else None,
+    )
+    # Undocumented constants and fields are listed in value tables
+    env.globals["compact"] = True
+    env.filters["capfirst"] = lambda text: (
+        f"{text[0].upper()}{text[1:]}" if text else ""
+    )
+    return env
+
+
+@lru_cache(maxsize=None)
+def jinja_env() -> Environment:
+    """The environment used for all pages.
+
+    Templates are compiled once per process, and the compiled code is
+    kept in the cache directory, so later runs can skip compilation.
+    """
+    return create_environment(cache_dir("templates"))
+
+
+def link_references(targets: dict[str, str]) -> None:
+    """Link references to ``targets`` on the pages rendered from now on.
+
+    See :mod:`pygobject_docs.links`. Without targets, references are left
+    as they are.
+    """
+    global _link_targets
+    _link_targets = targets
+
+
+def use_value_tables(enabled: bool) -> None:
+    """List undocumented constants and fields in value tables, or give them
+    a directive each, on the pages rendered from now on."""
+    jinja_env().globals["compact"] = enabled
+
+
+def render_to_file(template_name: str, path: Path, **arguments) -> bool:
+    """Render a template straight into a file.
+
+    The page is written as it is rendered, so it is never held in memory
+    as a whole. Pass generators for long lists, so those are not
+    materialized up front either.
+
+    Returns ``True`` if the file has been written, see :func:`output.write`.
+    """
+    stream = jinja_env().get_template(template_name).stream(**arguments)
+    stream.enable_buffering(STREAM_BUFFER_SIZE)
+    return output.write(
+        path, link_lines(stream, _link_targets) if _link_targets else stream
+    )
+
+
+def render_page(template_name: str, page: Path, model=None, **arguments) -> bool:
+    """Render a page, and add it to the library model if one is written.
+
+    With a model, the page is rendered from the model's plain values, so it
+    is the same as when it is rendered from the model later.
+    """
+    if model:
+        arguments = model.add(model.page_name(page), template_name, arguments).arguments
+    return render_to_file(template_name, page, **arguments)
+
+
+def section_path(page: Path) -> Path:
+    """The directory of the sections split off a class page."""
+    return page.with_suffix("")
+
+
+def section_pages(page: Path) -> list[Path]:
+    """The sections split off a class page, see :func:`render_class_page`."""
+    return sorted(section_path(page).glob("*.rst"))
+
+
+def render_chunks(
+    template_name, page, model, chunking, names, entry, entity_type, **arguments
+):
+    """Render the entries for ``names`` on one page, or in chunks.
+
+    Chunks are written to numbered pages next to ``page``, which becomes
+    their index. ``entry(name)`` gives the template values of a name.
+    Returns the chunk pages.
+    """
+    key = page.stem
+    chunks = (chunking or Chunking()).split(names)
+    chunk_pages = (
+        [] if len(chunks) == 1 else [f"{key}-{i}" for i in range(1, len(chunks) + 1)]
+    )
+
+    # Chunks of a previous run that are not written again
+    for stale in page.parent.glob(f"{key}-*.rst"):
+        if stale.stem not in chunk_pages:
+            stale.unlink()
+
+    if not chunk_pages:
+        render_page(template_name, page, model, **{key: map(entry, names)}, **arguments)
+        return []
+
+    for (title, chunk), chunk_page in zip(chunks, chunk_pages, strict=True):
+        render_page(
+            template_name,
+            page.with_name(f"{chunk_page}.rst"),
+            model,
+            title=title,
+            **{key: map(entry, chunk)},
+            **arguments,
+        )
+
+    render_page(
+        "chunks.j2",
+        page,
+        model,
+        entity_type=entity_type,
+        pages=[
+            (title, chunk_page) for (title, _), chunk_page in zip(chunks, chunk_pages)
+        ],
+        **arguments,
+    )
+    return [page.with_name(f"{chunk_page}.rst") for chunk_page in chunk_pages]
+
+
+def render_class_page(page: Path, model, arguments, split_threshold=None) -> None:
+    """Render a class page, see ``class-detail.j2``.
+
+    Sections with more than ``split_threshold`` members are rendered on
+    pages of their own, which the class page links to. Those are kept in a
+    directory named after the class page, out of reach of the ``:glob:`` in
+    ``classes.j2``, so they are only in the toctree of their class.
+    """
+    sub_path = section_path(page)
+    split = {}
+    for section, section_title in CLASS_SECTIONS.items():
+        sub_page = sub_path / f"{section.replace('_', '-')}.rst"
+        entries = arguments.get(section) or []
+        if not split_threshold or len(entries) <= split_threshold:
+            sub_page.unlink(missing_ok=True)
+            continue
+
+        sub_path.mkdir(exist_ok=True)
+        render_page(
+            "class-detail.j2",
+            sub_page,
+            model,
+            class_name=arguments["class_name"],
+            namespace=arguments["namespace"],
+            version=arguments["version"],
+            section=section,
+            section_title=section_title,
+            **{section: entries},
+        )
+        split[section] = (f"{sub_path.name}/{sub_page.stem}", len(entries))
+
+    if not split and sub_path.is_dir() and not any(sub_path.iterdir()):
+        sub_path.rmdir()
+
+    render_page(
+        "class-detail.j2",
+        page,
+        model,
+        **{**arguments, **dict.fromkeys(split, [])},
+        split=split,
+    )
+
+
+def order(libraries: list[str], top: list[str]):
+    def index(name):
+        try:
+            return top.index(name)
+        except ValueError:
+            return len(top)
+
+    return [
+        lib
+        for _, lib in sorted((index(lib.split("-", 1)[0]), lib) for lib in libraries)
+    ]
+
+
+def generate_top_index(
+    libraries: list[str], gnome_version: str, out_path: Path
+) -> None:
+    render_to_file(
+        "top-index.j2",
+        out_path / "index.rst",
+        gnome_version=gnome_version,
+        libraries=order(libraries, top=["GLib", "Gio", "GObject", "Gtk", "Gdk", "Adw"]),
+    )
+
+    # Copy templates
+    (out_path / "_templates").mkdir(exist_ok=True)
+    output.write(
+        out_path / "_templates" / "genindex.html",
+        [(Path(__file__).parent / "sphinx" / "genindex.html").read_text()],
+    )
@@ -0,0 +1,139 @@
+"""Decide in which order libraries are generated.
+
+Libraries are generated after the libraries they include, so shared
+dependencies are parsed first. With multiple workers, of the libraries
+whose dependencies have been started, the most expensive is started first
+(longest processing time first), based on the time each library took in
+previous runs. Full and incremental runs take different times, so they
+are timed separately.
+"""
+
+import heapq
+import json
+import logging
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from statistics import median
+
+from pygobject_docs.cache import cache_dir
+
+log = logging.getLogger(__name__)
+
+# Estimate for a library that has never been timed, if no other library has been
+DEFAULT_COST = 1.0
+
+
+def dependency_order(
+    libraries: list[str], dependencies: Callable[[str], Iterable[str]]
+) -> list[str]:
+    """Order libraries so each library comes after the libraries it includes.
+
+    Dependencies that are not in ``libraries`` are followed, but not returned.
+    Otherwise, libraries keep their original order.
+    """
+    wanted = set(libraries)
+    ordered: dict[str, None] = {}
+    visiting: set[str] = set()
+
+    def visit(lib):
+        if lib in ordered or lib in visiting:
+            return
+        visiting.add(lib)
+        for dep in dependencies(lib):
+            visit(dep)
+        visiting.discard(lib)
+        ordered[lib] = None
+
+    for lib in libraries:
+        visit(lib)
+
+    return [lib for lib in ordered if lib in wanted]
+
+
+class Costs:
+    """Time, in seconds, it took to generate each library in previous runs.
+
+    ``mode`` tells runs apart that take different times, like full and
+    incremental runs.
+    """
+
+    def __init__(self, path: Path | None = None, mode: str = "full"):
+        self.path = path or cache_dir() / f"costs-{mode}.json"
+        try:
+            self._costs: dict[str, float] = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            self._costs = {}
+
+    def estimate(self, lib: str) -> float:
+        if lib in self._costs:
+            return self._costs[lib]
+        return median(self._costs.values()) if self._costs else DEFAULT_COST
+
+    def update(self, lib: str, seconds: float) -> None:
+        self._costs[lib] = seconds
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._costs, indent=1, sort_keys=True))
+
+
+def longest_first(
+    libraries: list[str],
+    costs: Costs,
+    dependencies: Callable[[str], Iterable[str]] | None = None,
+) -> list[str]:
+    """Order libraries by cost, the most expensive first.
+
+    With ``dependencies``, libraries still come after the libraries they
+    include: the next library is the most expensive of those whose
+    dependencies come before it. Ties keep the order of ``libraries``.
+    """
+    rank = {lib: i for i, lib in enumerate(libraries)}
+
+    def key(lib):
+        return -costs.estimate(lib), rank[lib]
+
+    if dependencies is None:
+        return sorted(libraries, key=key)
+
+    waiting = {lib: _dependencies_in(lib, rank, dependencies) for lib in libraries}
+    ready = [(*key(lib), lib) for lib, deps in waiting.items() if not deps]
+    heapq.heapify(ready)
+    ordered: dict[str, None] = {}
+    while ready:
+        *_, lib = heapq.heappop(ready)
+        ordered[lib] = None
+        for other, deps in waiting.items():
+            if lib in deps:
+                deps.discard(lib)
+                if not deps:
+                    heapq.heappush(ready, (*key(other), other))
+
+    # Libraries in a dependency cycle
+    return [*ordered, *(lib for lib in libraries if lib not in ordered)]
+
+
+def _dependencies_in(
+    lib: str, wanted: Iterable[str], dependencies: Callable[[str], Iterable[str]]
+) -> set[str]:
+    """Dependencies of ``lib`` in ``wanted``, also through other libraries."""
+    found: set[str] = set()
+    seen = {lib}
+    todo = list(dependencies(lib))
+    while todo:
+        if (dep := todo.pop()) in seen:
+            continue
+        seen.add(dep)
+        if dep in wanted:
+            found.add(dep)
+        todo.extend(dependencies(dep))
+    return found
+
+
+def makespan(libraries: list[str], costs: Costs, workers: int = 1) -> float:
+    """Predicted wall time when libraries are handed out in order to the
+    first free worker."""
+    finish_times = [0.0] * max(workers, 1)
+    for lib in libraries:
+        heapq.heapreplace(finish_times, finish_times[0] + costs.estimate(lib))
+    return max(finish_times)
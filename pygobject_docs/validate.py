@@ -0,0 +1,151 @@
+"""Find references that Sphinx would not resolve, without building the docs.
+
+The generated pages declare the objects they document. This collects those
+objects and checks every reference to a ``gi.repository`` object against
+them: ``:obj:``, ``:class:``, ``:func:`` and ``:const:`` references, links
+(see :mod:`pygobject_docs.links`), and the types in signatures, which
+Sphinx resolves as well. The pages are read from the generated source tree,
+or rendered from the library models::
+
+    python -m pygobject_docs.validate
+    python -m pygobject_docs.validate --model build/model Gtk-4.0
+
+Only references in the given libraries are checked, against the objects
+of all libraries. References to other packages, like ``:obj:`int```, are
+left to intersphinx.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from pygobject_docs.links import (
+    DIRECTIVE,
+    LINK,
+    OBJECT_DIRECTIVES,
+    OPTION,
+    PAGES,
+    REFERENCE,
+    page_targets,
+)
+from pygobject_docs.model import SUFFIX as MODEL_SUFFIX
+from pygobject_docs.model import read_model
+from pygobject_docs.render import jinja_env
+
+ANNOTATION = re.compile(r"(gi\.repository\.[\w.]+)", re.ASCII)
+
+
+class Reference(NamedTuple):
+    page: str
+    line: int
+    target: str
+
+
+def page_references(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """The line numbers and targets of the references on a page."""
+    for lineno, line in enumerate(lines, 1):
+        for m in REFERENCE.finditer(line):
+            yield lineno, m.group(3)
+        for m in LINK.finditer(line):
+            yield lineno, m.group(2)
+
+        directive = DIRECTIVE.match(line)
+        option = OPTION.match(line)
+        if (directive and directive.group(2) in OBJECT_DIRECTIVES) or (
+            option and option.group(1) == "type"
+        ):
+            for m in ANNOTATION.finditer(line):
+                yield lineno, m.group(1)
+
+
+def source_pages(source_path: Path) -> Iterator[tuple[str, list[str]]]:
+    for page in sorted(source_path.glob(PAGES)):
+        name = page.relative_to(source_path).as_posix()
+        yield name, page.read_text(encoding="utf-8").splitlines()
+
+
+def model_pages(model_dir: Path) -> Iterator[tuple[str, list[str]]]:
+    for path in sorted(model_dir.glob(f"*{MODEL_SUFFIX}")):
+        lib = path.name.removesuffix(MODEL_SUFFIX)
+        for record in read_model(path):
+            template = jinja_env().get_template(record.template)
+            text = "".join(template.generate(**record.arguments))
+            yield f"{lib}/{record.page}", text.splitlines()
+
+
+def validate(
+    pages: Iterable[tuple[str, list[str]]], libraries: Iterable[str] = ()
+) -> tuple[list[Reference], int]:
+    """Check the references on ``pages`` against the objects they declare.
+
+    Pages are ``(name, lines)`` pairs, the name starts with the library.
+    Returns the unresolved references, and the number of references checked.
+    """
+    libraries = set(libraries)
+    targets: set[str] = set()
+    references: list[Reference] = []
+
+    for name, lines in pages:
+        targets.update(page_targets(lines))
+        if not libraries or name.split("/", 1)[0] in libraries:
+            references.extend(
+                Reference(name, lineno, target)
+                for lineno, target in page_references(lines)
+            )
+
+    return [r for r in references if r.target not in targets], len(references)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report references in the generated pages that do not resolve"
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=Path("build") / "source",
+        metavar="DIR",
+        help="the generated pages (default: build/source)",
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        metavar="DIR",
+        help="render the pages from the library models in DIR instead",
+    )
+    parser.add_argument(
+        "--summary",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="only count the references per target (default: no)",
+    )
+    parser.add_argument(
+        "libraries", nargs="*", help="only check these libraries, like Gtk-4.0"
+    )
+    args = parser.parse_args()
+
+    unresolved, checked = validate(
+        model_pages(args.model) if args.model else source_pages(args.source),
+        args.libraries,
+    )
+
+    per_target = Counter(reference.target for reference in unresolved)
+    if args.summary:
+        for target, count in per_target.most_common():
+            print(f"{count:>6} {target}")
+    else:
+        for reference in unresolved:
+            print(f"{reference.page}:{reference.line}: {reference.target}")
+
+    print(
+        f"{len(unresolved)} of {checked} references unresolved, "
+        f"to {len(per_target)} objects",
+        file=sys.stderr,
+    )
+    sys.exit(1 if unresolved else 0)
@@ -0,0 +1,169 @@
+"""Run each library in its own short-lived process.
+
+A process that imported a library can not unload it again. Running each
+library in a separate process keeps memory use flat over a long run. Worker
+processes are watched: one that uses too much memory or takes too long is
+killed, and reported as failed. Log records of the workers are passed on to
+the handlers of the parent process.
+"""
+
+import dataclasses
+import logging
+import multiprocessing
+import queue
+import resource
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from logging.handlers import QueueHandler, QueueListener
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.2
+
+
+@dataclasses.dataclass
+class Result:
+    lib: str
+    seconds: float = 0.0
+    counts: Counter[str] = dataclasses.field(default_factory=Counter)
+    # Peak resident set size, in KiB
+    peak_rss: int = 0
+    error: str | None = None
+
+
+def rss(pid: int) -> int:
+    """Current resident set size of a process, in KiB."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _run_child(func, task, results, log_queue, level) -> None:
+    # A new process starts with the default level, records below it would
+    # never reach the handlers of the parent
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    lib = task[0]
+    start = time.perf_counter()
+    try:
+        counts = func(task)
+    except Exception as e:
+        log.exception("Generating %s failed", lib)
+        results.put(Result(lib, error=f"{type(e).__name__}: {e}"))
+        return
+
+    results.put(
+        Result(
+            lib,
+            seconds=time.perf_counter() - start,
+            counts=counts,
+            peak_rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        )
+    )
+
+
+@dataclasses.dataclass
+class _Running:
+    process: multiprocessing.process.BaseProcess
+    start: float
+    peak_rss: int = 0
+
+
+def run(
+    func: Callable[[tuple], Counter[str]],
+    tasks: Sequence[tuple],
+    jobs: int = 1,
+    max_rss: int | None = None,
+    timeout: float | None = None,
+    preload: Sequence[str] = (),
+) -> Iterator[Result]:
+    """Call ``func(task)`` for each task, each in a new process.
+
+    The first item of a task is the library name. At most ``jobs`` processes
+    run at the same time, started in the order of ``tasks``. ``max_rss``
+    is in KiB, ``timeout`` in seconds. Results are produced as processes
+    finish.
+    """
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(preload))
+    results = context.Queue()
+    log_queue = context.Queue()
+    listener = QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
+    level = logging.getLogger().getEffectiveLevel()
+
+    pending = list(reversed(tasks))
+    running: dict[str, _Running] = {}
+
+    def stop(lib: str, error: str) -> Result:
+        child = running[lib]
+        child.process.kill()
+        return Result(
+            lib,
+            seconds=time.perf_counter() - child.start,
+            peak_rss=child.peak_rss,
+            error=error,
+        )
+
+    try:
+        while pending or running:
+            while pending and len(running) < max(jobs, 1):
+                task = pending.pop()
+                process = context.Process(
+                    target=_run_child,
+                    args=(func, task, results, log_queue, level),
+                    name=f"generate-{task[0]}",
+                )
+                process.start()
+                running[task[0]] = _Running(process, time.perf_counter())
+
+            exited = [lib for lib, c in running.items() if not c.process.is_alive()]
+
+            finished: dict[str, Result] = {}
+            try:
+                result = results.get(timeout=POLL_INTERVAL)
+                while True:
+                    # A worker may finish just before it is stopped
+                    if result.lib in running:
+                        finished[result.lib] = result
+                    result = results.get_nowait()
+            except queue.Empty:
+                pass
+
+            for lib in exited:
+                if lib not in finished:
+                    code = running[lib].process.exitcode
+                    finished[lib] = stop(lib, f"Worker exited with code {code}")
+
+            now = time.perf_counter()
+            for lib, child in running.items():
+                if lib in finished:
+                    continue
+                child.peak_rss = max(child.peak_rss, rss(child.process.pid))
+                if max_rss and child.peak_rss > max_rss:
+                    finished[lib] = stop(
+                        lib, f"Memory limit exceeded ({child.peak_rss} KiB)"
+                    )
+                elif timeout and now - child.start > timeout:
+                    finished[lib] = stop(lib, f"Timed out after {timeout:.0f}s")
+
+            for lib, result in finished.items():
+                child = running.pop(lib)
+                child.process.join()
+                result.peak_rss = max(result.peak_rss, child.peak_rss)
+                yield result
+    finally:
+        for child in running.values():
+            child.process.kill()
+            child.process.join()
+        listener.stop()
@@ -0,0 +1,35 @@
+"""Preloaded state for worker processes.
+
+This module is imported once by the fork server, before any worker is
+started. Workers are forked from it, so they start with the base libraries
+imported, templates compiled, base GIR files parsed and the symbol table
+loaded, and share that memory copy-on-write.
+
+The parsed GIR files only save work for the workers of GLib, GObject and
+Gio themselves: gi-docgen parses the included GIR files of every other
+library again.
+"""
+
+import gc
+
+from pygobject_docs import gir, overrides
+from pygobject_docs.generate import import_module
+from pygobject_docs.inspect import patch_gi_overrides
+from pygobject_docs.render import jinja_env
+
+BASE_LIBRARIES = [("GLib", "2.0"), ("GObject", "2.0"), ("Gio", "2.0")]
+
+patch_gi_overrides()
+
+for namespace, version in BASE_LIBRARIES:
+    overrides.load_overrides(namespace)
+    import_module(namespace, version)
+    gir.preload(namespace, version)
+
+gir.symbol_table()
+
+for template in jinja_env().list_templates():
+    jinja_env().get_template(template)
+
+# Keep the garbage collector from touching (and thus copying) preloaded objects
+gc.freeze()
@@ -0,0 +1,53 @@
+import pytest
+
+from pygobject_docs.chunks import Chunking
+
+
+def test_no_chunking():
+    names = [f"KEY_{i}" for i in range(10)]
+
+    assert Chunking().split(names) == [("", names)]
+    assert Chunking("prefix", size=10).split(names) == [("", names)]
+
+
+def test_chunk_by_size():
+    names = [f"name_{i}" for i in range(5)]
+
+    chunks = Chunking("size", size=2).split(names)
+
+    assert chunks == [
+        ("name_0 to name_1", ["name_0", "name_1"]),
+        ("name_2 to name_3", ["name_2", "name_3"]),
+        ("name_4", ["name_4"]),
+    ]
+
+
+def test_chunk_by_prefix():
+    names = [
+        "ACCEL_A",
+        "BUTTON_A",
+        "BUTTON_B",
+        *(f"KEY_{i}" for i in range(5)),
+        "MAJOR_VERSION",
+        "MINOR_VERSION",
+    ]
+
+    chunks = Chunking("prefix", size=3).split(names)
+
+    assert chunks == [
+        ("ACCEL to BUTTON", ["ACCEL_A", "BUTTON_A", "BUTTON_B"]),
+        ("KEY (1)", ["KEY_0", "KEY_1", "KEY_2"]),
+        ("KEY (2)", ["KEY_3", "KEY_4"]),
+        ("MAJOR to MINOR", ["MAJOR_VERSION", "MINOR_VERSION"]),
+    ]
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_chunk_size_must_be_positive(size):
+    with pytest.raises(ValueError):
+        Chunking("size", size=size)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        Chunking("nope", size=1).split(["a", "b"])
@@ -0,0 +1,168 @@
+from sphinx.application import Sphinx
+
+from pygobject_docs.render import (
+    jinja_env,
+    render_class_page,
+    render_to_file,
+    use_value_tables,
+)
+
+
+def build(tmp_path, index, builder="html"):
+    source = tmp_path / "source"
+    source.mkdir(exist_ok=True)
+    (source / "conf.py").write_text('extensions = ["pygobject_docs.directives"]\n')
+    (source / "index.rst").write_text(index)
+    out_path = tmp_path / builder
+    app = Sphinx(source, source, out_path, out_path / ".doctrees", builder, status=None)
+    app.build()
+    return app, (out_path / f"index{app.builder.out_suffix}").read_text()
+
+
+def test_value_table_anchors(tmp_path):
+    app, html = build(
+        tmp_path,
+        """\
+Index
+=====
+
+.. currentmodule:: gi.repository.Foo
+
+.. value-table::
+
+   ONE 1
+   TWO 2
+
+.. class:: Bar
+   :no-index:
+
+   .. value-table::
+      :objtype: attribute
+
+      baz
+
+See :const:`gi.repository.Foo.TWO` and :attr:`gi.repository.Foo.Bar.baz`.
+""",
+    )
+
+    objects = app.env.get_domain("py").objects
+
+    assert objects["gi.repository.Foo.ONE"].objtype == "data"
+    assert objects["gi.repository.Foo.Bar.baz"].objtype == "attribute"
+    assert 'id="gi.repository.Foo.TWO"' in html
+    assert 'href="#gi.repository.Foo.TWO"' in html
+    assert 'href="#gi.repository.Foo.Bar.baz"' in html
+
+
+def test_value_table_text(tmp_path):
+    _, text = build(tmp_path, "Index\n=====\n\n.. value-table::\n\n   A 1\n", "text")
+
+    assert '| "A" | "1" |' in text
+
+
+def test_link_role(tmp_path):
+    source = tmp_path / "source" / "Foo-1.0"
+    source.mkdir(parents=True)
+    (source / "functions.rst").write_text(
+        "Functions\n=========\n\n"
+        ".. currentmodule:: gi.repository.Foo\n\n"
+        ".. function:: run() -> None\n"
+    )
+
+    _, html = build(
+        tmp_path,
+        """\
+Index
+=====
+
+.. toctree::
+
+   Foo-1.0/functions
+
+See :link:`~gi.repository.Foo.run <func:Foo-1.0/functions>`.
+""",
+    )
+
+    assert 'href="Foo-1.0/functions.html#gi.repository.Foo.run"' in html
+    assert '<span class="pre">run()</span>' in html
+
+
+def test_undocumented_constants_in_value_table():
+    template = jinja_env().get_template("constants.j2")
+    constants = [
+        ("ONE", 1, "", None, None),
+        ("TWO", 2, "The second.", None, None),
+    ]
+
+    compact = template.render(namespace="Foo", constants=constants)
+    full = template.render(namespace="Foo", constants=constants, compact=False)
+
+    assert ".. data:: ONE" not in compact
+    assert "   ONE 1" in compact
+    assert ".. data:: TWO" in compact
+    assert compact.count(".. value-table::") == 1
+    assert ".. data:: ONE" in full
+    assert ".. value-table::" not in full
+
+
+def test_value_table_rows_are_streamed():
+    template = jinja_env().get_template("constants.j2")
+    constants = iter(
+        [
+            ("ONE", 1, "", None, None),
+            ("SPACE", " ", "", None, None),
+            ("THREE", 3, "", None, None),
+            ("TWO", "t\nw\no", "", None, None),
+        ]
+    )
+
+    page = template.render(namespace="Foo", constants=constants)
+
+    assert "   ONE 1" in page
+    assert "   THREE 3" in page
+    assert ".. data:: SPACE" in page
+    assert ".. data:: TWO" in page
+    assert page.count(".. value-table::") == 2
+
+
+def test_value_tables_can_be_turned_off():
+    template = jinja_env().get_template("constants.j2")
+    constants = [("ONE", 1, "", None, None)]
+
+    use_value_tables(False)
+    try:
+        page = template.render(namespace="Foo", constants=constants)
+    finally:
+        use_value_tables(True)
+
+    assert ".. data:: ONE" in page
+
+
+def test_split_class_sections_in_class_toctree(tmp_path):
+    source = tmp_path / "source" / "Foo-1.0"
+    source.mkdir(parents=True)
+    render_to_file(
+        "classes.j2",
+        source / "classes.rst",
+        namespace="Foo",
+        version="1.0",
+        entity_type="Classes",
+        prefix="class",
+    )
+    render_class_page(
+        source / "class-Widget.rst",
+        None,
+        {
+            "class_name": "Widget",
+            "namespace": "Foo",
+            "version": "1.0",
+            "fields": [(f"field_{i}", "A field.", None, None) for i in range(3)],
+        },
+        split_threshold=2,
+    )
+
+    app, _ = build(tmp_path, "Index\n=====\n\n.. toctree::\n\n   Foo-1.0/classes\n")
+
+    relations = app.env.collect_relations()
+    assert relations["Foo-1.0/class-Widget/fields"][0] == "Foo-1.0/class-Widget"
+    assert app.env.toctree_includes["Foo-1.0/classes"] == ["Foo-1.0/class-Widget"]
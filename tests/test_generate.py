@@ -1,15 +1,22 @@
 from types import MethodType
 
+import pytest
 
 from pygobject_docs.category import Category
+from pygobject_docs.chunks import Chunking
 from pygobject_docs.generate import (
     import_module,
     generate,
     generate_class,
     generate_classes,
     generate_functions,
+    generate_hierarchy,
+    parse_args,
+    render_models,
 )
 from pygobject_docs.gir import load_gir_file
+from pygobject_docs.hierarchy import Hierarchy
+from pygobject_docs.model import ModelWriter, render_model
 
 
 def test_generate_glib_functions(tmp_path):
@@ -26,6 +33,26 @@ def test_generate_gobject_functions(tmp_path):
     assert ".. deprecated" in (tmp_path / "functions.rst").read_text()
 
 
+def test_generate_glib_functions_chunked(tmp_path):
+    generate_functions("GLib", "2.0", tmp_path, chunking=Chunking("prefix", size=50))
+
+    index = (tmp_path / "functions.rst").read_text()
+    chunks = sorted(tmp_path.glob("functions-*.rst"))
+
+    assert len(chunks) > 1
+    assert ".. toctree::" in index
+    assert "<functions-1>" in index
+    assert ".. function:: " in chunks[0].read_text()
+
+
+def test_generate_functions_removes_stale_chunks(tmp_path):
+    (tmp_path / "functions-99.rst").write_text("stale")
+
+    generate_functions("GObject", "2.0", tmp_path)
+
+    assert not (tmp_path / "functions-99.rst").exists()
+
+
 def test_generate_classes(tmp_path):
     generate_classes("GLib", "2.0", tmp_path, Category.Classes)
 
@@ -55,6 +82,41 @@ def test_generate_gobject_object_class(tmp_path):
     assert "do_dispose" not in [name for name, *_ in methods]
 
 
+def test_generate_class_split_sections(tmp_path):
+    gir = load_gir_file("GObject", "2.0")
+    mod = import_module("GObject", "2.0")
+    (tmp_path / "class-Object").mkdir()
+    (tmp_path / "class-Object" / "signals.rst").write_text("stale")
+
+    generate_class(
+        gir,
+        "GObject",
+        "2.0",
+        "Object",
+        mod.Object,
+        tmp_path,
+        Category.Classes,
+        caught_warnings=[],
+        split_threshold=5,
+    )
+
+    page = (tmp_path / "class-Object.rst").read_text()
+    methods = (tmp_path / "class-Object" / "methods.rst").read_text()
+
+    assert "<class-Object/methods>" in page
+    assert ".. method:: bind_property" not in page
+    assert ".. method:: bind_property" in methods
+    assert not (tmp_path / "class-Object" / "signals.rst").exists()
+
+
+def test_generate_hierarchy_removes_stale_page(tmp_path):
+    (tmp_path / "hierarchy.rst").write_text("stale")
+    hierarchy = Hierarchy.build(["GObject-2.0"])
+
+    assert not generate_hierarchy("GLib", "2.0", tmp_path, hierarchy)
+    assert not (tmp_path / "hierarchy.rst").exists()
+
+
 def test_generate_gobject(tmp_path):
     generate("GObject", "2.0", tmp_path)
 
@@ -77,3 +139,49 @@ def test_gi_method_type():
     assert not callable(gobject.ParamSpecBoxed.name)
     assert callable(gobject.ParamSpecBoxed.do_values_cmp)
     assert type(gobject.ParamSpecBoxed.do_values_cmp) is MethodType
+
+
+def test_render_gobject_from_model(tmp_path):
+    generate("GObject", "2.0", tmp_path / "source", model_dir=tmp_path / "model")
+
+    render_model(tmp_path / "model" / "GObject-2.0.jsonl.gz", tmp_path / "rendered")
+
+    generated = tmp_path / "source" / "GObject-2.0"
+    for page in (tmp_path / "rendered").iterdir():
+        assert page.read_text() == (generated / page.name).read_text()
+    assert (tmp_path / "rendered" / "class-Object.rst").exists()
+
+
+def test_render_models(tmp_path):
+    with ModelWriter(tmp_path / "model" / "Foo-1.0.jsonl.gz") as model:
+        model.add("classes.rst", "classes.j2", {"entity_type": "Classes"})
+
+    render_models(tmp_path / "model", tmp_path / "source", [], "")
+
+    assert (tmp_path / "source" / "Foo-1.0" / "classes.rst").exists()
+    assert "Foo-1.0" in (tmp_path / "source" / "index.rst").read_text()
+
+
+def test_generate_gir_only(tmp_path):
+    generate("GObject", "2.0", tmp_path, gir_only=True)
+
+    assert (tmp_path / "GObject-2.0" / "class-Object.rst").exists()
+
+
+def test_generate_gir_only_is_incremental(tmp_path):
+    chunking = Chunking("prefix", size=50)
+    generate("GObject", "2.0", tmp_path, gir_only=True, chunking=chunking)
+    page = tmp_path / "GObject-2.0" / "functions.rst"
+    mtime = page.stat().st_mtime_ns
+
+    generate("GObject", "2.0", tmp_path, gir_only=True, chunking=chunking)
+
+    assert page.stat().st_mtime_ns == mtime
+    assert (tmp_path / "GObject-2.0" / "functions-1.rst").exists()
+
+
+def test_chunk_size_must_be_positive():
+    assert parse_args(["--chunk-size", "1"]).chunk_size == 1
+
+    with pytest.raises(SystemExit):
+        parse_args(["--chunk-size", "0"])
@@ -4,15 +4,32 @@ from pygobject_docs import gir as _gir
 
 
 @pytest.fixture
-def glib():
-    g = _gir.load_gir_file("GLib", "2.0")
+def reader():
+    yield _gir.use_reader
+    _gir.use_reader("gidocgen")
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    return _gir.compile_database(tmp_path_factory.mktemp("gir") / "gir.sqlite")
+
+
+@pytest.fixture(params=_gir.READERS)
+def load(request, reader, database):
+    reader(request.param, database if request.param == "db" else None)
+    return _gir.load_gir_file
+
+
+@pytest.fixture
+def glib(load):
+    g = load("GLib", "2.0")
     assert g
     return g
 
 
 @pytest.fixture
-def gobject():
-    g = _gir.load_gir_file("GObject", "2.0")
+def gobject(load):
+    g = load("GObject", "2.0")
     assert g
     return g
 
@@ -124,3 +141,125 @@ def test_enum_field(glib):
     doc = glib.member_doc("field", "IOFlags", "APPEND".lower())
 
     assert doc
+
+
+GIR_CALLS = [
+    ("doc", ("Object",)),
+    ("doc", ("signal_connect_closure",)),
+    ("parameter_doc", ("signal_connect_closure", "instance")),
+    ("return_doc", ("signal_connect_closure",)),
+    ("deprecated", ("ParamSpecGType",)),
+    ("since", ("Binding",)),
+    ("struct_for", ("ObjectClass",)),
+    ("ancestors", ("InitiallyUnowned",)),
+    ("descendants", ("Object",)),
+    ("implements", ("TypeModule",)),
+    ("implementations", ("TypePlugin",)),
+    ("member_doc", ("signal", "Object", "notify")),
+    ("member_deprecated", ("method", "Binding", "get_target")),
+    ("member_since", ("method", "Binding", "dup_source")),
+    ("member_parameter_doc", ("method", "Object", "bind_property", "flags")),
+    ("member_return_doc", ("method", "Object", "bind_property")),
+    ("c_type", ("GObject",)),
+    ("c_symbol", ("g_object_ref",)),
+    ("c_const", ("G_PARAM_MASK",)),
+]
+
+
+@pytest.mark.parametrize("method, args", GIR_CALLS)
+def test_reader_matches_gidocgen(gobject, method, args):
+    gir = _gir.Gir(_gir.find_gir_file("GObject", "2.0"))
+
+    expected = getattr(gir, method)(*args)
+    found = getattr(gobject, method)(*args)
+
+    if method in ("ancestors", "descendants"):
+        expected, found = list(expected), list(found)
+
+    assert found == expected
+
+
+def test_reader_dependencies(gobject):
+    gir = _gir.Gir(_gir.find_gir_file("GObject", "2.0"))
+
+    assert list(gobject.dependencies) == list(gir.dependencies)
+    assert gobject.namespace == gir.namespace
+
+
+def test_load_slim_gir_file(reader):
+    reader("slim")
+
+    g = _gir.load_gir_file("GLib", "2.0")
+
+    assert isinstance(g, _gir.SlimGir)
+
+
+def test_db_reader_needs_a_database(reader):
+    with pytest.raises(ValueError):
+        reader("db")
+
+
+def test_slim_gir_cached_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    gir_file = _gir.find_gir_file("GObject", "2.0")
+    _gir.read_slim.cache_clear()
+
+    doc = _gir.SlimGir(gir_file).doc("Object")
+    _gir.read_slim.cache_clear()
+    cached = _gir.SlimGir(gir_file).doc("Object")
+
+    assert list((tmp_path / "pygobject-docs" / "gir").glob("GObject-2.0-*.pickle"))
+    assert doc
+    assert cached == doc
+
+
+def test_load_gir_file_does_not_compile_database(tmp_path, monkeypatch, reader):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    database = _gir.compile_database(tmp_path / "gir.sqlite")
+
+    def compile_database(path):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(_gir, "compile_database", compile_database)
+    reader("db", database)
+
+    gir = _gir.load_gir_file("GObject", "2.0")
+
+    assert isinstance(gir, _gir.DbGir)
+    assert gir.doc("Object")
+
+
+def test_c_symbol_in_other_namespace(glib):
+    # GLib does not include GObject
+    assert glib.c_symbol("g_object_ref") == "GObject.Object.ref"
+    assert glib.c_type("GObject") == "GObject.Object"
+
+
+def test_symbol_table_prefers_own_library():
+    table = _gir.SymbolTable()
+    table.ctypes["GtkWidget"] = (("Gtk-3.0", "Gtk3.Widget"), ("Gtk-4.0", "Gtk.Widget"))
+
+    assert table.c_type("GtkWidget", ["Gtk-4.0"]) == "Gtk.Widget"
+    assert table.c_type("GtkWidgets", ["Gdk-4.0"]) == "Gtk3.Widget"
+    assert table.c_type("NULL", []) == "None"
+    assert table.c_type("GtkNope", []) is None
+
+
+def test_symbol_index(tmp_path):
+    table = _gir.SymbolTable()
+    table.ctypes["GtkWidget"] = (("Gtk-3.0", "Gtk3.Widget"), ("Gtk-4.0", "Gtk.Widget"))
+    table.ctypes["GtkWindow"] = (("Gtk-4.0", "Gtk.Window"),)
+    table.symbols["g_object_ref"] = (("GObject-2.0", "GObject.Object.ref"),)
+    table.write(tmp_path / "symbols.idx")
+
+    index = _gir.SymbolIndex(tmp_path / "symbols.idx")
+
+    assert index.entries("ctypes", "GtkWidget") == [
+        ("Gtk-3.0", "Gtk3.Widget"),
+        ("Gtk-4.0", "Gtk.Widget"),
+    ]
+    assert index.c_type("GtkWidget", ["Gtk-4.0"]) == "Gtk.Widget"
+    assert index.c_type("GtkWindows", []) == "Gtk.Window"
+    assert index.c_type("GtkWin", []) is None
+    assert index.c_symbol("g_object_ref", []) == "GObject.Object.ref"
+    assert index.c_const("G_PARAM_MASK", []) is None
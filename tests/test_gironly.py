@@ -0,0 +1,54 @@
+from pygobject_docs.category import Category
+from pygobject_docs.gir import Gir, find_gir_file
+from pygobject_docs.gironly import GirPages, categories, compare, python_signature
+from pygobject_docs.model import Page
+
+
+def test_function_signature():
+    gir = Gir(find_gir_file("GLib", "2.0"))
+    func = gir.repo.namespace.find_function("get_user_name")
+
+    assert python_signature(func) == "() -> str"
+
+
+def test_categories():
+    gir = Gir(find_gir_file("GObject", "2.0"))
+
+    found = categories(gir)
+
+    assert "Object" in found[Category.Classes]
+    assert "TypePlugin" in found[Category.Interfaces]
+    assert "ObjectClass" not in found[Category.Structures]
+    assert "signal_connect_closure" in found[Category.Functions]
+
+
+def test_generate_from_gir(tmp_path):
+    GirPages("GObject", "2.0", tmp_path).generate()
+
+    assert (tmp_path / "functions.rst").exists()
+    assert (tmp_path / "class-Object.rst").exists()
+    assert (tmp_path / "index.rst").exists()
+
+
+def test_generate_from_gir_with_overrides(tmp_path):
+    GirPages("GLib", "2.0", tmp_path).generate()
+
+    functions = (tmp_path / "functions.rst").read_text()
+    assert "Execute a child program asynchronously" in functions
+
+
+def test_compare():
+    reference = [
+        Page("functions.rst", "functions.j2", {"functions": [["a", "() -> int"]]}),
+        Page("class-A.rst", "class-detail.j2", {"methods": [["b", "() -> None"]]}),
+    ]
+    candidate = [
+        Page("functions.rst", "functions.j2", {"functions": [["a", "() -> str"]]}),
+        Page("class-B.rst", "class-detail.j2", {}),
+    ]
+
+    assert compare(reference, candidate) == [
+        "class-A.rst: missing",
+        "class-B.rst: extra",
+        "functions.rst: functions a: () -> int != () -> str",
+    ]
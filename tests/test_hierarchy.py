@@ -0,0 +1,70 @@
+from pygobject_docs.hierarchy import INLINE_LIMIT, Hierarchy, compact
+
+
+def test_descendants_from_other_libraries():
+    hierarchy = Hierarchy.build(["GObject-2.0", "Gio-2.0"])
+
+    descendants = hierarchy.descendants("GObject-2.0", "Object")
+
+    assert "gi.repository.GObject.Binding" in descendants
+    assert "gi.repository.Gio.Application" in descendants
+    assert descendants.index("gi.repository.GObject.Binding") < descendants.index(
+        "gi.repository.Gio.Application"
+    )
+
+
+def test_descendants_only_from_generated_libraries():
+    hierarchy = Hierarchy.build(["GObject-2.0"])
+
+    descendants = hierarchy.descendants("GObject-2.0", "Object")
+
+    assert "gi.repository.GObject.Binding" in descendants
+    assert "gi.repository.Gio.Application" not in descendants
+
+
+def test_ancestors_and_interfaces():
+    hierarchy = Hierarchy.build(["Gio-2.0"])
+
+    assert hierarchy.ancestors("Gio-2.0", "Application") == [
+        "gi.repository.GObject.Object"
+    ]
+    assert "gi.repository.Gio.ActionGroup" in hierarchy.implements(
+        "Gio-2.0", "Application"
+    )
+    assert "gi.repository.Gio.Application" in hierarchy.implementations(
+        "Gio-2.0", "ActionGroup"
+    )
+    assert hierarchy.ancestors("Gio-2.0", "ActionGroup") == []
+
+
+def test_save_and_load(tmp_path):
+    hierarchy = Hierarchy.build(["GObject-2.0"])
+    hierarchy.save(tmp_path / "hierarchy.pickle")
+
+    loaded = Hierarchy.load(tmp_path / "hierarchy.pickle").library("GObject-2.0")
+
+    assert loaded.descendants("Object") == hierarchy.descendants(
+        "GObject-2.0", "Object"
+    )
+    assert loaded.implementations("TypePlugin") == ["gi.repository.GObject.TypeModule"]
+
+
+def test_compact():
+    names = [f"gi.repository.Gtk.Widget{i}" for i in range(INLINE_LIMIT + 3)]
+
+    assert compact(names[:INLINE_LIMIT]) == (names[:INLINE_LIMIT], 0)
+    assert compact(names) == (names[:INLINE_LIMIT], 3)
+    assert compact(names, 2) == (names[:2], INLINE_LIMIT + 1)
+    assert compact(names, 0) == (names, 0)
+
+
+def test_tree_and_crowded_types():
+    hierarchy = Hierarchy.build(["GObject-2.0", "Gio-2.0"])
+
+    tree = hierarchy.tree("GObject-2.0", "Object")
+
+    assert (0, "gi.repository.Gio.InputStream") in tree
+    assert (2, "gi.repository.Gio.BufferedInputStream") in tree
+    assert "Object" in hierarchy.crowded("GObject-2.0")
+    assert "Binding" not in hierarchy.crowded("GObject-2.0")
+    assert hierarchy.crowded("GObject-2.0", limit=0) == []
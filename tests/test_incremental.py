@@ -0,0 +1,184 @@
+from pygobject_docs import gir, overrides
+from pygobject_docs.generate import generate, import_module
+from pygobject_docs.incremental import (
+    Fingerprints,
+    Journal,
+    Manifest,
+    Tracker,
+    common_digest,
+    namespace_fingerprint,
+)
+
+
+def test_page_fingerprints_are_stable():
+    import_module("GObject", "2.0")
+
+    first = Fingerprints("GObject", "2.0")
+    second = Fingerprints("GObject", "2.0")
+
+    assert first.page("class", "Object") == second.page("class", "Object")
+    assert first.page("functions") == second.page("functions")
+
+
+def test_page_fingerprints_differ_per_page():
+    import_module("GObject", "2.0")
+    fingerprints = Fingerprints("GObject", "2.0")
+
+    assert fingerprints.page("class", "Object") != fingerprints.page("class", "Binding")
+    assert fingerprints.page("functions") != fingerprints.page("constants")
+
+
+def test_pages_depend_on_their_symbol_lookups(tmp_path, monkeypatch):
+    import_module("GObject", "2.0")
+    page = tmp_path / "class-Object.rst"
+    tracker = Tracker("GObject", "2.0", tmp_path)
+
+    assert not tracker.skip(page, "class", "Object")
+    page.write_text("")
+    gir.symbol_table().c_type("GObject", ["GObject-2.0"])
+    tracker.done(page)
+
+    assert tracker.manifest.lookups(page) == [("ctypes", "GObject")]
+    assert tracker.skip(page, "class", "Object")
+
+    monkeypatch.setattr(
+        gir.SymbolIndex, "entries", lambda self, table, key: [("Foo-1.0", "Foo.Bar")]
+    )
+
+    assert not tracker.skip(page, "class", "Object")
+
+
+def test_namespace_fingerprint_has_the_inputs_of_pages(monkeypatch):
+    fingerprint = namespace_fingerprint("GObject", "2.0")
+    common = common_digest("GObject", "2.0")
+
+    import_module("GObject", "2.0")
+
+    assert Fingerprints("GObject", "2.0")._common == common
+
+    monkeypatch.setitem(
+        overrides._registry,
+        ("gi._gi", None, "stub"),
+        overrides.Override(None, None, "Stub."),
+    )
+
+    assert namespace_fingerprint("GObject", "2.0") != fingerprint
+
+
+def test_manifest_round_trip(tmp_path):
+    page = tmp_path / "index.rst"
+    page.write_text("")
+
+    manifest = Manifest(tmp_path)
+    manifest.update(page, "abc")
+    manifest.save()
+
+    assert Manifest(tmp_path).is_current(page, "abc")
+    assert not Manifest(tmp_path).is_current(page, "def")
+
+
+def test_manifest_remove_page(tmp_path):
+    page = tmp_path / "hierarchy.rst"
+    page.write_text("")
+    manifest = Manifest(tmp_path)
+    manifest.update(page, "abc")
+    manifest.remove(page)
+    manifest.save()
+
+    assert not Manifest(tmp_path).is_current(page, "abc")
+
+
+def test_manifest_requires_parts_to_exist(tmp_path):
+    page = tmp_path / "class-Object.rst"
+    part = tmp_path / "class-Object" / "methods.rst"
+    part.parent.mkdir()
+    page.write_text("")
+    part.write_text("")
+
+    manifest = Manifest(tmp_path)
+    manifest.update(page, "abc", [part])
+    manifest.save()
+
+    assert Manifest(tmp_path).is_current(page, "abc")
+    part.unlink()
+    assert not Manifest(tmp_path).is_current(page, "abc")
+
+
+def test_manifest_requires_page_to_exist(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.update(tmp_path / "index.rst", "abc")
+
+    assert not manifest.is_current(tmp_path / "index.rst", "abc")
+
+
+def test_skip_unchanged_pages(tmp_path):
+    generate("GObject", "2.0", tmp_path)
+
+    out_path = tmp_path / "GObject-2.0"
+    tracker = Tracker("GObject", "2.0", out_path)
+
+    assert tracker.skip(out_path / "class-Object.rst", "class", "Object")
+    assert tracker.skip(out_path / "functions.rst", "functions")
+    assert tracker.skip(out_path / "index.rst", "index")
+
+
+def test_regenerate_removed_pages(tmp_path):
+    generate("GObject", "2.0", tmp_path)
+
+    out_path = tmp_path / "GObject-2.0"
+    (out_path / "class-Object.rst").unlink()
+    tracker = Tracker("GObject", "2.0", out_path)
+
+    assert not tracker.skip(out_path / "class-Object.rst", "class", "Object")
+
+
+def test_journal_resume(tmp_path):
+    Journal(tmp_path).record("GLib-2.0", "index.rst", "abc")
+
+    journal = Journal(tmp_path, resume=True)
+
+    assert journal.completed("GLib-2.0", "index.rst", "abc")
+    assert not journal.completed("GLib-2.0", "index.rst", "def")
+
+
+def test_journal_without_resume_starts_over(tmp_path):
+    Journal(tmp_path).record("GLib-2.0", "index.rst", "abc")
+
+    journal = Journal(tmp_path)
+
+    assert not journal.completed("GLib-2.0", "index.rst", "abc")
+
+
+def test_journal_ignores_truncated_record(tmp_path):
+    journal = Journal(tmp_path)
+    journal.record("GLib-2.0", "index.rst", "abc")
+    with journal.path.open("a") as f:
+        f.write('["GLib-2.0", "functi')
+
+    journal = Journal(tmp_path, resume=True)
+
+    assert journal.completed("GLib-2.0", "index.rst", "abc")
+
+
+def test_journal_finish(tmp_path):
+    journal = Journal(tmp_path)
+    journal.record("GLib-2.0", "", "abc")
+    journal.finish()
+
+    assert not journal.path.exists()
+
+
+def test_resume_skips_completed_pages(tmp_path):
+    out_path = tmp_path / "GObject-2.0"
+    journal = Journal(tmp_path)
+    generate("GObject", "2.0", tmp_path, incremental=False, journal=journal)
+
+    tracker = Tracker(
+        "GObject",
+        "2.0",
+        out_path,
+        Journal(tmp_path, resume=True),
+        incremental=False,
+    )
+
+    assert tracker.skip(out_path / "class-Object.rst", "class", "Object")
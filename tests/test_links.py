@@ -0,0 +1,152 @@
+from collections import Counter
+
+from pygobject_docs import output
+from pygobject_docs.links import (
+    MARKER,
+    collect_targets,
+    link,
+    link_lines,
+    link_pages,
+    load_targets,
+    page_targets,
+    unlink,
+)
+from pygobject_docs.render import jinja_env
+
+CLASS_PAGE = """\
+.. currentmodule:: gi.repository.Gtk
+
+.. class:: Widget(**properties: ~typing.Any)
+   :no-contents-entry:
+
+.. class:: Widget
+   :no-index:
+
+   .. method:: show(self) -> None
+      :async:
+
+   .. attribute:: props.can_focus
+      :type: bool
+
+   .. value-table::
+      :objtype: attribute
+
+      parent_instance
+
+.. class:: Widget.signals
+   :no-index:
+
+   .. method:: destroy() -> None
+"""
+
+
+def test_page_targets():
+    targets = list(page_targets(CLASS_PAGE.splitlines()))
+
+    assert targets == [
+        "gi.repository.Gtk.Widget",
+        "gi.repository.Gtk.Widget.show",
+        "gi.repository.Gtk.Widget.props.can_focus",
+        "gi.repository.Gtk.Widget.parent_instance",
+        "gi.repository.Gtk.Widget.signals.destroy",
+    ]
+
+
+def test_constants_page_targets():
+    text = (
+        jinja_env()
+        .get_template("constants.j2")
+        .render(
+            namespace="GLib",
+            constants=[("ONE", 1, "", None, None), ("TWO", 2, "Two.", None, None)],
+        )
+    )
+
+    assert sorted(page_targets(text.splitlines())) == [
+        "gi.repository.GLib.ONE",
+        "gi.repository.GLib.TWO",
+    ]
+
+
+def test_link():
+    targets = {"gi.repository.Gtk.Widget": "Gtk-4.0/class-Widget"}
+    counts = Counter()
+
+    text = link(
+        "A :class:`~gi.repository.Gtk.Widget`, not :obj:`~gi.repository.Gtk.Nope`.",
+        targets,
+        counts,
+    )
+
+    assert text == (
+        "A :link:`~gi.repository.Gtk.Widget <class:Gtk-4.0/class-Widget>`, "
+        "not :obj:`~gi.repository.Gtk.Nope`."
+    )
+    assert counts == {"linked": 1, "unresolved": 1}
+    assert unlink(text) == (
+        "A :class:`~gi.repository.Gtk.Widget`, not :obj:`~gi.repository.Gtk.Nope`."
+    )
+
+
+def test_relink_moved_target():
+    text = ":link:`gi.repository.Gtk.Widget.show <meth:Gtk-4.0/class-Widget>`"
+
+    moved = link(
+        text,
+        {"gi.repository.Gtk.Widget.show": "Gtk-4.0/class-Widget-methods"},
+        Counter(),
+    )
+    gone = link(text, {}, Counter())
+
+    assert moved == (
+        ":link:`gi.repository.Gtk.Widget.show <meth:Gtk-4.0/class-Widget-methods>`"
+    )
+    assert gone == ":meth:`gi.repository.Gtk.Widget.show`"
+
+
+def test_link_pages(tmp_path):
+    (tmp_path / "Gtk-4.0").mkdir()
+    (tmp_path / "Gtk-4.0" / "class-Widget.rst").write_text(CLASS_PAGE)
+    (tmp_path / "Adw-1").mkdir()
+    page = tmp_path / "Adw-1" / "index.rst"
+    page.write_text("See :meth:`~gi.repository.Gtk.Widget.show`.\n")
+
+    written = output.counts.copy()
+    counts = link_pages(tmp_path)
+
+    assert counts["written"] == 1
+    assert output.counts == written
+    assert page.read_text() == (
+        "See :link:`~gi.repository.Gtk.Widget.show <meth:Gtk-4.0/class-Widget>`.\n"
+    )
+    assert (tmp_path / MARKER).exists()
+
+    link_pages(tmp_path, resolve=False)
+
+    assert page.read_text() == "See :meth:`~gi.repository.Gtk.Widget.show`.\n"
+    assert not (tmp_path / MARKER).exists()
+
+
+def test_link_lines_across_chunks():
+    targets = {"gi.repository.Gtk.Widget.show": "Gtk-4.0/class-Widget"}
+    text = "See :meth:`~gi.repository.Gtk.Widget.show`.\nDone"
+
+    linked = "".join(link_lines([text[:20], text[20:30], text[30:]], targets))
+
+    assert linked == link(text, targets, Counter())
+
+
+def test_pages_linked_while_rendered_are_not_rewritten(tmp_path):
+    (tmp_path / "Gtk-4.0").mkdir()
+    (tmp_path / "Gtk-4.0" / "class-Widget.rst").write_text(CLASS_PAGE)
+    (tmp_path / "Adw-1").mkdir()
+    page = tmp_path / "Adw-1" / "index.rst"
+    text = "See :meth:`~gi.repository.Gtk.Widget.show`.\n"
+    page.write_text(text)
+    link_pages(tmp_path)
+
+    targets = load_targets(tmp_path)
+
+    assert targets == collect_targets(tmp_path)
+    assert not output.write(page, link_lines([text], targets))
+    assert link_pages(tmp_path)["written"] == 0
@@ -1,7 +1,14 @@
 import pytest
 
 from pygobject_docs.generate import import_module
-from pygobject_docs.members import own_dir, properties, signals
+from pygobject_docs.members import (
+    cache_stats,
+    clear_caches,
+    own_dir,
+    properties,
+    property_types,
+    signals,
+)
 
 
 @pytest.fixture
@@ -66,3 +73,18 @@ def test_builder_scope():
     members = own_dir(Gtk.Builder)
 
     assert "BuilderScope" in members
+
+
+def test_property_types(gobject):
+    props = property_types(gobject.Binding)
+
+    assert ("source", "~gi.repository.GObject.Object") in props
+
+
+def test_members_are_cached(gobject):
+    clear_caches()
+
+    own_dir(gobject.Binding)
+    own_dir(gobject.Binding)
+
+    assert cache_stats()["own_dir"] == (1, 1)
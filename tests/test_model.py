@@ -0,0 +1,130 @@
+import subprocess
+import sys
+from inspect import Parameter, Signature
+
+from pygobject_docs.model import ModelWriter, plain, read_model, render_model
+from pygobject_docs.render import render_to_file
+
+
+class Flags(int):
+    def __str__(self):
+        return "<flags G_IO_FLAG_APPEND of type GLib.IOFlags>"
+
+    def __repr__(self):
+        return "GLib.IOFlags.APPEND"
+
+
+def test_plain_values():
+    sig = Signature([Parameter("a", Parameter.POSITIONAL_OR_KEYWORD)])
+
+    assert plain({"sig": sig, "items": (i for i in range(2)), "x": (1, None)}) == {
+        "sig": "(a)",
+        "items": [0, 1],
+        "x": [1, None],
+    }
+
+
+def test_write_and_read_model(tmp_path):
+    path = tmp_path / "GLib-2.0.jsonl.gz"
+
+    with ModelWriter(path) as model:
+        model.add("constants.rst", "constants.j2", {"constants": ()})
+
+    (page,) = read_model(path)
+
+    assert page.page == "constants.rst"
+    assert page.template == "constants.j2"
+    assert page.arguments == {"constants": []}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_model_is_not_replaced_on_error(tmp_path):
+    path = tmp_path / "GLib-2.0.jsonl.gz"
+
+    try:
+        with ModelWriter(path) as model:
+            model.add("constants.rst", "constants.j2", {"constants": ()})
+            raise RuntimeError()
+    except RuntimeError:
+        pass
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_render_model_like_direct_render(tmp_path):
+    arguments = {
+        "constants": [("MAJOR", 2, "The major version.", ("2.4", "Gone."), "2.0")],
+        "namespace": "GLib",
+        "version": "2.0",
+    }
+    path = tmp_path / "GLib-2.0.jsonl.gz"
+    with ModelWriter(path) as model:
+        model.add("constants.rst", "constants.j2", arguments)
+
+    render_to_file("constants.j2", tmp_path / "direct.rst", **arguments)
+    pages = render_model(path, tmp_path / "GLib-2.0")
+
+    assert pages == 1
+    assert (tmp_path / "GLib-2.0" / "constants.rst").read_text() == (
+        tmp_path / "direct.rst"
+    ).read_text()
+
+
+def test_enum_values_render_like_direct_render(tmp_path):
+    arguments = {
+        "constants": [("APPEND", Flags(1), "", None, None)],
+        "namespace": "GLib",
+        "version": "2.0",
+    }
+    path = tmp_path / "GLib-2.0.jsonl.gz"
+    with ModelWriter(path) as model:
+        added = model.add("constants.rst", "constants.j2", arguments)
+
+    render_to_file("constants.j2", tmp_path / "direct.rst", **arguments)
+    render_model(path, tmp_path / "GLib-2.0")
+    ((_, value, *_),) = next(read_model(path)).arguments["constants"]
+
+    assert value == 1
+    assert repr(value) == "GLib.IOFlags.APPEND"
+    assert added.arguments == next(read_model(path)).arguments
+    assert "G_IO_FLAG_APPEND" in (tmp_path / "direct.rst").read_text()
+    assert (tmp_path / "GLib-2.0" / "constants.rst").read_text() == (
+        tmp_path / "direct.rst"
+    ).read_text()
+
+
+def test_render_model_removes_stale_pages(tmp_path):
+    path = tmp_path / "GLib-2.0.jsonl.gz"
+    out_path = tmp_path / "GLib-2.0"
+    (out_path / "class-Gone").mkdir(parents=True)
+    (out_path / "class-Gone.rst").write_text("")
+    (out_path / "class-Gone" / "methods.rst").write_text("")
+    with ModelWriter(path) as model:
+        model.add("classes.rst", "classes.j2", {"entity_type": "Classes"})
+
+    pages = render_model(path, out_path)
+
+    assert pages == 1
+    assert sorted(p.name for p in out_path.rglob("*.rst")) == ["classes.rst"]
+
+
+def test_render_models_without_gi(tmp_path):
+    with ModelWriter(tmp_path / "model" / "Foo-1.0.jsonl.gz") as model:
+        model.add("classes.rst", "classes.j2", {"entity_type": "Classes"})
+
+    # Importing a blocked module raises ImportError
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import runpy, sys; sys.modules.update(gi=None, gidocgen=None); "
+            "runpy.run_module('pygobject_docs.model', run_name='__main__')",
+            "--source",
+            str(tmp_path / "source"),
+            str(tmp_path / "model"),
+        ],
+        check=True,
+    )
+
+    assert (tmp_path / "source" / "Foo-1.0" / "classes.rst").exists()
+    assert "Foo-1.0" in (tmp_path / "source" / "index.rst").read_text()
@@ -1,4 +1,4 @@
-from pygobject_docs.generate import order
+from pygobject_docs.render import order
 
 
 def test_order():
@@ -0,0 +1,59 @@
+import pytest
+
+from pygobject_docs import output
+
+
+def test_write_new_file(tmp_path):
+    page = tmp_path / "page.rst"
+
+    assert output.write(page, ["Title\n", "=====\n"])
+    assert page.read_text() == "Title\n=====\n"
+
+
+def test_unchanged_file_is_not_rewritten(tmp_path):
+    page = tmp_path / "page.rst"
+    output.write(page, ["content"])
+    mtime = page.stat().st_mtime_ns
+
+    assert not output.write(page, ["con", "tent"])
+    assert page.stat().st_mtime_ns == mtime
+
+
+def test_changed_file_is_rewritten(tmp_path):
+    page = tmp_path / "page.rst"
+    output.write(page, ["content"])
+
+    assert output.write(page, ["other content"])
+    assert page.read_text() == "other content"
+
+
+def test_no_temporary_files_are_left(tmp_path):
+    page = tmp_path / "page.rst"
+    output.write(page, ["content"])
+    output.write(page, ["content"])
+
+    assert list(tmp_path.iterdir()) == [page]
+
+
+def test_failed_write_keeps_existing_file(tmp_path):
+    page = tmp_path / "page.rst"
+    output.write(page, ["content"])
+
+    def chunks():
+        yield "partial"
+        raise ValueError("Unknown tag")
+
+    with pytest.raises(ValueError):
+        output.write(page, chunks())
+
+    assert page.read_text() == "content"
+    assert list(tmp_path.iterdir()) == [page]
+
+
+def test_counts(tmp_path):
+    output.counts.clear()
+
+    output.write(tmp_path / "a.rst", ["a"])
+    output.write(tmp_path / "a.rst", ["a"])
+
+    assert output.counts == {"written": 1, "unchanged": 1}
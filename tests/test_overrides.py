@@ -0,0 +1,26 @@
+from pygobject_docs.overrides import load_overrides, lookup
+
+
+def test_lookup_function_override():
+    override = lookup(("gi._gi", "GObject", "connect"))
+
+    assert override
+    assert "detailed_signal" in override.signature.parameters
+    assert ":param detailed_signal:" in override.docstring
+
+
+def test_lookup_class_override():
+    override = lookup(("gi.repository.GLib", None, "Error"))
+
+    assert override
+    assert override.signature is None
+    assert "attribute::" in override.docstring
+
+
+def test_lookup_unknown_key():
+    assert lookup(("gi._gi", "GObject", "no_such_method")) is None
+    assert lookup(None) is None
+
+
+def test_load_overrides_without_override_module():
+    load_overrides("NoSuchNamespace")
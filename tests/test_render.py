@@ -0,0 +1,69 @@
+from pygobject_docs.render import create_environment, jinja_env, render_to_file
+
+
+def test_jinja_env_is_long_lived():
+    assert jinja_env() is jinja_env()
+    assert not jinja_env().auto_reload
+
+
+def test_templates_are_compiled_once():
+    env = jinja_env()
+
+    assert env.get_template("class-detail.j2") is env.get_template("class-detail.j2")
+
+
+def test_bytecode_cache(tmp_path):
+    create_environment(tmp_path).get_template("functions.j2")
+
+    assert list(tmp_path.iterdir())
+
+
+def test_render_to_file_from_generator(tmp_path):
+    page = tmp_path / "constants.rst"
+
+    render_to_file(
+        "constants.j2",
+        page,
+        constants=((f"CONST_{i}", i, f"Constant {i}.", None, None) for i in range(3)),
+        namespace="GLib",
+        version="2.0",
+    )
+
+    text = page.read_text()
+    assert ".. data:: CONST_0" in text
+    assert ".. data:: CONST_2" in text
+
+
+def test_render_undocumented_constants_from_generator(tmp_path):
+    page = tmp_path / "constants.rst"
+
+    render_to_file(
+        "constants.j2",
+        page,
+        constants=((f"CONST_{i}", i, "", None, None) for i in range(3)),
+        namespace="GLib",
+        version="2.0",
+    )
+
+    text = page.read_text()
+    assert text.count(".. value-table::") == 1
+    assert "   CONST_2 2\n" in text
+
+
+def test_render_split_class_section(tmp_path):
+    page = tmp_path / "class-Widget.rst"
+
+    render_to_file(
+        "class-detail.j2",
+        page,
+        class_name="Widget",
+        namespace="Gtk",
+        version="4.0",
+        methods=[],
+        split={"methods": ("class-Widget/methods", 200)},
+    )
+
+    text = page.read_text()
+    assert "Methods\n-------" in text
+    assert "   200 methods <class-Widget/methods>" in text
+    assert ".. method::" not in text
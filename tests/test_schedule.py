@@ -0,0 +1,96 @@
+import pytest
+
+from pygobject_docs.schedule import Costs, dependency_order, longest_first, makespan
+
+
+DEPENDENCIES = {
+    "Gtk-4.0": ["Gdk-4.0", "GObject-2.0"],
+    "Gdk-4.0": ["GObject-2.0"],
+    "GObject-2.0": ["GLib-2.0"],
+    "GLib-2.0": [],
+    "GModule-2.0": ["GLib-2.0"],
+}
+
+
+def test_dependencies_come_first():
+    libraries = ["Gtk-4.0", "GModule-2.0", "GObject-2.0", "GLib-2.0", "Gdk-4.0"]
+
+    order = dependency_order(libraries, DEPENDENCIES.__getitem__)
+
+    assert order == ["GLib-2.0", "GObject-2.0", "Gdk-4.0", "Gtk-4.0", "GModule-2.0"]
+
+
+def test_dependencies_not_requested_are_not_returned():
+    order = dependency_order(["GModule-2.0", "Gtk-4.0"], DEPENDENCIES.__getitem__)
+
+    assert order == ["GModule-2.0", "Gtk-4.0"]
+
+
+def test_cyclic_dependencies():
+    deps = {"A-1": ["B-1"], "B-1": ["A-1"]}
+
+    assert sorted(dependency_order(["A-1", "B-1"], deps.__getitem__)) == ["A-1", "B-1"]
+
+
+@pytest.fixture
+def costs(tmp_path):
+    costs = Costs(tmp_path / "costs.json")
+    costs.update("Gtk-4.0", 10.0)
+    costs.update("GLib-2.0", 4.0)
+    costs.update("GModule-2.0", 1.0)
+    return costs
+
+
+def test_costs_persisted(tmp_path, costs):
+    costs.save()
+
+    assert Costs(tmp_path / "costs.json").estimate("Gtk-4.0") == 10.0
+
+
+def test_unknown_library_estimated_from_known(costs):
+    assert costs.estimate("Gst-1.0") == 4.0
+
+
+def test_longest_first(costs):
+    assert longest_first(["GModule-2.0", "GLib-2.0", "Gtk-4.0"], costs) == [
+        "Gtk-4.0",
+        "GLib-2.0",
+        "GModule-2.0",
+    ]
+
+
+def test_longest_first_after_dependencies(costs):
+    libraries = ["GLib-2.0", "GObject-2.0", "Gdk-4.0", "Gtk-4.0", "GModule-2.0"]
+
+    order = longest_first(libraries, costs, DEPENDENCIES.__getitem__)
+
+    assert order == ["GLib-2.0", "GObject-2.0", "Gdk-4.0", "Gtk-4.0", "GModule-2.0"]
+
+
+def test_longest_first_follows_dependencies_not_requested(costs):
+    order = longest_first(["GLib-2.0", "Gtk-4.0"], costs, DEPENDENCIES.__getitem__)
+
+    assert order == ["GLib-2.0", "Gtk-4.0"]
+
+
+def test_longest_first_ties_keep_dependency_order(tmp_path):
+    libraries = ["GLib-2.0", "GObject-2.0", "GModule-2.0"]
+
+    assert longest_first(libraries, Costs(tmp_path / "costs.json")) == libraries
+
+
+def test_costs_per_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr("pygobject_docs.schedule.cache_dir", lambda: tmp_path)
+    full = Costs(mode="full")
+    full.update("Gtk-4.0", 10.0)
+    full.save()
+
+    assert Costs(mode="incremental").estimate("Gtk-4.0") != 10.0
+    assert Costs(mode="full").estimate("Gtk-4.0") == 10.0
+
+
+def test_makespan(costs):
+    libraries = ["Gtk-4.0", "GLib-2.0", "GModule-2.0"]
+
+    assert makespan(libraries, costs) == 15.0
+    assert makespan(libraries, costs, workers=2) == 10.0
@@ -0,0 +1,77 @@
+from pygobject_docs.model import ModelWriter
+from pygobject_docs.validate import (
+    Reference,
+    model_pages,
+    page_references,
+    source_pages,
+    validate,
+)
+
+PAGE = """\
+.. currentmodule:: gi.repository.Foo
+
+.. class:: Widget
+
+.. class:: Widget
+   :no-index:
+
+   .. method:: add(self, child: ~gi.repository.Foo.Child) -> ~gi.repository.Foo.Widget
+
+      Adds a :class:`~gi.repository.Foo.Widget`, see :obj:`int`.
+
+   .. attribute:: props.parent
+      :type: ~gi.repository.Foo.Parent
+"""
+
+
+def test_page_references():
+    references = list(page_references(PAGE.splitlines()))
+
+    assert references == [
+        (8, "gi.repository.Foo.Child"),
+        (8, "gi.repository.Foo.Widget"),
+        (10, "gi.repository.Foo.Widget"),
+        (13, "gi.repository.Foo.Parent"),
+    ]
+
+
+def test_validate_source(tmp_path):
+    (tmp_path / "Foo-1.0").mkdir()
+    (tmp_path / "Foo-1.0" / "class-Widget.rst").write_text(PAGE)
+    (tmp_path / "Bar-1.0").mkdir()
+    (tmp_path / "Bar-1.0" / "index.rst").write_text(
+        ":class:`~gi.repository.Foo.Parent` and\n"
+        ":link:`~gi.repository.Foo.Widget <class:Foo-1.0/class-Widget>`\n"
+    )
+
+    unresolved, checked = validate(source_pages(tmp_path))
+    bar_unresolved, bar_checked = validate(source_pages(tmp_path), ["Bar-1.0"])
+
+    assert checked == 6
+    assert unresolved == [
+        Reference("Bar-1.0/index.rst", 1, "gi.repository.Foo.Parent"),
+        Reference("Foo-1.0/class-Widget.rst", 8, "gi.repository.Foo.Child"),
+        Reference("Foo-1.0/class-Widget.rst", 13, "gi.repository.Foo.Parent"),
+    ]
+    assert bar_checked == 2
+    assert bar_unresolved == unresolved[:1]
+
+
+def test_validate_model(tmp_path):
+    with ModelWriter(tmp_path / "Foo-1.0.jsonl.gz") as model:
+        model.add(
+            "constants.rst",
+            "constants.j2",
+            {
+                "namespace": "Foo",
+                "constants": [
+                    ("ONE", 1, "Unlike :const:`~gi.repository.Foo.TWO`.", None, None),
+                    ("THREE", 3, "Like :const:`~gi.repository.Foo.ONE`.", None, None),
+                ],
+            },
+        )
+
+    unresolved, checked = validate(model_pages(tmp_path))
+
+    assert checked == 2
+    assert [reference.target for reference in unresolved] == ["gi.repository.Foo.TWO"]
@@ -0,0 +1,100 @@
+import logging
+import time
+from collections import Counter
+
+from pygobject_docs import workers
+from pygobject_docs.workers import rss, run
+
+
+def succeed(task):
+    logging.getLogger("test_workers").warning("Working on %s", task[0])
+    return Counter(written=task[1])
+
+
+def inform(task):
+    logging.getLogger("test_workers").info("Informing on %s", task[0])
+    return Counter()
+
+
+def fail(task):
+    raise ValueError(task[0])
+
+
+def sleep(task):
+    time.sleep(30)
+
+
+def nap(task):
+    time.sleep(task[1])
+    return Counter()
+
+
+def grow(task):
+    data = bytearray(200 * 1024 * 1024)
+    data[::4096] = b"x" * len(data[::4096])
+    time.sleep(30)
+
+
+def test_rss_of_own_process():
+    import os
+
+    assert rss(os.getpid()) > 0
+
+
+def test_run_tasks():
+    results = list(run(succeed, [("A-1", 1), ("B-1", 2), ("C-1", 3)], jobs=2))
+
+    assert sorted(r.lib for r in results) == ["A-1", "B-1", "C-1"]
+    assert all(r.error is None for r in results)
+    assert sum((r.counts for r in results), Counter()) == Counter(written=6)
+    assert all(r.peak_rss > 0 for r in results)
+
+
+def test_logs_are_passed_to_parent(caplog):
+    with caplog.at_level(logging.WARNING):
+        list(run(succeed, [("A-1", 1)]))
+
+    assert "Working on A-1" in caplog.text
+
+
+def test_info_logs_are_passed_to_parent(caplog):
+    with caplog.at_level(logging.INFO):
+        list(run(inform, [("A-1",)]))
+
+    assert "Informing on A-1" in caplog.text
+
+
+def test_failure_is_reported():
+    (result,) = run(fail, [("A-1",)])
+
+    assert result.error == "ValueError: A-1"
+
+
+def test_timeout():
+    (result,) = run(sleep, [("A-1",)], timeout=0.5)
+
+    assert result.error.startswith("Timed out")
+
+
+def test_result_of_timed_out_worker_is_dropped(monkeypatch):
+    start = time.perf_counter()
+
+    def slow_rss(pid):
+        # Once it is past its time, the worker puts its result while it is
+        # checked, and it is stopped for the time it took before
+        if time.perf_counter() - start > 1:
+            time.sleep(1.5)
+        return 0
+
+    monkeypatch.setattr(workers, "rss", slow_rss)
+
+    results = {r.lib: r for r in run(nap, [("A-1", 1.5), ("B-1", 0)], timeout=1)}
+
+    assert results["A-1"].error.startswith("Timed out")
+    assert results["B-1"].error is None
+
+
+def test_memory_limit():
+    (result,) = run(grow, [("A-1",)], max_rss=100 * 1024)
+
+    assert result.error.startswith("Memory limit exceeded")